@@ -1,7 +1,7 @@
 from datetime import datetime
-from typing import Optional, List
+from typing import Iterable, Optional, List, Set
 
-from domain.feed.enums.feed_status import FeedStatus
+from src.domain.feed.enums.feed_status import FeedStatus
 from src.domain.feed.value_objects.feed_url import FeedUrl
 from src.seedwork.domain.base import Entity
 from src.domain.feed.entities.feed_item import FeedItem
@@ -18,6 +18,13 @@ class Feed(Entity):
         description: Optional[str] = None,
         last_fetched: Optional[datetime] = None,
         status: FeedStatus = FeedStatus.ACTIVE,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        content_hash: Optional[str] = None,
+        content_length: Optional[int] = None,
+        high_water_mark: Optional[datetime] = None,
+        content_version: int = 0,
+        undated_guids: Optional[Set[str]] = None,
     ):
         super().__init__(entity_id=feed_source_id)
         self.name = name
@@ -25,14 +32,56 @@ class Feed(Entity):
         self.description = description
         self.last_fetched = last_fetched
         self.status = status
+        self.etag = etag
+        self.last_modified = last_modified
+        self.content_hash = content_hash
+        self.content_length = content_length
+        self.high_water_mark = high_water_mark
+        self.content_version = content_version
+        self.undated_guids = undated_guids or set()
         self._items: List["FeedItem"] = []
 
     def add_item(self, item: "FeedItem"):
         self._items.append(item)
+        self.content_version += 1
 
     def update_last_fetched(self):
         self.last_fetched = datetime.now()
 
+    def update_validators(
+        self,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        content_hash: Optional[str],
+        content_length: Optional[int],
+    ) -> None:
+        """Store the cache validators of the last fetched document."""
+        self.etag = etag
+        self.last_modified = last_modified
+        self.content_hash = content_hash
+        self.content_length = content_length
+
+    def advance_high_water_mark(self, published_date: datetime) -> None:
+        """Remember the newest item date seen, to stop parsing there."""
+        if (
+            self.high_water_mark is None
+            or published_date > self.high_water_mark
+        ):
+            self.high_water_mark = published_date
+
+    def remember_undated_guids(
+        self, guids: Iterable[str], complete: bool
+    ) -> None:
+        """
+        Remember the guids of the items without a date, which the
+        high-water mark cannot filter. A complete parse replaces them, so
+        items that left the document are forgotten.
+        """
+        if complete:
+            self.undated_guids = set(guids)
+        else:
+            self.undated_guids.update(guids)
+
     @property
     def items(self) -> List["FeedItem"]:
         return self._items.copy()
@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+from src.domain.feed.entities.feed_item import FeedItem
+
+
+class FeedItemRepository(ABC):
+    """Repository interface for fetched FeedItem entities."""
+
+    @abstractmethod
+    async def add_many(
+        self, items: List[FeedItem], update_existing: bool = False
+    ) -> int:
+        """
+        Store a batch of items keyed by guid. Items whose guid is already
+        stored are skipped, or overwritten with `update_existing`.
+        Returns the number of rows written.
+        """
+        pass
+
+    @abstractmethod
+    async def recent(self, limit: int) -> List[FeedItem]:
+        """Return the `limit` most recently published items, newest first."""
+        pass
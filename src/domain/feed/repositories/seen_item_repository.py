@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, List
+
+
+class SeenItemRepository(ABC):
+    """Repository interface for the identity keys of already seen items."""
+
+    @abstractmethod
+    async def contains(self, key: str) -> bool:
+        """Check if a key was already seen."""
+        pass
+
+    @abstractmethod
+    async def add_many(self, keys: List[str]) -> None:
+        """Record keys as seen, ignoring the ones already stored."""
+        pass
+
+    @abstractmethod
+    def all_keys(self) -> AsyncIterator[str]:
+        """Iterate over every stored key."""
+        pass
@@ -0,0 +1,79 @@
+import hashlib
+import re
+from typing import List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from src.domain.feed.entities.feed_item import FeedItem
+
+SIMHASH_BITS = 64
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+_TRACKING_PARAMS = ("utm_", "fbclid", "gclid")
+
+
+def normalize_link(link: str) -> Optional[str]:
+    """
+    Normalize a link so the same article shared through different feeds
+    compares equal: lowercase host, no fragment, no tracking parameters,
+    sorted query and no trailing slash.
+    """
+    if not link:
+        return None
+    parts = urlsplit(link.strip())
+    host = parts.netloc.lower().removeprefix("www.")
+    query = urlencode(
+        sorted(
+            (key, value)
+            for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if not key.lower().startswith(_TRACKING_PARAMS)
+        )
+    )
+    path = parts.path.rstrip("/")
+    return urlunsplit((parts.scheme.lower(), host, path, query, ""))
+
+
+def content_hash(item: FeedItem) -> str:
+    text = f"{item.title or ''}\x00{item.content or ''}"
+    return hashlib.sha1(text.encode()).hexdigest()
+
+
+def item_keys(item: FeedItem) -> List[str]:
+    """
+    Identity keys of an item. An item with a guid is identified by it
+    alone, since feeds reuse links (e.g. a homepage) and titles across
+    distinct items; without a guid, its normalized link and content hash
+    identify it.
+    """
+    if item.guid:
+        return [f"guid:{item.guid}"]
+    keys = []
+    link = normalize_link(item.link)
+    if link:
+        keys.append(f"link:{link}")
+    keys.append(f"hash:{content_hash(item)}")
+    return keys
+
+
+def simhash(text: str) -> int:
+    """64-bit SimHash of the word tokens of a text."""
+    weights = [0] * SIMHASH_BITS
+    for token in _TOKEN_PATTERN.findall(text.lower()):
+        value = int.from_bytes(
+            hashlib.blake2b(token.encode(), digest_size=8).digest(), "big"
+        )
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += 1 if value >> bit & 1 else -1
+
+    fingerprint = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def item_simhash(item: FeedItem) -> int:
+    return simhash(f"{item.title or ''} {item.content or ''}")
+
+
+def hamming_distance(left: int, right: int) -> int:
+    return (left ^ right).bit_count()
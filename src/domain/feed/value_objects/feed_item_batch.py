@@ -0,0 +1,129 @@
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from src.domain.feed.entities.feed_item import FeedItem
+from src.seedwork.domain.base import ValueObject
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+DEFAULT_BATCH_FIELDS = (
+    "title",
+    "content",
+    "link",
+    "published_date",
+    "author",
+    "guid",
+    "tags",
+)
+
+
+class _Missing:
+    def __repr__(self) -> str:
+        return "MISSING"
+
+
+MISSING = _Missing()
+
+# Longer strings stay in lists: NumPy stores them at a fixed width.
+MAX_ARRAY_STRING_LENGTH = 1024
+
+
+def to_datetime64(value: datetime) -> Any:
+    """UTC `datetime64[us]` of an aware datetime."""
+    if value.tzinfo is None:
+        raise TypeError(
+            "can't compare offset-naive and offset-aware datetimes"
+        )
+    naive = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return numpy.datetime64(naive, "us")
+
+
+def typed_column(cells: List[Any]) -> Sequence[Any]:
+    """
+    NumPy array of a column whose cells are all numbers, aware datetimes
+    or short strings, when NumPy is installed; the list itself otherwise
+    (e.g. with MISSING or None cells).
+    """
+    if numpy is None or not cells:
+        return cells
+    kind = type(cells[0])
+    if kind in (int, float):
+        if all(type(cell) in (int, float) for cell in cells):
+            return numpy.array(cells)
+    elif kind is datetime:
+        if all(
+            type(cell) is datetime and cell.tzinfo is not None
+            for cell in cells
+        ):
+            return numpy.array(
+                [to_datetime64(cell) for cell in cells],
+                dtype="datetime64[us]",
+            )
+    elif kind is str:
+        if all(
+            type(cell) is str and len(cell) <= MAX_ARRAY_STRING_LENGTH
+            for cell in cells
+        ):
+            return numpy.array(cells, dtype=str)
+    return cells
+
+
+@dataclass(frozen=True)
+class FeedItemBatch(ValueObject):
+    """
+    Value Object representing feed items in columnar form, one sequence
+    per field. Columns may be lists or array-likes such as NumPy arrays;
+    `from_items` and `from_dicts` build typed arrays for number, date and
+    short string columns when NumPy is installed. Items lacking a field
+    hold `MISSING` in its column, so that absent fields stay distinct
+    from None values.
+    """
+
+    columns: Dict[str, Sequence[Any]]
+
+    def _validate(self):
+        sizes = {len(column) for column in self.columns.values()}
+        if len(sizes) > 1:
+            raise ValueError(
+                f"Batch columns must have the same length, got {sizes}"
+            )
+
+    def __len__(self) -> int:
+        for column in self.columns.values():
+            return len(column)
+        return 0
+
+    def column(self, field: str) -> Optional[Sequence[Any]]:
+        return self.columns.get(field)
+
+    @classmethod
+    def from_items(
+        cls,
+        items: Iterable[FeedItem],
+        fields: Sequence[str] = DEFAULT_BATCH_FIELDS,
+    ) -> "FeedItemBatch":
+        items = list(items)
+        return cls(
+            {
+                field: typed_column([getattr(item, field) for item in items])
+                for field in fields
+            }
+        )
+
+    @classmethod
+    def from_dicts(
+        cls, items: Iterable[Dict[str, Any]], fields: Sequence[str]
+    ) -> "FeedItemBatch":
+        items = list(items)
+        return cls(
+            {
+                field: typed_column(
+                    [item.get(field, MISSING) for item in items]
+                )
+                for field in fields
+            }
+        )
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from src.domain.rule.entities.rule import Rule
 from src.seedwork.domain.base import Entity
@@ -51,3 +51,13 @@ class Mixer(Entity):
     def rules(self) -> List["Rule"]:
         """Get all rules for this mixer."""
         return self._rules.copy()
+
+    @property
+    def feeds_version(self) -> Tuple:
+        """Hashable version of the feeds' content."""
+        return tuple((feed.id, feed.content_version) for feed in self._feeds)
+
+    @property
+    def rules_version(self) -> Tuple:
+        """Hashable version of the rule set, derived from its content."""
+        return tuple((rule.id, rule.version) for rule in self._rules)
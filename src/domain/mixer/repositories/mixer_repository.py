@@ -34,6 +34,12 @@ class MixerRepository(ABC):
         pass
 
     @abstractmethod
-    def generate_mixed_feed(self, mixer_id: str) -> List[FeedItem]:
-        """Generate a mixed feed by applying rules to feed items."""
+    def generate_mixed_feed(
+        self, mixer_id: str, page: int = 1, page_size: int = 20
+    ) -> List[FeedItem]:
+        """
+        Generate a page of the mixed feed by applying rules to feed items.
+        Implementations should merge the already date-ordered feeds with
+        `merge_feed_items` and stop at the page with `take_page`.
+        """
         pass
@@ -0,0 +1,31 @@
+import heapq
+from itertools import islice
+from operator import attrgetter
+from typing import Iterable, Iterator, List
+
+from src.domain.feed.entities.feed_item import FeedItem
+
+_by_published_date = attrgetter("published_date")
+
+
+def merge_feed_items(
+    sources: Iterable[Iterable[FeedItem]], newest_first: bool = True
+) -> Iterator[FeedItem]:
+    """
+    Lazily k-way merge per-feed item sequences into one date ordered
+    stream. Every source must already be ordered by `published_date` in
+    the requested direction; each yielded item costs O(log k).
+    """
+    return heapq.merge(*sources, key=_by_published_date, reverse=newest_first)
+
+
+def take_page(
+    items: Iterable[FeedItem], page: int, page_size: int
+) -> List[FeedItem]:
+    """Consume only as many items as needed to build the given page."""
+    if page < 1 or page_size < 1:
+        raise ValueError(
+            f"Invalid page {page} of size {page_size}: both must be >= 1"
+        )
+    start = (page - 1) * page_size
+    return list(islice(items, start, start + page_size))
@@ -0,0 +1,164 @@
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Iterable, List, Optional
+
+from src.domain.feed.entities.feed import Feed
+from src.domain.feed.entities.feed_item import FeedItem
+from src.domain.mixer.entities.mixer import Mixer
+from src.domain.rule.services.rule_compiler import RuleCompiler, rule_compiler
+
+Item = Dict[str, Any]
+
+
+def _published_date(item: Item):
+    return item.get("published_date")
+
+
+def _insert_newest_first(items: List[Item], item: Item) -> None:
+    """Binary-search insert into a list ordered by descending date."""
+    date = _published_date(item)
+    low, high = 0, len(items)
+    while low < high:
+        middle = (low + high) // 2
+        if _published_date(items[middle]) >= date:
+            low = middle + 1
+        else:
+            high = middle
+    items.insert(low, item)
+
+
+@dataclass
+class MixedFeedState:
+    """Previously computed output of a mixer."""
+
+    mixer: Mixer
+    rules_version: Hashable
+    feeds_version: Hashable
+    items: List[Item]
+
+
+class IncrementalMixer:
+    """
+    Keeps each mixer's computed output and folds newly fetched items
+    into it, running the compiled rules over the delta only.
+
+    FILTER, TRANSFORM and TAG rules are stateless per item, so their
+    output for old items cannot change when new items arrive. A rule-set
+    change, feed content the state does not account for, or a SORT/GROUP
+    rule makes the mixer fall back to a full recompute.
+    """
+
+    def __init__(self, compiler: RuleCompiler = rule_compiler):
+        self.compiler = compiler
+        self._states: Dict[str, MixedFeedState] = {}
+        self.full_recomputes = 0
+        self.incremental_updates = 0
+
+    @staticmethod
+    def _as_items(feed_items: Iterable[FeedItem]) -> Iterable[Item]:
+        return (vars(feed_item).copy() for feed_item in feed_items)
+
+    def recompute(self, mixer: Mixer) -> List[Item]:
+        """Run the rules over every item of the mixer's feeds."""
+        compiled = self.compiler.compile_mixer(mixer)
+        items = list(
+            compiled.run(
+                self._as_items(
+                    item for feed in mixer.feeds for item in feed.items
+                ),
+                owned=True,
+            )
+        )
+        items.sort(key=_published_date, reverse=True)
+        self.full_recomputes += 1
+
+        if compiled.has_stateful_rules:
+            self._states.pop(mixer.id, None)
+        else:
+            self._states[mixer.id] = MixedFeedState(
+                mixer=mixer,
+                rules_version=mixer.rules_version,
+                feeds_version=mixer.feeds_version,
+                items=items,
+            )
+        return items
+
+    def _state_for(self, mixer: Mixer) -> Optional[MixedFeedState]:
+        state = self._states.get(mixer.id)
+        if (
+            state is None
+            or state.rules_version != mixer.rules_version
+            or state.feeds_version != mixer.feeds_version
+        ):
+            return None
+        return state
+
+    @staticmethod
+    def _accounts_for(
+        state: MixedFeedState, mixer: Mixer, new_items: List[FeedItem]
+    ) -> bool:
+        """
+        Check that the new items are exactly what the mixer's feeds gained
+        since the state was computed: each added item bumps its feed's
+        content version by one.
+        """
+        added = Counter(item.feed_source_id for item in new_items)
+        previous = dict(state.feeds_version)
+        current = dict(mixer.feeds_version)
+        if previous.keys() != current.keys():
+            return False
+        if any(feed_id not in current for feed_id in added):
+            return False
+        return all(
+            current[feed_id] == version + added[feed_id]
+            for feed_id, version in previous.items()
+        )
+
+    def update(
+        self, mixer: Mixer, new_items: Iterable[FeedItem]
+    ) -> List[Item]:
+        """
+        Fold newly fetched items into the mixer's output. The new items
+        must already be added to the mixer's feeds; if the feeds changed
+        in any other way, the output is recomputed in full.
+        """
+        new_items = list(new_items)
+        state = self._states.get(mixer.id)
+        if (
+            state is None
+            or state.rules_version != mixer.rules_version
+            or not self._accounts_for(state, mixer, new_items)
+        ):
+            return self.recompute(mixer)
+
+        compiled = self.compiler.compile_mixer(mixer)
+        for item in compiled.run(self._as_items(new_items), owned=True):
+            _insert_newest_first(state.items, item)
+        state.feeds_version = mixer.feeds_version
+        self.incremental_updates += 1
+        return state.items
+
+    def update_feed(self, feed: Feed, new_items: Iterable[FeedItem]) -> int:
+        """
+        Fold the new items of a refreshed feed into every tracked mixer
+        including it, returning how many mixers were updated.
+        """
+        new_items = list(new_items)
+        mixers = [
+            state.mixer
+            for state in self._states.values()
+            if feed in state.mixer.feeds
+        ]
+        for mixer in mixers:
+            self.update(mixer, new_items)
+        return len(mixers)
+
+    def output(self, mixer: Mixer) -> List[Item]:
+        """Get the mixer's output, computing it if it is not up to date."""
+        state = self._state_for(mixer)
+        if state is None:
+            return self.recompute(mixer)
+        return state.items
+
+    def forget(self, mixer_id: str) -> None:
+        self._states.pop(mixer_id, None)
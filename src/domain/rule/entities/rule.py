@@ -1,6 +1,9 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Hashable, List, Optional
 
+from src.domain.feed.value_objects.feed_item_batch import FeedItemBatch
+from src.domain.rule.enums.logic_operator import LogicOperator
 from src.domain.rule.enums.rule_type import RuleType
+from src.domain.rule.services.mask import Mask, mask_and, mask_or
 from src.domain.rule.value_objects.rule_condition import RuleCondition
 from src.domain.rule.value_objects.rule_transformation import (
     RuleTransformation,
@@ -8,6 +11,17 @@ from src.domain.rule.value_objects.rule_transformation import (
 from src.seedwork.domain.base import Entity
 
 
+def _frozen(value: Any) -> Hashable:
+    """Hashable copy of a condition or transformation value."""
+    if isinstance(value, dict):
+        return frozenset((key, _frozen(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_frozen(item) for item in value)
+    if isinstance(value, set):
+        return frozenset(_frozen(item) for item in value)
+    return value
+
+
 class Rule(Entity):
     """Entity representing a transformation or filtering rule."""
 
@@ -29,6 +43,26 @@ class Rule(Entity):
         self.transformations = transformations or []
         self.priority = priority
 
+    @property
+    def version(self) -> Hashable:
+        """
+        Hashable key of what the rule does, derived from its content, so
+        two rule objects with the same id and different conditions never
+        share compiled or cached results, however they were edited.
+        """
+        return (
+            self.rule_type,
+            self.priority,
+            tuple(
+                (c.field, c.operator, _frozen(c.value), c.logic)
+                for c in self.conditions
+            ),
+            tuple(
+                (t.field, t.type, _frozen(t.value), t.custom_function)
+                for t in self.transformations
+            ),
+        )
+
     def add_condition(self, condition: RuleCondition) -> None:
         """Add a condition to this rule."""
         self.conditions.append(condition)
@@ -37,12 +71,53 @@ class Rule(Entity):
         """Add a transformation to this rule."""
         self.transformations.append(transformation)
 
+    def condition_groups(self) -> List[List[RuleCondition]]:
+        """
+        Split the conditions into OR-separated groups of AND-ed conditions.
+
+        The `logic` of a condition tells how it joins the previous one, so
+        `a AND b OR c` is evaluated as `(a AND b) OR c`.
+        """
+        groups: List[List[RuleCondition]] = []
+        for condition in self.conditions:
+            if not groups or condition.logic == LogicOperator.OR:
+                groups.append([condition])
+            else:
+                groups[-1].append(condition)
+        return groups
+
     def matches(self, item: Dict[str, Any]) -> bool:
-        """Check if the item matches all conditions of this rule."""
+        """Check if the item matches the conditions of this rule."""
         if not self.conditions:
             return True
 
-        return all(condition.evaluate(item) for condition in self.conditions)
+        return any(
+            all(condition.evaluate(item) for condition in group)
+            for group in self.condition_groups()
+        )
+
+    def matches_batch(self, batch: FeedItemBatch) -> Mask:
+        """
+        Check which items of a columnar batch match the conditions of this
+        rule, returning one boolean per item.
+        """
+        if not self.conditions:
+            return [True] * len(batch)
+
+        result = None
+        for group in self.condition_groups():
+            group_mask = None
+            for condition in group:
+                mask = condition.evaluate_batch(batch)
+                group_mask = (
+                    mask if group_mask is None else mask_and(group_mask, mask)
+                )
+                if not any(group_mask):
+                    break
+            result = (
+                group_mask if result is None else mask_or(result, group_mask)
+            )
+        return result
 
     def apply(self, item: Dict[str, Any]) -> Dict[str, Any]:
         """Apply all transformations of this rule to the item."""
@@ -50,7 +125,10 @@ class Rule(Entity):
             return item
 
         result = item.copy()
-        for transformation in self.transformations:
-            result = transformation.apply(result)
-
+        self.apply_in_place(result)
         return result
+
+    def apply_in_place(self, item: Dict[str, Any]) -> None:
+        """Apply all transformations of this rule to an owned item."""
+        for transformation in self.transformations:
+            transformation.apply_in_place(item)
@@ -0,0 +1,21 @@
+from typing import Sequence
+
+Mask = Sequence[bool]
+
+
+def _is_array(mask: Mask) -> bool:
+    return getattr(mask, "dtype", None) is not None
+
+
+def mask_and(left: Mask, right: Mask) -> Mask:
+    """Element-wise AND of two boolean masks."""
+    if _is_array(left) and _is_array(right):
+        return left & right
+    return [a and b for a, b in zip(left, right)]
+
+
+def mask_or(left: Mask, right: Mask) -> Mask:
+    """Element-wise OR of two boolean masks."""
+    if _is_array(left) and _is_array(right):
+        return left | right
+    return [a or b for a, b in zip(left, right)]
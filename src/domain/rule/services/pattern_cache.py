@@ -0,0 +1,44 @@
+import re
+from collections import OrderedDict
+from typing import Dict
+
+
+class PatternCache:
+    """Bounded LRU cache of compiled regex patterns shared by all rules."""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._patterns: OrderedDict[str, re.Pattern] = OrderedDict()
+
+    def get(self, pattern: str) -> re.Pattern:
+        """Get the compiled pattern, compiling it on a miss."""
+        compiled = self._patterns.get(pattern)
+        if compiled is not None:
+            self.hits += 1
+            self._patterns.move_to_end(pattern)
+            return compiled
+
+        self.misses += 1
+        compiled = re.compile(pattern)
+        self._patterns[pattern] = compiled
+        if len(self._patterns) > self.max_entries:
+            self._patterns.popitem(last=False)
+        return compiled
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._patterns),
+            "max_entries": self.max_entries,
+        }
+
+    def clear(self) -> None:
+        self._patterns.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+pattern_cache = PatternCache()
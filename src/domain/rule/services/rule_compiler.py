@@ -0,0 +1,376 @@
+import operator
+import re
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+)
+
+from src.domain.mixer.entities.mixer import Mixer
+from src.domain.rule.entities.rule import Rule
+from src.domain.rule.enums.comparison_operator import ComparisonOperator
+from src.domain.rule.enums.rule_type import RuleType
+from src.domain.rule.enums.transformation_type import TransformationType
+from src.domain.rule.services.pattern_cache import pattern_cache
+from src.domain.rule.value_objects.rule_condition import RuleCondition
+from src.domain.rule.value_objects.rule_transformation import (
+    RuleTransformation,
+)
+
+Item = Dict[str, Any]
+Predicate = Callable[[Item], bool]
+Mutator = Callable[[Item], None]
+
+STATEFUL_RULE_TYPES = frozenset({RuleType.SORT, RuleType.GROUP})
+
+_FOLDABLE_OPERATORS = frozenset(
+    {ComparisonOperator.CONTAINS, ComparisonOperator.REGEX}
+)
+
+_MISSING = object()
+
+_COMPARATORS: Dict[ComparisonOperator, Callable[[Any, Any], bool]] = {
+    ComparisonOperator.EQUALS: operator.eq,
+    ComparisonOperator.NOT_EQUALS: operator.ne,
+    ComparisonOperator.CONTAINS: lambda field_value, value: (
+        value in field_value
+    ),
+    ComparisonOperator.NOT_CONTAINS: lambda field_value, value: (
+        value not in field_value
+    ),
+    ComparisonOperator.GREATER_THAN: operator.gt,
+    ComparisonOperator.LESS_THAN: operator.lt,
+}
+
+
+def _never(item: Item) -> bool:
+    return False
+
+
+def _compile_condition(condition: RuleCondition) -> Predicate:
+    """Resolve the operator of a condition once into a closure."""
+    field = condition.field
+    value = condition.value
+
+    if condition.operator == ComparisonOperator.REGEX:
+        search = condition.pattern.search
+
+        def predicate(item: Item) -> bool:
+            field_value = item.get(field, _MISSING)
+            if field_value is _MISSING:
+                return False
+            return search(str(field_value)) is not None
+
+        return predicate
+
+    compare = _COMPARATORS.get(condition.operator)
+    if compare is None:
+        return _never
+
+    def predicate(item: Item) -> bool:
+        field_value = item.get(field, _MISSING)
+        if field_value is _MISSING:
+            return False
+        return compare(field_value, value)
+
+    return predicate
+
+
+def _compile_all(predicates: List[Predicate]) -> Predicate:
+    if len(predicates) == 1:
+        return predicates[0]
+
+    def predicate(item: Item) -> bool:
+        for check in predicates:
+            if not check(item):
+                return False
+        return True
+
+    return predicate
+
+
+def _compile_any(predicates: List[Predicate]) -> Predicate:
+    if len(predicates) == 1:
+        return predicates[0]
+
+    def predicate(item: Item) -> bool:
+        for check in predicates:
+            if check(item):
+                return True
+        return False
+
+    return predicate
+
+
+def _alternative_source(condition: RuleCondition) -> Optional[str]:
+    """Regex source of a CONTAINS/REGEX condition, None if not foldable."""
+    if condition.operator == ComparisonOperator.CONTAINS:
+        if not isinstance(condition.value, str):
+            return None
+        return re.escape(condition.value)
+    if condition.pattern.groups:
+        return None
+    return condition.pattern.pattern
+
+
+def _fold_alternatives(
+    field: str, conditions: List[RuleCondition]
+) -> Optional[Predicate]:
+    """
+    Fold OR-ed CONTAINS/REGEX conditions on one field into a single
+    alternation, so string values are scanned once. Non-string values
+    (e.g. tag lists) fall back to the individual conditions.
+    """
+    sources = [_alternative_source(condition) for condition in conditions]
+    if None in sources:
+        return None
+    try:
+        search = pattern_cache.get(
+            "|".join(f"(?:{source})" for source in sources)
+        ).search
+    except re.error:
+        return None
+    fallback = _compile_any([_compile_condition(c) for c in conditions])
+
+    def predicate(item: Item) -> bool:
+        field_value = item.get(field, _MISSING)
+        if field_value is _MISSING:
+            return False
+        if isinstance(field_value, str):
+            return search(field_value) is not None
+        return fallback(item)
+
+    return predicate
+
+
+def compile_predicate(
+    rule: Rule, fold_alternatives: bool = False
+) -> Optional[Predicate]:
+    """
+    Compile the conditions of a rule into a single short-circuiting
+    predicate. Returns None when the rule has no conditions.
+
+    With `fold_alternatives`, OR-ed CONTAINS/REGEX conditions on the same
+    field are folded into one combined matcher.
+    """
+    if not rule.conditions:
+        return None
+
+    groups = rule.condition_groups()
+    predicates: List[Predicate] = []
+
+    if fold_alternatives:
+        by_field: Dict[str, List[RuleCondition]] = {}
+        remaining = []
+        for group in groups:
+            if len(group) == 1 and group[0].operator in _FOLDABLE_OPERATORS:
+                by_field.setdefault(group[0].field, []).append(group[0])
+            else:
+                remaining.append(group)
+        for field, conditions in by_field.items():
+            folded = None
+            if len(conditions) > 1:
+                folded = _fold_alternatives(field, conditions)
+            if folded is None:
+                remaining.extend([condition] for condition in conditions)
+            else:
+                predicates.append(folded)
+        groups = remaining
+
+    predicates.extend(
+        _compile_all([_compile_condition(c) for c in group])
+        for group in groups
+    )
+    return _compile_any(predicates)
+
+
+def _compile_transformation(
+    transformation: RuleTransformation,
+) -> Optional[Mutator]:
+    """Compile a transformation into an in-place mutator."""
+    field = transformation.field
+    value = transformation.value
+
+    if transformation.type == TransformationType.REPLACE:
+
+        def mutate(item: Item) -> None:
+            if field in item:
+                item[field] = value
+
+    elif transformation.type == TransformationType.APPEND:
+        suffix = str(value)
+
+        def mutate(item: Item) -> None:
+            if field in item:
+                item[field] = str(item[field]) + suffix
+            else:
+                item[field] = value
+
+    elif transformation.type == TransformationType.PREPEND:
+        prefix = str(value)
+
+        def mutate(item: Item) -> None:
+            if field in item:
+                item[field] = prefix + str(item[field])
+
+    elif transformation.type == TransformationType.REMOVE:
+
+        def mutate(item: Item) -> None:
+            item.pop(field, None)
+
+    elif (
+        transformation.type == TransformationType.CUSTOM
+        and transformation.custom_function
+    ):
+        function = transformation.custom_function
+
+        def mutate(item: Item) -> None:
+            if field in item:
+                item[field] = function(item[field])
+
+    else:
+        return None
+
+    return mutate
+
+
+def compile_mutator(rule: Rule) -> Optional[Mutator]:
+    """
+    Compile the transformations of a rule into one in-place mutator.
+    Returns None when the rule has nothing to apply.
+    """
+    mutators = [
+        mutate
+        for mutate in map(_compile_transformation, rule.transformations)
+        if mutate is not None
+    ]
+    if not mutators:
+        return None
+    if len(mutators) == 1:
+        return mutators[0]
+
+    def mutate(item: Item) -> None:
+        for step in mutators:
+            step(item)
+
+    return mutate
+
+
+@dataclass(frozen=True)
+class CompiledRule:
+    """A rule with its dispatch resolved ahead of evaluation."""
+
+    is_filter: bool
+    predicate: Optional[Predicate]
+    mutate: Optional[Mutator]
+
+    @classmethod
+    def from_rule(
+        cls, rule: Rule, fold_alternatives: bool = False
+    ) -> "CompiledRule":
+        return cls(
+            is_filter=rule.rule_type == RuleType.FILTER,
+            predicate=compile_predicate(rule, fold_alternatives),
+            mutate=compile_mutator(rule),
+        )
+
+
+class CompiledRuleSet:
+    """
+    Per-item pipeline for a rule set, ordered by descending priority.
+
+    A matching rule applies its transformations; a FILTER rule that does
+    not match drops the item. SORT and GROUP rules work on the whole
+    output, so they are not part of the per-item pipeline and are only
+    reported through `has_stateful_rules`.
+    """
+
+    def __init__(
+        self,
+        rules: Iterable[Rule],
+        version: Hashable = None,
+        fold_alternatives: bool = False,
+    ):
+        ordered = sorted(rules, key=lambda rule: -rule.priority)
+        self.version = version
+        self.has_stateful_rules = any(
+            rule.rule_type in STATEFUL_RULE_TYPES for rule in ordered
+        )
+        self._steps = tuple(
+            CompiledRule.from_rule(rule, fold_alternatives)
+            for rule in ordered
+            if rule.rule_type not in STATEFUL_RULE_TYPES
+        )
+
+    def process(self, item: Item, owned: bool = False) -> Optional[Item]:
+        """
+        Run one item through the pipeline, None if it was filtered.
+
+        The item is copied at most once, on its first transformation, and
+        every later transformation works on that copy. Pass `owned=True`
+        when the caller built the dict for this run and it may be mutated.
+        """
+        for step in self._steps:
+            if step.predicate is not None and not step.predicate(item):
+                if step.is_filter:
+                    return None
+                continue
+            if step.mutate is not None:
+                if not owned:
+                    item = item.copy()
+                    owned = True
+                step.mutate(item)
+        return item
+
+    def run(
+        self, items: Iterable[Item], owned: bool = False
+    ) -> Iterator[Item]:
+        """Run every item through the pipeline, skipping filtered ones."""
+        process = self.process
+        for item in items:
+            result = process(item, owned)
+            if result is not None:
+                yield result
+
+
+class RuleCompiler:
+    """Compiles rule sets once and caches them by rule-set version."""
+
+    def __init__(
+        self, max_entries: int = 256, fold_alternatives: bool = False
+    ):
+        self.max_entries = max_entries
+        self.fold_alternatives = fold_alternatives
+        self._cache: OrderedDict[Hashable, CompiledRuleSet] = OrderedDict()
+
+    def compile(
+        self, rules: Iterable[Rule], version: Hashable
+    ) -> CompiledRuleSet:
+        """Get the compiled form of a rule set, compiling it on a miss."""
+        compiled = self._cache.get(version)
+        if compiled is not None:
+            self._cache.move_to_end(version)
+            return compiled
+
+        compiled = CompiledRuleSet(rules, version, self.fold_alternatives)
+        self._cache[version] = compiled
+        if len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+        return compiled
+
+    def compile_mixer(self, mixer: Mixer) -> CompiledRuleSet:
+        """Get the compiled rule set of a mixer."""
+        return self.compile(mixer.rules, mixer.rules_version)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+
+rule_compiler = RuleCompiler()
@@ -1,9 +1,27 @@
+import re
 from dataclasses import dataclass
-from typing import Any, Dict
+from datetime import datetime
+import operator
+from typing import Any, Dict, Optional
 
+from src.domain.feed.value_objects.feed_item_batch import (
+    MISSING,
+    FeedItemBatch,
+    numpy,
+    to_datetime64,
+)
+from src.domain.rule.services.mask import Mask
 from src.seedwork.domain.base import ValueObject
 from src.domain.rule.enums.logic_operator import LogicOperator
 from src.domain.rule.enums.comparison_operator import ComparisonOperator
+from src.domain.rule.services.pattern_cache import pattern_cache
+
+_VECTORIZED_OPERATORS = {
+    ComparisonOperator.EQUALS: operator.eq,
+    ComparisonOperator.NOT_EQUALS: operator.ne,
+    ComparisonOperator.GREATER_THAN: operator.gt,
+    ComparisonOperator.LESS_THAN: operator.lt,
+}
 
 
 @dataclass(frozen=True)
@@ -15,6 +33,26 @@ class RuleCondition(ValueObject):
     value: Any
     logic: LogicOperator = LogicOperator.AND
 
+    def _validate(self):
+        pattern = None
+        if self.operator == ComparisonOperator.REGEX:
+            if not isinstance(self.value, str):
+                raise ValueError(
+                    f"Regex condition value must be a string: {self.value}"
+                )
+            try:
+                pattern = pattern_cache.get(self.value)
+            except re.error as exp:
+                raise ValueError(
+                    f"Invalid regex pattern: {self.value} >>> {exp}"
+                )
+        object.__setattr__(self, "_pattern", pattern)
+
+    @property
+    def pattern(self) -> Optional[re.Pattern]:
+        """Compiled pattern of a REGEX condition, None otherwise."""
+        return self._pattern
+
     def evaluate(self, item: Dict[str, Any]) -> bool:
         """Evaluate this condition against an item."""
         if self.field not in item:
@@ -35,9 +73,63 @@ class RuleCondition(ValueObject):
         elif self.operator == ComparisonOperator.LESS_THAN:
             return field_value < self.value
         elif self.operator == ComparisonOperator.REGEX:
-            import re
-
-            pattern = re.compile(self.value)
-            return bool(pattern.search(str(field_value)))
+            return bool(self._pattern.search(str(field_value)))
 
         return False
+
+    def evaluate_batch(self, batch: FeedItemBatch) -> Mask:
+        """
+        Evaluate this condition against a columnar batch of items.
+
+        Comparisons on typed array columns (NumPy numbers, dates and
+        strings) and substring tests on string arrays run as a single
+        vectorized operation; other columns are scanned once with the
+        operator resolved up front, with the same semantics as `evaluate`:
+        `MISSING` cells never match and None is compared like any other
+        value.
+        """
+        column = batch.column(self.field)
+        if column is None:
+            return [False] * len(batch)
+
+        value = self.value
+        compare = _VECTORIZED_OPERATORS.get(self.operator)
+        dtype = getattr(column, "dtype", None)
+        if dtype is not None and dtype.kind != "O":
+            if compare is not None:
+                if dtype.kind == "M" and isinstance(value, datetime):
+                    if value.tzinfo is None and self.operator in (
+                        ComparisonOperator.EQUALS,
+                        ComparisonOperator.NOT_EQUALS,
+                    ):
+                        # As in Python, naive never equals aware.
+                        return numpy.full(
+                            len(column),
+                            self.operator == ComparisonOperator.NOT_EQUALS,
+                        )
+                    value = to_datetime64(value)
+                return compare(column, value)
+            if dtype.kind == "U" and isinstance(value, str):
+                if self.operator == ComparisonOperator.CONTAINS:
+                    return numpy.char.find(column, value) >= 0
+                if self.operator == ComparisonOperator.NOT_CONTAINS:
+                    return numpy.char.find(column, value) < 0
+
+        if compare is not None:
+            return [
+                cell is not MISSING and compare(cell, value) for cell in column
+            ]
+        if self.operator == ComparisonOperator.CONTAINS:
+            return [cell is not MISSING and value in cell for cell in column]
+        if self.operator == ComparisonOperator.NOT_CONTAINS:
+            return [
+                cell is not MISSING and value not in cell for cell in column
+            ]
+        if self.operator == ComparisonOperator.REGEX:
+            search = self._pattern.search
+            return [
+                cell is not MISSING and search(str(cell)) is not None
+                for cell in column
+            ]
+
+        return [False] * len(batch)
@@ -15,29 +15,31 @@ class RuleTransformation(ValueObject):
     custom_function: Optional[Callable[[Any], Any]] = None
 
     def apply(self, item: Dict[str, Any]) -> Dict[str, Any]:
-        """Apply this transformation to an item."""
+        """Apply this transformation to a copy of an item."""
         result = item.copy()
+        self.apply_in_place(result)
+        return result
 
-        if self.field not in result and self.type not in [
+    def apply_in_place(self, item: Dict[str, Any]) -> None:
+        """Apply this transformation to an item the caller owns."""
+        if self.field not in item and self.type not in [
             TransformationType.APPEND,
             TransformationType.CUSTOM,
         ]:
-            return result
+            return
 
         if self.type == TransformationType.REPLACE:
-            result[self.field] = self.value
+            item[self.field] = self.value
         elif self.type == TransformationType.APPEND:
-            if self.field in result:
-                result[self.field] = str(result[self.field]) + str(self.value)
+            if self.field in item:
+                item[self.field] = str(item[self.field]) + str(self.value)
             else:
-                result[self.field] = self.value
+                item[self.field] = self.value
         elif self.type == TransformationType.PREPEND:
-            result[self.field] = str(self.value) + str(result[self.field])
+            item[self.field] = str(self.value) + str(item[self.field])
         elif self.type == TransformationType.REMOVE:
-            if self.field in result:
-                del result[self.field]
+            if self.field in item:
+                del item[self.field]
         elif self.type == TransformationType.CUSTOM and self.custom_function:
-            if self.field in result:
-                result[self.field] = self.custom_function(result[self.field])
-
-        return result
+            if self.field in item:
+                item[self.field] = self.custom_function(item[self.field])
@@ -1,13 +1,28 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from src.domain.feed.entities.feed import Feed
+from src.domain.feed.value_objects.feed_url import FeedUrl
+from src.domain.mixer.services.incremental_mixer import IncrementalMixer
 from src.infrastructure.api.health import HealthAPI
+from src.infrastructure.cache.mixed_feed_cache import MixedFeedCache
+from src.infrastructure.common.db.engine import database
 from src.infrastructure.config.settings import settings
+from src.infrastructure.fetching.fetcher import FeedFetcher
+from src.infrastructure.fetching.scheduler import RefreshScheduler
+from src.infrastructure.middleware.logging.pipeline import LogPipeline
 from src.infrastructure.middleware.logging.request_logging_middleware import (
     RequestLoggingMiddleware,
 )
+from src.infrastructure.middleware.rate_limiting.backends import (
+    create_rate_limit_store,
+)
 from src.infrastructure.middleware.rate_limiting.middleware import (
     RateLimitingMiddleware,
 )
+from src.infrastructure.repository.feed_item_repository import (
+    SqlFeedItemRepository,
+)
+from src.infrastructure.search.inverted_index import InvertedIndex
 
 
 class APIBuilder:
@@ -15,16 +30,37 @@ class APIBuilder:
         self.app = app
         self._configure_middlewares()
         self._configure_routes()
+        self._configure_database()
+        self._configure_fetcher()
 
     def _configure_middlewares(self):
+        rate_limit_store = create_rate_limit_store(
+            settings.RATE_LIMIT_BACKEND,
+            max_clients=settings.RATE_LIMIT_MAX_CLIENTS,
+            shared_memory_path=settings.RATE_LIMIT_SHARED_MEMORY_PATH,
+            shared_memory_slots=settings.RATE_LIMIT_SHARED_MEMORY_SLOTS,
+            redis_url=settings.RATE_LIMIT_REDIS_URL,
+            redis_timeout_seconds=settings.RATE_LIMIT_REDIS_TIMEOUT_SECONDS,
+        )
+        self.app.state.rate_limit_store = rate_limit_store
+        self.app.router.add_event_handler("shutdown", rate_limit_store.close)
 
         self.app.add_middleware(
             RateLimitingMiddleware,
             requests_limit=100,
             window_seconds=60,
             exclude_paths={"/health", "/metrics"},
+            store=rate_limit_store,
         )
 
+        log_pipeline = None
+        if settings.REQUEST_LOG_BACKGROUND:
+            log_pipeline = LogPipeline(
+                max_queue_size=settings.REQUEST_LOG_QUEUE_SIZE
+            )
+            self.app.state.log_pipeline = log_pipeline
+            self.app.router.add_event_handler("shutdown", log_pipeline.stop)
+
         self.app.add_middleware(
             RequestLoggingMiddleware,
             exclude_paths={"/health"},
@@ -32,6 +68,12 @@ class APIBuilder:
             log_response_body=True,
             mask_sensitive_data=True,
             include_timing=True,
+            pipeline=log_pipeline,
+            sample_rate=settings.REQUEST_LOG_SAMPLE_RATE,
+            route_sample_rates=settings.REQUEST_LOG_ROUTE_SAMPLE_RATES,
+            max_body_bytes=settings.REQUEST_LOG_MAX_BODY_BYTES,
+            mask_max_depth=settings.REQUEST_LOG_MASK_MAX_DEPTH,
+            mask_max_bytes=settings.REQUEST_LOG_MASK_MAX_BYTES,
         )
 
         self.app.add_middleware(
@@ -45,6 +87,70 @@ class APIBuilder:
     def _configure_routes(self):
         HealthAPI(self.app)
 
+    def _configure_database(self):
+        self.app.state.database = database
+        self.app.router.add_event_handler("shutdown", database.dispose)
+
+    def _configure_fetcher(self):
+        mixed_feed_cache = MixedFeedCache(
+            max_bytes=settings.MIXED_FEED_CACHE_MAX_BYTES
+        )
+        search_index = InvertedIndex(max_items=settings.SEARCH_INDEX_MAX_ITEMS)
+        incremental_mixer = IncrementalMixer()
+
+        async def on_items(feed, items):
+            for item in items:
+                feed.add_item(item)
+            incremental_mixer.update_feed(feed, items)
+            mixed_feed_cache.invalidate_feed(feed.id)
+            search_index.add_many(items)
+            async with database.session_factory() as session:
+                await SqlFeedItemRepository(session).add_many(
+                    items, update_existing=True
+                )
+
+        async def restore_search_index():
+            async with database.session_factory() as session:
+                items = await SqlFeedItemRepository(session).recent(
+                    settings.SEARCH_INDEX_MAX_ITEMS
+                )
+            search_index.add_many(reversed(items))
+
+        fetcher = FeedFetcher(
+            max_concurrency=settings.FETCH_MAX_CONCURRENCY,
+            max_per_host=settings.FETCH_MAX_PER_HOST,
+            max_connections=settings.FETCH_MAX_CONNECTIONS,
+            max_keepalive_connections=(
+                settings.FETCH_MAX_KEEPALIVE_CONNECTIONS
+            ),
+            timeout_seconds=settings.FETCH_TIMEOUT_SECONDS,
+            connect_timeout_seconds=settings.FETCH_CONNECT_TIMEOUT_SECONDS,
+            http2=settings.FETCH_HTTP2,
+        )
+        scheduler = RefreshScheduler(
+            fetcher,
+            default_interval_seconds=settings.REFRESH_DEFAULT_INTERVAL_SECONDS,
+            min_interval_seconds=settings.REFRESH_MIN_INTERVAL_SECONDS,
+            max_interval_seconds=settings.REFRESH_MAX_INTERVAL_SECONDS,
+            batch_size=settings.REFRESH_BATCH_SIZE,
+            on_items=on_items,
+        )
+        self.app.state.mixed_feed_cache = mixed_feed_cache
+        self.app.state.search_index = search_index
+        self.app.state.incremental_mixer = incremental_mixer
+        self.app.state.feed_fetcher = fetcher
+        self.app.state.refresh_scheduler = scheduler
+
+        async def start_scheduler():
+            for url in settings.REFRESH_FEED_URLS:
+                scheduler.schedule(Feed(url, FeedUrl(url), feed_source_id=url))
+            await scheduler.start()
+
+        self.app.router.add_event_handler("startup", restore_search_index)
+        self.app.router.add_event_handler("startup", start_scheduler)
+        self.app.router.add_event_handler("shutdown", scheduler.stop)
+        self.app.router.add_event_handler("shutdown", fetcher.close)
+
     @classmethod
     def create(cls) -> FastAPI:
         app = FastAPI(
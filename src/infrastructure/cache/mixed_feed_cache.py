@@ -0,0 +1,113 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Hashable, Optional, Set, Tuple
+
+from src.domain.mixer.entities.mixer import Mixer
+
+CacheKey = Tuple[str, str]
+
+
+@dataclass
+class CachedOutput:
+    content: bytes
+    version: Hashable
+    feed_ids: frozenset
+
+
+class MixedFeedCache:
+    """
+    LRU cache of rendered mixer output, bounded by total byte size.
+
+    Entries are keyed by mixer id and an output variant (format, page...)
+    and carry the version they were rendered from: the mixer's rule-set
+    version plus the content version of each of its feeds. A refreshed
+    feed only invalidates the mixers that include it.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[CacheKey, CachedOutput] = OrderedDict()
+        self._keys_by_feed: Dict[str, Set[CacheKey]] = {}
+
+    @staticmethod
+    def version_of(mixer: Mixer) -> Hashable:
+        return (mixer.rules_version, mixer.feeds_version)
+
+    def get(
+        self,
+        mixer_id: str,
+        variant: str,
+        version: Optional[Hashable] = None,
+    ) -> Optional[bytes]:
+        """
+        Get a rendered output. Without `version` the entry is trusted, as
+        it is kept valid by the invalidation calls.
+        """
+        key = (mixer_id, variant)
+        entry = self._entries.get(key)
+        if entry is None or (version is not None and entry.version != version):
+            if entry is not None:
+                self._remove(key)
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry.content
+
+    def put(self, mixer: Mixer, variant: str, content: bytes) -> None:
+        key = (mixer.id, variant)
+        if key in self._entries:
+            self._remove(key)
+        if len(content) > self.max_bytes:
+            return
+
+        feed_ids = frozenset(feed.id for feed in mixer.feeds)
+        self._entries[key] = CachedOutput(
+            content, self.version_of(mixer), feed_ids
+        )
+        self.size_bytes += len(content)
+        for feed_id in feed_ids:
+            self._keys_by_feed.setdefault(feed_id, set()).add(key)
+
+        while self.size_bytes > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def _remove(self, key: CacheKey) -> None:
+        entry = self._entries.pop(key)
+        self.size_bytes -= len(entry.content)
+        for feed_id in entry.feed_ids:
+            keys = self._keys_by_feed.get(feed_id)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_feed[feed_id]
+
+    def invalidate_feed(self, feed_id: str) -> int:
+        """Drop the outputs of every mixer including a feed."""
+        keys = list(self._keys_by_feed.get(feed_id, ()))
+        for key in keys:
+            self._remove(key)
+        return len(keys)
+
+    def invalidate_mixer(self, mixer_id: str) -> int:
+        """Drop every output of a mixer, e.g. after its rules changed."""
+        keys = [key for key in self._entries if key[0] == mixer_id]
+        for key in keys:
+            self._remove(key)
+        return len(keys)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "size_bytes": self.size_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
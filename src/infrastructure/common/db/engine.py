@@ -0,0 +1,87 @@
+from typing import AsyncIterator, Optional
+
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from src.infrastructure.config.settings import settings
+
+
+class Database:
+    """
+    Async engine and session factory shared by the application.
+
+    The engine is created on first use, so importing this module does not
+    require the database driver. Sessions do not expire their objects on
+    commit, so results stay readable after the repository committed.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        *,
+        pool_size: int = 10,
+        max_overflow: int = 20,
+        pool_timeout_seconds: float = 30,
+        pool_recycle_seconds: int = 1800,
+        pool_pre_ping: bool = True,
+        echo: bool = False,
+    ):
+        self.url = url
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
+        self.pool_timeout_seconds = pool_timeout_seconds
+        self.pool_recycle_seconds = pool_recycle_seconds
+        self.pool_pre_ping = pool_pre_ping
+        self.echo = echo
+        self._engine: Optional[AsyncEngine] = None
+        self._session_factory: Optional[async_sessionmaker[AsyncSession]] = (
+            None
+        )
+
+    @property
+    def engine(self) -> AsyncEngine:
+        if self._engine is None:
+            self._engine = create_async_engine(
+                self.url,
+                pool_size=self.pool_size,
+                max_overflow=self.max_overflow,
+                pool_timeout=self.pool_timeout_seconds,
+                pool_recycle=self.pool_recycle_seconds,
+                pool_pre_ping=self.pool_pre_ping,
+                echo=self.echo,
+            )
+        return self._engine
+
+    @property
+    def session_factory(self) -> async_sessionmaker[AsyncSession]:
+        if self._session_factory is None:
+            self._session_factory = async_sessionmaker(
+                self.engine, expire_on_commit=False
+            )
+        return self._session_factory
+
+    async def session(self) -> AsyncIterator[AsyncSession]:
+        """FastAPI dependency yielding a session per request."""
+        async with self.session_factory() as session:
+            yield session
+
+    async def dispose(self) -> None:
+        if self._engine is not None:
+            await self._engine.dispose()
+            self._engine = None
+            self._session_factory = None
+
+
+database = Database(
+    settings.DATABASE_URL,
+    pool_size=settings.DATABASE_POOL_SIZE,
+    max_overflow=settings.DATABASE_MAX_OVERFLOW,
+    pool_timeout_seconds=settings.DATABASE_POOL_TIMEOUT_SECONDS,
+    pool_recycle_seconds=settings.DATABASE_POOL_RECYCLE_SECONDS,
+    pool_pre_ping=settings.DATABASE_POOL_PRE_PING,
+    echo=settings.DATABASE_ECHO,
+)
@@ -0,0 +1,122 @@
+from typing import Any, Dict, List, Optional, Sequence, Type
+
+from loguru import logger
+from sqlalchemy import Executable, Insert, Result, insert
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.seedwork.infra.defaults.base import Base
+
+
+_UPSERT_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+def _upsert_statement(
+    dialect: str,
+    model: Type[Base],
+    rows: List[Dict[str, Any]],
+    conflict_columns: Sequence[str],
+    update_columns: Optional[Sequence[str]],
+) -> Insert:
+    """
+    Multi-row INSERT with `ON CONFLICT DO NOTHING/UPDATE` on dialects
+    that support it; a plain INSERT elsewhere.
+    """
+    dialect_insert = _UPSERT_INSERTS.get(dialect)
+    if dialect_insert is None:
+        return insert(model).values(rows)
+
+    statement = dialect_insert(model).values(rows)
+    if not update_columns:
+        return statement.on_conflict_do_nothing(
+            index_elements=list(conflict_columns)
+        )
+    return statement.on_conflict_do_update(
+        index_elements=list(conflict_columns),
+        set_={column: statement.excluded[column] for column in update_columns},
+    )
+
+
+class DatabaseSessions:
+    """Commit/rollback wrappers used by the seedwork repositories."""
+
+    async def create_session(
+        self, session: AsyncSession, instance: Base
+    ) -> Base:
+        try:
+            session.add(instance)
+            await session.commit()
+            await session.refresh(instance)
+            return instance
+        except Exception as e:
+            await session.rollback()
+            logger.error(f"Insert failed: {e}")
+            raise e
+
+    async def execute_session(
+        self, session: AsyncSession, statement: Executable
+    ) -> Result[Any]:
+        """Run one statement and commit; the result is already buffered."""
+        try:
+            result = await session.execute(statement)
+            await session.commit()
+            return result
+        except Exception as e:
+            await session.rollback()
+            logger.error(f"Statement failed: {e}")
+            raise e
+
+    async def update_session(
+        self, session: AsyncSession, statement: Executable
+    ) -> Result[Any]:
+        return await self.execute_session(session, statement)
+
+    async def delete_session(
+        self, session: AsyncSession, instance: Base
+    ) -> None:
+        try:
+            await session.delete(instance)
+            await session.commit()
+        except Exception as e:
+            await session.rollback()
+            logger.error(f"Delete failed: {e}")
+            raise e
+
+    async def bulk_upsert_session(
+        self,
+        session: AsyncSession,
+        model: Type[Base],
+        rows: List[Dict[str, Any]],
+        conflict_columns: Sequence[str],
+        update_columns: Optional[Sequence[str]] = None,
+        batch_size: int = 500,
+    ) -> int:
+        """
+        Write rows with one statement per `batch_size` chunk and a single
+        commit. Conflicting rows are skipped, or have `update_columns`
+        overwritten when given. Returns the number of rows written.
+        """
+        dialect = session.get_bind().dialect.name
+        written = 0
+        try:
+            for start in range(0, len(rows), batch_size):
+                end = start + batch_size
+                result = await session.execute(
+                    _upsert_statement(
+                        dialect,
+                        model,
+                        rows[start:end],
+                        conflict_columns,
+                        update_columns,
+                    )
+                )
+                written += max(result.rowcount, 0)
+            await session.commit()
+            return written
+        except Exception as e:
+            await session.rollback()
+            logger.error(f"Bulk insert failed: {e}")
+            raise e
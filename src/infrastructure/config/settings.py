@@ -1,3 +1,5 @@
+from typing import Dict, List, Optional
+
 from pydantic import Field
 from pydantic_settings import BaseSettings
 from loguru import logger
@@ -20,6 +22,149 @@ class Settings(BaseSettings):
         default="0.1.0",
         description="Application version",
     )
+    FETCH_MAX_CONCURRENCY: int = Field(
+        default=50,
+        description="Maximum feeds fetched at the same time",
+    )
+    FETCH_MAX_PER_HOST: int = Field(
+        default=4,
+        description="Maximum concurrent fetches against a single host",
+    )
+    FETCH_MAX_CONNECTIONS: int = Field(
+        default=100,
+        description="Connection pool size of the feed fetcher",
+    )
+    FETCH_MAX_KEEPALIVE_CONNECTIONS: int = Field(
+        default=20,
+        description="Idle keep-alive connections kept by the feed fetcher",
+    )
+    FETCH_TIMEOUT_SECONDS: float = Field(
+        default=10.0,
+        description="Timeout for a single feed fetch",
+    )
+    FETCH_CONNECT_TIMEOUT_SECONDS: float = Field(
+        default=5.0,
+        description="Timeout to open a connection to a feed host",
+    )
+    FETCH_HTTP2: bool = Field(
+        default=False,
+        description="Use HTTP/2 for feed fetching (needs httpx[http2])",
+    )
+    REFRESH_DEFAULT_INTERVAL_SECONDS: float = Field(
+        default=3600,
+        description="Initial refresh interval of a feed",
+    )
+    REFRESH_MIN_INTERVAL_SECONDS: float = Field(
+        default=300,
+        description="Shortest adaptive refresh interval of a feed",
+    )
+    REFRESH_MAX_INTERVAL_SECONDS: float = Field(
+        default=86400,
+        description="Longest adaptive or backoff refresh interval of a feed",
+    )
+    REFRESH_FEED_URLS: List[str] = Field(
+        default_factory=list,
+        description="Feed URLs scheduled for refresh on startup, as JSON",
+    )
+    REFRESH_BATCH_SIZE: int = Field(
+        default=50,
+        description="Maximum feeds refreshed per scheduler tick",
+    )
+    MIXED_FEED_CACHE_MAX_BYTES: int = Field(
+        default=64 * 1024 * 1024,
+        description="Byte budget of the rendered mixer output cache",
+    )
+    DATABASE_URL: str = Field(
+        default="sqlite+aiosqlite:///./what_the_feed.db",
+        description="Async SQLAlchemy database URL (driver included)",
+    )
+    DATABASE_POOL_SIZE: int = Field(
+        default=10,
+        description="Connections kept open in the database pool",
+    )
+    DATABASE_MAX_OVERFLOW: int = Field(
+        default=20,
+        description="Extra connections opened above the pool size on bursts",
+    )
+    DATABASE_POOL_TIMEOUT_SECONDS: float = Field(
+        default=30,
+        description="Time to wait for a free pooled connection",
+    )
+    DATABASE_POOL_RECYCLE_SECONDS: int = Field(
+        default=1800,
+        description="Age after which a pooled connection is replaced",
+    )
+    DATABASE_POOL_PRE_PING: bool = Field(
+        default=True,
+        description="Check pooled connections for liveness before use",
+    )
+    DATABASE_ECHO: bool = Field(
+        default=False,
+        description="Log every SQL statement",
+    )
+    RATE_LIMIT_BACKEND: str = Field(
+        default="memory",
+        description="Rate limit state backend (memory, shared_memory, redis)",
+    )
+    RATE_LIMIT_MAX_CLIENTS: int = Field(
+        default=100_000,
+        description="Clients tracked by the in-memory rate limit backend",
+    )
+    RATE_LIMIT_SHARED_MEMORY_PATH: Optional[str] = Field(
+        default=None,
+        description=(
+            "File mapped by the shared_memory rate limit backend; "
+            "defaults to a private runtime directory"
+        ),
+    )
+    RATE_LIMIT_SHARED_MEMORY_SLOTS: int = Field(
+        default=65_536,
+        description="Client slots of the shared_memory rate limit backend",
+    )
+    RATE_LIMIT_REDIS_URL: str = Field(
+        default="redis://localhost:6379/0",
+        description="Redis URL of the redis rate limit backend",
+    )
+    RATE_LIMIT_REDIS_TIMEOUT_SECONDS: float = Field(
+        default=1.0,
+        description="Wait for a Redis reply before failing open",
+    )
+    REQUEST_LOG_BACKGROUND: bool = Field(
+        default=True,
+        description="Write request logs from a background queue",
+    )
+    REQUEST_LOG_QUEUE_SIZE: int = Field(
+        default=10_000,
+        description="Queued request logs before new ones are dropped",
+    )
+    REQUEST_LOG_SAMPLE_RATE: float = Field(
+        default=1.0,
+        description="Share of requests logged (0 to 1)",
+    )
+    REQUEST_LOG_ROUTE_SAMPLE_RATES: Dict[str, float] = Field(
+        default_factory=dict,
+        description="Sample rate per path prefix, as a JSON object",
+    )
+    REQUEST_LOG_MAX_BODY_BYTES: int = Field(
+        default=4096,
+        description="Logged request/response body size before truncation",
+    )
+    REQUEST_LOG_MASK_MAX_DEPTH: int = Field(
+        default=32,
+        description="Nesting depth masked in logged bodies before cut off",
+    )
+    REQUEST_LOG_MASK_MAX_BYTES: int = Field(
+        default=1_048_576,
+        description="Keys and values masked in logged bodies before cut off",
+    )
+    FEED_ITEM_BATCH_SIZE: int = Field(
+        default=500,
+        description="Rows per INSERT statement when storing fetched items",
+    )
+    SEARCH_INDEX_MAX_ITEMS: int = Field(
+        default=100_000,
+        description="Most recent items kept in the in-memory search index",
+    )
 
     def configure_logging(self):
         logger.remove()
@@ -0,0 +1,43 @@
+import hashlib
+import math
+from typing import Iterator
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over string keys.
+
+    `might_contain` never gives false negatives, so a miss proves a key
+    was not seen without asking the persistent index.
+    """
+
+    def __init__(
+        self, expected_items: int = 1_000_000, false_positive_rate=0.001
+    ):
+        size = -expected_items * math.log(false_positive_rate)
+        self.size = max(8, int(size / math.log(2) ** 2))
+        self.hash_count = max(
+            1, round(self.size / expected_items * math.log(2))
+        )
+        self._bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: str) -> Iterator[int]:
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hash_count):
+            yield (first + i * second) % self.size
+
+    def add(self, key: str) -> None:
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def might_contain(self, key: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(key)
+        )
+
+    __contains__ = might_contain
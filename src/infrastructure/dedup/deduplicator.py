@@ -0,0 +1,116 @@
+from typing import Dict, Iterable, List, Set
+
+from loguru import logger
+
+from src.domain.feed.entities.feed_item import FeedItem
+from src.domain.feed.repositories.seen_item_repository import (
+    SeenItemRepository,
+)
+from src.domain.feed.services.item_fingerprint import (
+    SIMHASH_BITS,
+    hamming_distance,
+    item_keys,
+    item_simhash,
+)
+from .bloom import BloomFilter
+
+SIMHASH_PREFIX = "simhash:"
+
+
+class FeedItemDeduplicator:
+    """
+    Detects items already seen across feeds and refreshes.
+
+    An item is identified by its guid or, without one, by its normalized
+    link and content hash; it is a duplicate when any of its keys was seen
+    before. Call `warm` once before use to load the seen keys. A Bloom filter
+    answers most checks in memory and only possible hits reach the
+    persistent index. With `near_duplicates`, items whose title+content
+    SimHash is within `max_distance` bits of a seen one are duplicates
+    too; the SimHash is split into bands so lookups stay O(1).
+    """
+
+    def __init__(
+        self,
+        repository: SeenItemRepository,
+        *,
+        expected_items: int = 1_000_000,
+        false_positive_rate: float = 0.001,
+        near_duplicates: bool = False,
+        max_distance: int = 3,
+    ):
+        self.repository = repository
+        self.near_duplicates = near_duplicates
+        self.max_distance = max_distance
+        self.bands = max_distance + 1
+        self.band_bits = SIMHASH_BITS // self.bands
+        self.bloom = BloomFilter(expected_items, false_positive_rate)
+        self._band_index: Dict[tuple, Set[int]] = {}
+        self.bloom_hits = 0
+        self.bloom_misses = 0
+
+    async def warm(self) -> None:
+        """Load the keys already seen into the in-memory filters."""
+        async for key in self.repository.all_keys():
+            if key.startswith(SIMHASH_PREFIX):
+                self._index_simhash(int(key.removeprefix(SIMHASH_PREFIX), 16))
+            else:
+                self.bloom.add(key)
+        logger.info(f"Deduplication index warmed with {self.bloom.count} keys")
+
+    def _bands_of(self, fingerprint: int) -> List[tuple]:
+        mask = (1 << self.band_bits) - 1
+        return [
+            (band, fingerprint >> (band * self.band_bits) & mask)
+            for band in range(self.bands)
+        ]
+
+    def _index_simhash(self, fingerprint: int) -> None:
+        for band in self._bands_of(fingerprint):
+            self._band_index.setdefault(band, set()).add(fingerprint)
+
+    def _is_near_duplicate(self, fingerprint: int) -> bool:
+        return any(
+            hamming_distance(fingerprint, candidate) <= self.max_distance
+            for band in self._bands_of(fingerprint)
+            for candidate in self._band_index.get(band, ())
+        )
+
+    async def _seen(self, key: str) -> bool:
+        if not self.bloom.might_contain(key):
+            self.bloom_misses += 1
+            return False
+        self.bloom_hits += 1
+        return await self.repository.contains(key)
+
+    async def is_duplicate(self, item: FeedItem) -> bool:
+        for key in item_keys(item):
+            if await self._seen(key):
+                return True
+        return self.near_duplicates and self._is_near_duplicate(
+            item_simhash(item)
+        )
+
+    async def filter_new(self, items: Iterable[FeedItem]) -> List[FeedItem]:
+        """Keep the items not seen before and record them as seen."""
+        new_items = []
+        new_keys: List[str] = []
+        batch_keys: Set[str] = set()
+        for item in items:
+            keys = item_keys(item)
+            if batch_keys.intersection(keys) or await self.is_duplicate(item):
+                continue
+            batch_keys.update(keys)
+            new_keys.extend(keys)
+            if self.near_duplicates:
+                fingerprint = item_simhash(item)
+                self._index_simhash(fingerprint)
+                new_keys.append(f"{SIMHASH_PREFIX}{fingerprint:016x}")
+            new_items.append(item)
+
+        if new_keys:
+            await self.repository.add_many(new_keys)
+            for key in new_keys:
+                if not key.startswith(SIMHASH_PREFIX):
+                    self.bloom.add(key)
+        return new_items
@@ -0,0 +1,230 @@
+import asyncio
+import hashlib
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Iterable, List, Optional
+from urllib.parse import urlsplit
+
+import httpx
+from loguru import logger
+
+from src.domain.feed.entities.feed import Feed
+from src.domain.feed.entities.feed_item import FeedItem
+from .models import FetchMetrics, FetchResult
+from .parser import FeedParser
+
+DEFAULT_USER_AGENT = "what-the-feed/0.1"
+
+
+class FeedFetcher:
+    """
+    Fetches feeds concurrently through one shared pooled `AsyncClient`.
+
+    Concurrency is bounded globally and per host, so refreshing many
+    feeds takes about as long as the slowest one without flooding a
+    single origin. Fetches are conditional: the validators stored on the
+    feed are sent as `If-None-Match`/`If-Modified-Since`, and a 304 or a
+    body identical to the previous one is flagged so parsing is skipped.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrency: int = 50,
+        max_per_host: int = 4,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        timeout_seconds: float = 10.0,
+        connect_timeout_seconds: float = 5.0,
+        http2: bool = False,
+        user_agent: str = DEFAULT_USER_AGENT,
+        client: Optional[httpx.AsyncClient] = None,
+    ):
+        self.max_per_host = max_per_host
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self.last_cycle_metrics = FetchMetrics()
+        self._streamed: List[FetchResult] = []
+        self.client = client or httpx.AsyncClient(
+            http2=http2,
+            follow_redirects=True,
+            headers={"User-Agent": user_agent},
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+            timeout=httpx.Timeout(
+                timeout_seconds, connect=connect_timeout_seconds
+            ),
+        )
+
+    async def __aenter__(self) -> "FeedFetcher":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        await self.client.aclose()
+
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).netloc
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_per_host)
+            self._host_semaphores[host] = semaphore
+        return semaphore
+
+    @asynccontextmanager
+    async def _slot(self, url: str) -> AsyncIterator[None]:
+        """
+        Hold a per-host slot, then a global one. Taking the host slot
+        first keeps feeds queued behind a busy host from sitting on global
+        slots that feeds of other hosts could use.
+        """
+        async with self._host_semaphore(url), self._semaphore:
+            yield
+
+    @staticmethod
+    def _conditional_headers(feed: Feed) -> Dict[str, str]:
+        headers = {}
+        if feed.etag:
+            headers["If-None-Match"] = feed.etag
+        if feed.last_modified:
+            headers["If-Modified-Since"] = feed.last_modified
+        return headers
+
+    @staticmethod
+    def _check_unchanged(feed: Feed, result: FetchResult) -> None:
+        if result.not_modified:
+            result.bytes_saved = feed.content_length or 0
+            feed.update_validators(
+                etag=result.headers.get("etag", feed.etag),
+                last_modified=result.headers.get(
+                    "last-modified", feed.last_modified
+                ),
+                content_hash=feed.content_hash,
+                content_length=feed.content_length,
+            )
+            return
+
+        content_hash = hashlib.sha256(result.content).hexdigest()
+        result.unchanged = content_hash == feed.content_hash
+        feed.update_validators(
+            etag=result.headers.get("etag"),
+            last_modified=result.headers.get("last-modified"),
+            content_hash=content_hash,
+            content_length=len(result.content),
+        )
+
+    async def fetch(self, feed: Feed) -> FetchResult:
+        """Fetch the raw document of one feed."""
+        url = feed.url.url
+        result = FetchResult(feed_id=feed.id, url=url)
+        async with self._slot(url):
+            start = time.perf_counter()
+            try:
+                response = await self.client.get(
+                    url, headers=self._conditional_headers(feed)
+                )
+                result.status_code = response.status_code
+                result.headers = dict(response.headers)
+                result.not_modified = response.status_code == 304
+                if response.status_code >= 400:
+                    result.error = f"HTTP {response.status_code}"
+                elif not result.not_modified:
+                    result.content = response.content
+                    result.bytes_downloaded = len(response.content)
+            except httpx.HTTPError as exp:
+                result.error = f"{type(exp).__name__}: {exp}"
+            result.duration_ms = round((time.perf_counter() - start) * 1000, 2)
+
+        if result.error:
+            logger.warning(f"Failed to fetch feed {feed.id}: {result.error}")
+        elif result.status_code in (200, 304):
+            self._check_unchanged(feed, result)
+        return result
+
+    async def fetch_many(self, feeds: Iterable[Feed]) -> List[FetchResult]:
+        """
+        Fetch many feeds concurrently, in the order they were given, and
+        record the metrics of this refresh cycle.
+        """
+        results = await asyncio.gather(*(self.fetch(feed) for feed in feeds))
+        self.last_cycle_metrics = FetchMetrics.from_results(results)
+        return results
+
+    def collect_metrics(self) -> FetchMetrics:
+        """
+        Record the metrics of the feeds streamed since the last call as the
+        metrics of this refresh cycle.
+        """
+        self.last_cycle_metrics = FetchMetrics.from_results(self._streamed)
+        self._streamed = []
+        return self.last_cycle_metrics
+
+    async def stream_items(self, feed: Feed) -> AsyncIterator[FeedItem]:
+        """
+        Fetch a feed and yield its new items while the body downloads.
+
+        The download is abandoned as soon as the parser reaches items that
+        are not newer than the feed's high-water mark. Each stream is
+        recorded for `collect_metrics`, a 304 counting its stored body
+        length as bytes saved.
+        """
+        url = feed.url.url
+        parser = FeedParser(
+            feed.id,
+            since=feed.high_water_mark,
+            seen_guids=feed.undated_guids,
+        )
+        hasher = hashlib.sha256()
+        result = FetchResult(feed_id=feed.id, url=url)
+        start = time.perf_counter()
+        try:
+            async with self._slot(url):
+                async with self.client.stream(
+                    "GET", url, headers=self._conditional_headers(feed)
+                ) as response:
+                    result.status_code = response.status_code
+                    result.headers = dict(response.headers)
+                    if response.status_code == 304:
+                        result.not_modified = True
+                        self._check_unchanged(feed, result)
+                        return
+                    response.raise_for_status()
+                    async for chunk in response.aiter_bytes():
+                        hasher.update(chunk)
+                        result.bytes_downloaded += len(chunk)
+                        for item in parser.feed(chunk):
+                            yield item
+                        if parser.stopped:
+                            break
+                    else:
+                        for item in parser.close():
+                            yield item
+
+                    content_hash = None
+                    content_length = None
+                    if not parser.stopped:
+                        content_hash = hasher.hexdigest()
+                        content_length = result.bytes_downloaded
+                        result.unchanged = content_hash == feed.content_hash
+                    feed.update_validators(
+                        etag=response.headers.get("etag"),
+                        last_modified=response.headers.get("last-modified"),
+                        content_hash=content_hash,
+                        content_length=content_length,
+                    )
+        except httpx.HTTPError as exp:
+            result.error = f"{type(exp).__name__}: {exp}"
+            raise
+        finally:
+            result.duration_ms = round((time.perf_counter() - start) * 1000, 2)
+            self._streamed.append(result)
+
+        feed.remember_undated_guids(
+            parser.undated_guids, complete=not parser.stopped
+        )
+        if parser.newest:
+            feed.advance_high_water_mark(parser.newest)
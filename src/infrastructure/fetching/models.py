@@ -0,0 +1,51 @@
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Optional
+
+
+@dataclass
+class FetchResult:
+    feed_id: str
+    url: str
+    status_code: Optional[int] = None
+    content: Optional[bytes] = None
+    headers: Dict[str, str] = field(default_factory=dict)
+    duration_ms: float = 0.0
+    error: Optional[str] = None
+    not_modified: bool = False
+    unchanged: bool = False
+    bytes_downloaded: int = 0
+    bytes_saved: int = 0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.status_code in (200, 304)
+
+    @property
+    def needs_parse(self) -> bool:
+        return self.ok and not self.not_modified and not self.unchanged
+
+
+@dataclass
+class FetchMetrics:
+    requests: int = 0
+    errors: int = 0
+    not_modified: int = 0
+    unchanged: int = 0
+    bytes_downloaded: int = 0
+    bytes_saved: int = 0
+
+    @property
+    def parses_skipped(self) -> int:
+        return self.not_modified + self.unchanged
+
+    @classmethod
+    def from_results(cls, results: Iterable[FetchResult]) -> "FetchMetrics":
+        metrics = cls()
+        for result in results:
+            metrics.requests += 1
+            metrics.errors += result.error is not None
+            metrics.not_modified += result.not_modified
+            metrics.unchanged += result.unchanged
+            metrics.bytes_downloaded += result.bytes_downloaded
+            metrics.bytes_saved += result.bytes_saved
+        return metrics
@@ -0,0 +1,198 @@
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import (
+    AsyncIterable,
+    Container,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+)
+from xml.etree.ElementTree import Element, ParseError, XMLPullParser
+
+from loguru import logger
+
+from src.domain.feed.entities.feed_item import FeedItem
+
+ITEM_TAGS = {"item", "entry"}
+
+
+@lru_cache(maxsize=256)
+def _local_name(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def _as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def _parse_date(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return _as_utc(parsedate_to_datetime(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        return _as_utc(datetime.fromisoformat(value))
+    except ValueError:
+        logger.debug(f"Unparseable feed date: {value}")
+        return None
+
+
+class FeedParser:
+    """
+    Streaming RSS/Atom parser producing `FeedItem` entities.
+
+    Bytes are pushed as they arrive and items are yielded as soon as their
+    element closes. Processed elements are detached from the tree, so
+    memory stays flat on large documents. When `since` is given (the
+    feed's previous high-water mark), parsing stops at the first item that
+    is not newer than it.
+
+    Items without a date are stamped with the fetch time but never move
+    the high-water mark nor stop the parse; they are deduplicated by guid
+    instead, skipping those listed in `seen_guids`.
+    """
+
+    def __init__(
+        self,
+        feed_source_id: Optional[str] = None,
+        since: Optional[datetime] = None,
+        seen_guids: Optional[Container[str]] = None,
+    ):
+        self.feed_source_id = feed_source_id
+        self.since = _as_utc(since) if since else None
+        self.seen_guids = seen_guids or ()
+        self.fetched_at = datetime.now(timezone.utc)
+        self.newest: Optional[datetime] = None
+        self.undated_guids: Set[str] = set()
+        self.stopped = False
+        self._parser = XMLPullParser(events=("start", "end"))
+        self._stack: List[Element] = []
+
+    def feed(self, data: bytes) -> Iterator[FeedItem]:
+        """Push a chunk of the document and yield the completed items."""
+        if self.stopped:
+            return
+        self._parser.feed(data)
+        yield from self._read_events()
+
+    def close(self) -> Iterator[FeedItem]:
+        """Signal the end of the document and yield the remaining items."""
+        if self.stopped:
+            return
+        try:
+            self._parser.close()
+        except ParseError as exp:
+            logger.warning(f"Truncated or invalid feed document: {exp}")
+            return
+        yield from self._read_events()
+
+    def parse(self, chunks: Iterable[bytes]) -> Iterator[FeedItem]:
+        for chunk in chunks:
+            yield from self.feed(chunk)
+            if self.stopped:
+                return
+        yield from self.close()
+
+    async def parse_async(
+        self, chunks: AsyncIterable[bytes]
+    ) -> AsyncIterable[FeedItem]:
+        async for chunk in chunks:
+            for item in self.feed(chunk):
+                yield item
+            if self.stopped:
+                return
+        for item in self.close():
+            yield item
+
+    def _read_events(self) -> Iterator[FeedItem]:
+        for event, element in self._parser.read_events():
+            if event == "start":
+                self._stack.append(element)
+                continue
+
+            self._stack.pop()
+            if _local_name(element.tag) not in ITEM_TAGS:
+                continue
+
+            item = self._build_item(element)
+            if self._stack:
+                self._stack[-1].remove(element)
+            element.clear()
+
+            if item.published_date is None:
+                item.published_date = self.fetched_at
+                if item.guid:
+                    self.undated_guids.add(item.guid)
+                    if item.guid in self.seen_guids:
+                        continue
+                yield item
+                continue
+
+            if self.since and item.published_date <= self.since:
+                self.stopped = True
+                return
+            if self.newest is None or item.published_date > self.newest:
+                self.newest = item.published_date
+            yield item
+
+    def _build_item(self, element: Element) -> FeedItem:
+        children = {}
+        link = None
+        author = None
+        tags = []
+        for child in element:
+            name = _local_name(child.tag)
+            text = (child.text or "").strip()
+            if name == "link":
+                rel = child.get("rel", "alternate")
+                if text and link is None:
+                    link = text
+                elif child.get("href") and rel == "alternate":
+                    link = child.get("href")
+            elif name == "category":
+                term = child.get("term") or text
+                if term:
+                    tags.append(term)
+            elif name == "author":
+                name_element = next(
+                    (c for c in child if _local_name(c.tag) == "name"), None
+                )
+                author = (
+                    (name_element.text or "").strip()
+                    if name_element is not None
+                    else text
+                ) or author
+            elif name not in children:
+                children[name] = text
+
+        published = _parse_date(
+            children.get("pubDate")
+            or children.get("published")
+            or children.get("updated")
+            or children.get("date")
+        )
+
+        return FeedItem(
+            title=children.get("title", ""),
+            content=(
+                children.get("encoded")
+                or children.get("content")
+                or children.get("description")
+                or children.get("summary")
+                or ""
+            ),
+            link=link or "",
+            published_date=published,
+            author=author or children.get("creator") or None,
+            feed_source_id=self.feed_source_id,
+            guid=children.get("guid") or children.get("id") or link,
+            tags=tags,
+        )
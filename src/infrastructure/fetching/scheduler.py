@@ -0,0 +1,222 @@
+import asyncio
+import heapq
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from loguru import logger
+
+from src.domain.feed.entities.feed import Feed
+from src.domain.feed.entities.feed_item import FeedItem
+from src.domain.feed.enums.feed_status import FeedStatus
+from .fetcher import FeedFetcher
+
+ItemsHandler = Callable[[Feed, List[FeedItem]], Awaitable[None]]
+
+
+@dataclass
+class FeedSchedule:
+    feed: Feed
+    interval_seconds: float
+    due_at: float
+    failures: int = 0
+
+
+class RefreshScheduler:
+    """
+    Background scheduler refreshing feeds when they are due.
+
+    Feeds sit in a heap keyed by their next due time, so each tick only
+    looks at the feeds that are actually due. Each due feed is refreshed
+    in its own task, bounded by the fetcher's limits, so a slow feed never
+    holds back the next tick. The interval of a feed
+    shrinks when a refresh brings new items and grows when it does not;
+    feeds in `FeedStatus.ERROR` back off exponentially.
+    """
+
+    def __init__(
+        self,
+        fetcher: FeedFetcher,
+        *,
+        default_interval_seconds: float = 3600,
+        min_interval_seconds: float = 300,
+        max_interval_seconds: float = 86400,
+        batch_size: int = 50,
+        on_items: Optional[ItemsHandler] = None,
+    ):
+        self.fetcher = fetcher
+        self.default_interval_seconds = default_interval_seconds
+        self.min_interval_seconds = min_interval_seconds
+        self.max_interval_seconds = max_interval_seconds
+        self.batch_size = batch_size
+        self.on_items = on_items
+        self._schedules: Dict[str, FeedSchedule] = {}
+        self._heap: List[Tuple[float, str]] = []
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._in_flight: Set[asyncio.Task] = set()
+        self.refreshed = 0
+        self.failed = 0
+        self.last_lag_seconds = 0.0
+        self.max_lag_seconds = 0.0
+
+    def schedule(self, feed: Feed) -> None:
+        """Add a feed, due now if it is stale."""
+        if feed.status == FeedStatus.INACTIVE:
+            return
+
+        interval = self.default_interval_seconds
+        due_at = time.time()
+        if not feed.is_stale(max_age_minutes=interval / 60):
+            due_at = feed.last_fetched.timestamp() + interval
+
+        self._schedules[feed.id] = FeedSchedule(feed, interval, due_at)
+        heapq.heappush(self._heap, (due_at, feed.id))
+        self._wakeup.set()
+
+    def unschedule(self, feed_id: str) -> None:
+        """Remove a feed; its heap entry is discarded lazily."""
+        self._schedules.pop(feed_id, None)
+
+    def _pop_due(self, now: float) -> List[FeedSchedule]:
+        due = []
+        while self._heap and len(due) < self.batch_size:
+            due_at, feed_id = self._heap[0]
+            schedule = self._schedules.get(feed_id)
+            if schedule is None or schedule.due_at != due_at:
+                heapq.heappop(self._heap)
+                continue
+            if due_at > now:
+                break
+            heapq.heappop(self._heap)
+            if not due:
+                self.last_lag_seconds = now - due_at
+                self.max_lag_seconds = max(
+                    self.max_lag_seconds, self.last_lag_seconds
+                )
+            schedule.due_at = float("inf")
+            due.append(schedule)
+        return due
+
+    def _reschedule(self, schedule: FeedSchedule, new_items: int) -> None:
+        if schedule.feed.status == FeedStatus.ERROR:
+            interval = self.default_interval_seconds * 2**schedule.failures
+        elif new_items:
+            interval = schedule.interval_seconds / 2
+        else:
+            interval = schedule.interval_seconds * 1.5
+        schedule.interval_seconds = min(
+            self.max_interval_seconds,
+            max(self.min_interval_seconds, interval),
+        )
+        schedule.due_at = time.time() + schedule.interval_seconds
+        if schedule.feed.id in self._schedules:
+            heapq.heappush(self._heap, (schedule.due_at, schedule.feed.id))
+            self._wakeup.set()
+
+    async def _refresh(self, schedule: FeedSchedule) -> None:
+        feed = schedule.feed
+        try:
+            items = [item async for item in self.fetcher.stream_items(feed)]
+        except Exception as exp:
+            logger.warning(f"Refresh of feed {feed.id} failed: {exp}")
+            feed.status = FeedStatus.ERROR
+            schedule.failures += 1
+            self.failed += 1
+            self._reschedule(schedule, 0)
+            return
+
+        feed.status = FeedStatus.ACTIVE
+        feed.update_last_fetched()
+        schedule.failures = 0
+        self.refreshed += 1
+        if items and self.on_items:
+            try:
+                await self.on_items(feed, items)
+            except Exception as exp:
+                logger.error(f"Handling items of feed {feed.id} failed: {exp}")
+        self._reschedule(schedule, len(items))
+
+    def _dispatch(self, schedule: FeedSchedule) -> None:
+        task = asyncio.create_task(self._refresh(schedule))
+        self._in_flight.add(task)
+        task.add_done_callback(self._refresh_done)
+
+    def _refresh_done(self, task: asyncio.Task) -> None:
+        self._in_flight.discard(task)
+        if self._in_flight:
+            return
+        cycle = self.fetcher.collect_metrics()
+        logger.info(
+            f"Refreshed {cycle.requests} feeds: {cycle.parses_skipped} "
+            f"parses skipped, {cycle.bytes_saved} bytes saved"
+        )
+
+    async def run_once(self) -> int:
+        """
+        Start refreshing the feeds that are due, returning how many there
+        were. A refresh cycle ends when no refresh is left in flight.
+        """
+        due = self._pop_due(time.time())
+        for schedule in due:
+            self._dispatch(schedule)
+        return len(due)
+
+    async def wait_idle(self) -> None:
+        """Wait until no refresh is in flight."""
+        while self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
+
+    def _seconds_until_next(self) -> float:
+        while self._heap:
+            due_at, feed_id = self._heap[0]
+            schedule = self._schedules.get(feed_id)
+            if schedule is not None and schedule.due_at == due_at:
+                return max(0.0, due_at - time.time())
+            heapq.heappop(self._heap)
+        return self.max_interval_seconds
+
+    async def run(self) -> None:
+        while True:
+            if await self.run_once():
+                await asyncio.sleep(0)
+                continue
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(
+                    self._wakeup.wait(), self._seconds_until_next()
+                )
+            except asyncio.TimeoutError:
+                pass
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        for task in self._in_flight:
+            task.cancel()
+        await self.wait_idle()
+
+    def metrics(self) -> Dict[str, float]:
+        return {
+            "queue_depth": len(self._schedules),
+            "in_flight": len(self._in_flight),
+            "due": sum(
+                schedule.due_at <= time.time()
+                for schedule in self._schedules.values()
+            ),
+            "last_lag_seconds": round(self.last_lag_seconds, 3),
+            "max_lag_seconds": round(self.max_lag_seconds, 3),
+            "refreshed": self.refreshed,
+            "failed": self.failed,
+            "parses_skipped": self.fetcher.last_cycle_metrics.parses_skipped,
+            "bytes_saved": self.fetcher.last_cycle_metrics.bytes_saved,
+        }
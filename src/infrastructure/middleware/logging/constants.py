@@ -24,3 +24,6 @@ class LogLevel(str, Enum):
 DEFAULT_EXCLUDED_PATHS = {"/health", "/metrics"}
 DEFAULT_EXCLUDED_METHODS = {"OPTIONS"}
 DEFAULT_SENSITIVE_HEADERS = {"authorization", "cookie", "x-api-key"}
+MASKED_VALUE = "***MASKED***"
+TRUNCATED_VALUE = "...[truncated]"
+TRUNCATED_KEY = "..."
@@ -1,13 +1,14 @@
 from typing import Dict, Any
-import json
 from loguru import logger
 
+from .utils import json_dumps
+
 
 class LogFormatter:
     @staticmethod
     def format_log(data: Dict[str, Any]) -> str:
         try:
-            return json.dumps(data, separators=(",", ":"))
+            return json_dumps(data)
         except Exception as e:
             logger.error(f"Failed to format log data: {str(e)}")
             return str(data)
@@ -1,4 +1,5 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import List, Optional
 
 
 @dataclass
@@ -9,3 +10,25 @@ class RequestTiming:
     @property
     def duration_ms(self) -> float:
         return round((self.end_time - self.start_time) * 1000, 2)
+
+
+@dataclass
+class CapturedBody:
+    """Chunks of a body as they stream by, keeping at most `max_bytes`."""
+
+    max_bytes: Optional[int] = None
+    chunks: List[bytes] = field(default_factory=list)
+    size: int = 0
+    kept: int = 0
+
+    def add(self, chunk: bytes) -> None:
+        self.size += len(chunk)
+        if self.max_bytes is not None:
+            chunk = chunk[: self.max_bytes - self.kept]
+        if chunk:
+            self.chunks.append(chunk)
+            self.kept += len(chunk)
+
+    @property
+    def body(self) -> bytes:
+        return b"".join(self.chunks)
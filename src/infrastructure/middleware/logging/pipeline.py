@@ -0,0 +1,89 @@
+import asyncio
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from loguru import logger
+
+from .constants import LogLevel
+
+Renderer = Callable[[Any], Dict[str, Any]]
+
+
+class LogPipeline:
+    """
+    Bounded queue of raw log records written by a background task.
+
+    Requests only enqueue what they captured; decoding, masking and the
+    actual `logger.log` call happen in the worker. When the queue is full
+    the record is dropped and counted instead of slowing the request.
+    The worker writes at most `batch_size` records before yielding to
+    the event loop, so a burst never stalls the requests being served.
+    """
+
+    def __init__(self, max_queue_size: int = 10_000, batch_size: int = 100):
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self.submitted = 0
+        self.dropped = 0
+        self.written = 0
+        self.failed = 0
+
+    def _ensure_worker(self) -> asyncio.Queue:
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return self._queue
+
+    def submit(self, level: LogLevel, render: Renderer, record: Any) -> bool:
+        """Enqueue a record without waiting; False when it was dropped."""
+        try:
+            self._ensure_worker().put_nowait((level, render, record))
+        except asyncio.QueueFull:
+            self.dropped += 1
+            return False
+        self.submitted += 1
+        return True
+
+    def _write(self, item: Tuple[LogLevel, Renderer, Any]) -> None:
+        level, render, record = item
+        try:
+            logger.log(level, render(record))
+            self.written += 1
+        except Exception as exp:
+            self.failed += 1
+            logger.error(f"Failed to write request log: {exp}")
+
+    async def _run(self) -> None:
+        queue = self._queue
+        while True:
+            self._write(await queue.get())
+            for _ in range(self.batch_size - 1):
+                if queue.empty():
+                    break
+                self._write(queue.get_nowait())
+            await asyncio.sleep(0)
+
+    async def stop(self) -> None:
+        """Write what is still queued and stop the worker."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._queue is not None:
+            while not self._queue.empty():
+                self._write(self._queue.get_nowait())
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "queued": self._queue.qsize() if self._queue else 0,
+            "max_queue_size": self.max_queue_size,
+            "submitted": self.submitted,
+            "dropped": self.dropped,
+            "written": self.written,
+            "failed": self.failed,
+        }
@@ -1,15 +1,47 @@
 from fastapi import Request
 from datetime import datetime, UTC
+import time
 import uuid
-from typing import Dict, Any
-import json
+from typing import Callable, Dict, Any, Optional
 from json.decoder import JSONDecodeError
 from loguru import logger
 
-from .utils import get_client_ip, mask_sensitive_data
+from .utils import SensitiveDataMasker, get_client_ip, json_loads
 from .constants import DEFAULT_SENSITIVE_HEADERS
 
 
+def decode_body(
+    body: Optional[bytes],
+    size: int,
+    mask: Optional[Callable[[Any], Any]] = None,
+) -> Any:
+    """
+    Decode a logged body: JSON when possible, text otherwise. `size` is
+    the full body size; when only a prefix was kept the body cannot be
+    parsed, so with masking on it is replaced by a placeholder rather
+    than risk logging unmasked fields.
+    """
+    if not body:
+        return None
+
+    if len(body) < size:
+        if mask is not None:
+            return f"[truncated body of {size} bytes]"
+        text = body.decode(errors="replace")
+        return f"{text}...[truncated from {size} bytes]"
+
+    try:
+        value = json_loads(body)
+    except (JSONDecodeError, UnicodeDecodeError):
+        try:
+            value = body.decode()
+        except UnicodeDecodeError as e:
+            logger.warning(f"Failed to decode body: {str(e)}")
+            return None
+
+    return mask(value) if mask is not None else value
+
+
 class RequestLogger:
     def __init__(
         self,
@@ -19,63 +51,80 @@ class RequestLogger:
         mask_sensitive_data: bool = True,
         request_id_header: str = "X-Request-ID",
         correlation_id_header: str = "X-Correlation-ID",
+        max_body_bytes: Optional[int] = None,
+        mask_max_depth: int = 32,
+        mask_max_bytes: int = 1_048_576,
     ):
         self.log_request_body = log_request_body
         self.sensitive_headers = sensitive_headers or DEFAULT_SENSITIVE_HEADERS
         self.mask_sensitive_data = mask_sensitive_data
         self.request_id_header = request_id_header
         self.correlation_id_header = correlation_id_header
+        self.max_body_bytes = max_body_bytes
+        self._masker = SensitiveDataMasker(
+            self.sensitive_headers,
+            max_depth=mask_max_depth,
+            max_bytes=mask_max_bytes,
+        )
 
     def get_request_id(self, request: Request) -> str:
         return request.headers.get(self.request_id_header) or str(uuid.uuid4())
 
-    async def build_log(self, request: Request) -> tuple[Dict[str, Any], str]:
-        request_id = self.get_request_id(request)
-        correlation_id = request.headers.get(self.correlation_id_header)
-
-        log_data = {
-            "timestamp": datetime.now(UTC).isoformat(),
-            "request_id": request_id,
-            "correlation_id": correlation_id,
+    def capture(
+        self, request: Request, timestamp: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Raw request fields, decoded and masked later by `render`. The body
+        is left empty; the middleware fills it in with what it buffered
+        before calling the application.
+        """
+        return {
+            "timestamp": time.time() if timestamp is None else timestamp,
+            "request_id": self.get_request_id(request),
+            "correlation_id": request.headers.get(self.correlation_id_header),
             "method": request.method,
             "url": str(request.url),
             "path_params": dict(request.path_params),
             "query_params": dict(request.query_params),
             "client_ip": get_client_ip(request),
             "user_agent": request.headers.get("user-agent"),
+            "headers": request.headers.raw,
+            "body": None,
+            "body_size": 0,
         }
 
-        headers = dict(request.headers)
-        if self.mask_sensitive_data:
-            headers = mask_sensitive_data(headers, self.sensitive_headers)
-        log_data["headers"] = headers
+    def _mask(self, data: Any) -> Any:
+        return self._masker.mask(data)
 
-        if self.log_request_body:
-            body = await self._get_request_body(request)
-            if body is not None:
-                if self.mask_sensitive_data:
-                    body = mask_sensitive_data(body, self.sensitive_headers)
-                log_data["body"] = body
-
-        return log_data, request_id
+    def render(self, raw: Dict[str, Any]) -> Dict[str, Any]:
+        log_data = {
+            "timestamp": datetime.fromtimestamp(
+                raw["timestamp"], UTC
+            ).isoformat(),
+            "request_id": raw["request_id"],
+            "correlation_id": raw["correlation_id"],
+            "method": raw["method"],
+            "url": raw["url"],
+            "path_params": raw["path_params"],
+            "query_params": raw["query_params"],
+            "client_ip": raw["client_ip"],
+            "user_agent": raw["user_agent"],
+        }
 
-    @staticmethod
-    async def _get_request_body(request: Request) -> Any:
-        if not hasattr(request, "body"):
-            return None
+        headers = {
+            name.decode("latin-1"): value.decode("latin-1")
+            for name, value in raw["headers"]
+        }
+        if self.mask_sensitive_data:
+            headers = self._mask(headers)
+        log_data["headers"] = headers
 
-        body = await request.body()
-        if not body:
-            return None
+        body = decode_body(
+            raw["body"],
+            raw["body_size"],
+            self._mask if self.mask_sensitive_data else None,
+        )
+        if body is not None:
+            log_data["body"] = body
 
-        try:
-            return json.loads(body)
-        except JSONDecodeError:
-            try:
-                return body.decode()
-            except UnicodeDecodeError as e:
-                logger.warning(f"Failed to decode request body: {str(e)}")
-                return None
-        except Exception as e:
-            logger.error(f"Failed to process request body: {str(e)}")
-            return None
+        return log_data
@@ -1,24 +1,26 @@
-from fastapi import Request, Response
-from starlette.middleware.base import RequestResponseEndpoint
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from loguru import logger
-from contextlib import asynccontextmanager
+import random
 import time
+from collections import deque
+from typing import Any, Dict, Optional, Tuple
 
-from .base import BaseCustomMiddleware
 from .constants import (
     DEFAULT_EXCLUDED_PATHS,
     DEFAULT_EXCLUDED_METHODS,
-    nullcontext,
     LogLevel,
 )
+from .models import CapturedBody
+from .pipeline import LogPipeline
 from .request_logger import RequestLogger
 from .response_logger import ResponseLogger
 
 
-class RequestLoggingMiddleware(BaseCustomMiddleware):
+class RequestLoggingMiddleware:
     def __init__(
         self,
-        app,
+        app: ASGIApp,
         *,
         exclude_paths: set[str] = None,
         exclude_methods: set[str] = None,
@@ -26,65 +28,183 @@ class RequestLoggingMiddleware(BaseCustomMiddleware):
         log_response_body: bool = True,
         mask_sensitive_data: bool = True,
         include_timing: bool = True,
+        pipeline: Optional[LogPipeline] = None,
+        sample_rate: float = 1.0,
+        route_sample_rates: Optional[Dict[str, float]] = None,
+        always_log_errors: bool = True,
+        max_body_bytes: Optional[int] = None,
+        mask_max_depth: int = 32,
+        mask_max_bytes: int = 1_048_576,
     ):
-        super().__init__(app)
-        self.duration_ms = None
+        """
+        The request body is read up front, up to `max_body_bytes`, and
+        replayed to the application, so it is logged even when the route
+        never reads it (e.g. a 404). The response body is copied as it
+        passes through `send`, so streaming responses reach the client
+        unbuffered; at most `max_body_bytes` of each body is kept.
+
+        The request fields are captured from the ASGI scope only once a
+        request is known to be logged, after the response. With a
+        `pipeline`, requests only capture raw fields and enqueue them;
+        rendering and writing happen in the pipeline's worker. Only
+        a `sample_rate` share of requests is logged, overridden per path
+        prefix by `route_sample_rates` (longest prefix wins); server errors
+        are still logged without bodies when `always_log_errors` is set.
+
+        Masking stops at `mask_max_depth` levels of nesting or after about
+        `mask_max_bytes` of keys and values.
+        """
+        self.app = app
         self.exclude_paths = exclude_paths or DEFAULT_EXCLUDED_PATHS
         self.exclude_methods = exclude_methods or DEFAULT_EXCLUDED_METHODS
         self.include_timing = include_timing
+        self.pipeline = pipeline
+        self.sample_rate = sample_rate
+        self.route_sample_rates = sorted(
+            (route_sample_rates or {}).items(),
+            key=lambda route: len(route[0]),
+            reverse=True,
+        )
+        self.always_log_errors = always_log_errors
+        self.max_body_bytes = max_body_bytes
         self.request_logger = RequestLogger(
             log_request_body=log_request_body,
             mask_sensitive_data=mask_sensitive_data,
+            max_body_bytes=max_body_bytes,
+            mask_max_depth=mask_max_depth,
+            mask_max_bytes=mask_max_bytes,
         )
         self.response_logger = ResponseLogger(
             log_response_body=log_response_body,
             mask_sensitive_data=mask_sensitive_data,
+            max_body_bytes=max_body_bytes,
+            mask_max_depth=mask_max_depth,
+            mask_max_bytes=mask_max_bytes,
         )
 
-    @asynccontextmanager
-    async def timing_context(self):
-        start = time.time()
-        try:
-            yield
-        finally:
-            self.duration_ms = round((time.time() - start) * 1000, 2)
-
-    def _should_skip_logging(self, request: Request) -> bool:
+    def _should_skip_logging(self, scope: Scope) -> bool:
         return (
-            request.url.path in self.exclude_paths
-            or request.method in self.exclude_methods
+            scope["path"] in self.exclude_paths
+            or scope["method"] in self.exclude_methods
         )
 
-    async def dispatch(
-        self, request: Request, call_next: RequestResponseEndpoint
-    ) -> Response:
-        if self._should_skip_logging(request):
-            return await call_next(request)
+    def _is_sampled(self, path: str) -> bool:
+        rate = self.sample_rate
+        for prefix, route_rate in self.route_sample_rates:
+            if path.startswith(prefix):
+                rate = route_rate
+                break
+        return rate >= 1 or random.random() < rate
 
-        self.duration_ms = None
-        timing_ctx = (
-            self.timing_context() if self.include_timing else nullcontext()
-        )
+    async def _buffer_request_body(
+        self, receive: Receive, body: CapturedBody
+    ) -> Receive:
+        """
+        Read request messages into `body` until it is complete or over
+        `max_body_bytes`, and return a `receive` that replays them before
+        reading (and capturing) the rest.
+        """
+        buffered = deque()
+        while True:
+            message = await receive()
+            buffered.append(message)
+            if message["type"] != "http.request":
+                break
+            body.add(message.get("body", b""))
+            if not message.get("more_body", False):
+                break
+            if (
+                self.max_body_bytes is not None
+                and body.size > self.max_body_bytes
+            ):
+                break
+
+        async def replay() -> Message:
+            if buffered:
+                return buffered.popleft()
+            message = await receive()
+            if message["type"] == "http.request":
+                body.add(message.get("body", b""))
+            return message
+
+        return replay
 
-        log_data, request_id = await self.request_logger.build_log(request)
+    def _render(
+        self, record: Tuple[Dict[str, Any], Dict[str, Any], Optional[float]]
+    ) -> Dict[str, Any]:
+        request_raw, response_raw, duration_ms = record
+        log_data = self.request_logger.render(request_raw)
+        log_data.update(self.response_logger.render(response_raw))
+        if self.include_timing:
+            log_data["duration_ms"] = duration_ms
+        return log_data
 
-        async with timing_ctx:
-            try:
-                response = await call_next(request)
-                status_code = response.status_code
-            except Exception as exc:
-                logger.error(
-                    f"Request {request_id}: Unhandled exception - {str(exc)}"
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        if scope["type"] != "http" or self._should_skip_logging(scope):
+            await self.app(scope, receive, send)
+            return
+
+        sampled = self._is_sampled(scope["path"])
+        if not sampled and not self.always_log_errors:
+            await self.app(scope, receive, send)
+            return
+
+        timestamp = time.time()
+        request_raw = None
+        request_body = None
+        if sampled and self.request_logger.log_request_body:
+            request_body = CapturedBody(self.max_body_bytes)
+        response_body = None
+        if sampled and self.response_logger.log_response_body:
+            response_body = CapturedBody(self.max_body_bytes)
+        response_start: Dict[str, Any] = {"status": 500, "headers": []}
+
+        async def send_logged(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                response_start["status"] = message["status"]
+                response_start["headers"] = message.get("headers", [])
+            elif response_body is not None:
+                response_body.add(message.get("body", b""))
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            if request_body is not None:
+                receive = await self._buffer_request_body(
+                    receive, request_body
                 )
-                raise
-            finally:
-                log_data.update(
-                    self.response_logger.build_log(response, status_code)
+            await self.app(scope, receive, send_logged)
+        except Exception as exc:
+            request_raw = self.request_logger.capture(
+                Request(scope), timestamp
+            )
+            logger.error(
+                f"Request {request_raw['request_id']}: "
+                f"Unhandled exception - {str(exc)}"
+            )
+            raise
+        finally:
+            status_code = response_start["status"]
+            if sampled or status_code >= 500:
+                duration_ms = round((time.perf_counter() - start) * 1000, 2)
+                if request_raw is None:
+                    request_raw = self.request_logger.capture(
+                        Request(scope), timestamp
+                    )
+                if request_body is not None:
+                    request_raw["body"] = request_body.body
+                    request_raw["body_size"] = request_body.size
+                response_raw = self.response_logger.capture(
+                    status_code,
+                    response_start["headers"],
+                    response_body.body if response_body is not None else None,
+                    response_body.size if response_body is not None else 0,
                 )
-                if self.include_timing:
-                    log_data["duration_ms"] = self.duration_ms
-
+                record = (request_raw, response_raw, duration_ms)
                 log_level = LogLevel.from_status_code(status_code)
-                logger.log(log_level, log_data)
-
-        return response
+                if self.pipeline is not None:
+                    self.pipeline.submit(log_level, self._render, record)
+                else:
+                    logger.log(log_level, self._render(record))
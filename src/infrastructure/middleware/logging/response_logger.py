@@ -1,9 +1,8 @@
-from fastapi import Response
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
 from http import HTTPStatus
-from loguru import logger
 
-from .utils import mask_sensitive_data
+from .request_logger import decode_body
+from .utils import SensitiveDataMasker
 from .constants import DEFAULT_SENSITIVE_HEADERS
 
 
@@ -14,33 +13,59 @@ class ResponseLogger:
         log_response_body: bool = True,
         sensitive_headers: set[str] = None,
         mask_sensitive_data: bool = True,
+        max_body_bytes: Optional[int] = None,
+        mask_max_depth: int = 32,
+        mask_max_bytes: int = 1_048_576,
     ):
         self.log_response_body = log_response_body
         self.sensitive_headers = sensitive_headers or DEFAULT_SENSITIVE_HEADERS
         self.mask_sensitive_data = mask_sensitive_data
+        self.max_body_bytes = max_body_bytes
+        self._masker = SensitiveDataMasker(
+            self.sensitive_headers,
+            max_depth=mask_max_depth,
+            max_bytes=mask_max_bytes,
+        )
 
-    def build_log(
-        self, response: Response, status_code: int
+    def capture(
+        self,
+        status_code: int,
+        headers: List[Tuple[bytes, bytes]],
+        body: Optional[bytes] = None,
+        body_size: int = 0,
     ) -> Dict[str, Any]:
+        """Raw response fields, decoded and masked later by `render`."""
+        return {
+            "status_code": status_code,
+            "headers": headers,
+            "body": body if self.log_response_body else None,
+            "body_size": body_size,
+        }
+
+    def _mask(self, data: Any) -> Any:
+        return self._masker.mask(data)
+
+    def render(self, raw: Dict[str, Any]) -> Dict[str, Any]:
+        status_code = raw["status_code"]
         log_data = {
             "status_code": status_code,
             "status_phrase": HTTPStatus(status_code).phrase,
         }
 
-        headers = dict(response.headers)
+        headers = {
+            name.decode("latin-1"): value.decode("latin-1")
+            for name, value in raw["headers"]
+        }
         if self.mask_sensitive_data:
-            headers = mask_sensitive_data(headers, self.sensitive_headers)
+            headers = self._mask(headers)
         log_data["response_headers"] = headers
 
-        if self.log_response_body and hasattr(response, "body"):
-            try:
-                body = response.body.decode()
-                if self.mask_sensitive_data:
-                    body = mask_sensitive_data(body, self.sensitive_headers)
-                log_data["response_body"] = body
-            except UnicodeDecodeError as e:
-                logger.warning(f"Failed to decode response body: {str(e)}")
-            except Exception as e:
-                logger.error(f"Failed to read response body: {str(e)}")
+        body = decode_body(
+            raw["body"],
+            raw["body_size"],
+            self._mask if self.mask_sensitive_data else None,
+        )
+        if body is not None:
+            log_data["response_body"] = body
 
         return log_data
@@ -1,12 +1,21 @@
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator, Any
+from typing import AsyncGenerator, Any, Dict, Iterable, Union
 from fastapi import Request
 import time
 import json
-from json.decoder import JSONDecodeError
 
+from src.infrastructure.middleware.logging.constants import (
+    MASKED_VALUE,
+    TRUNCATED_KEY,
+    TRUNCATED_VALUE,
+)
 from src.infrastructure.middleware.logging.models import RequestTiming
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 @asynccontextmanager
 async def request_timing() -> AsyncGenerator[RequestTiming, None]:
@@ -17,26 +26,100 @@ async def request_timing() -> AsyncGenerator[RequestTiming, None]:
         timing.end_time = time.time()
 
 
-def mask_sensitive_data(data: Any, sensitive_headers: set[str]) -> Any:
-    if isinstance(data, dict):
-        return {
-            k: (
-                "***MASKED***"
-                if k.lower() in sensitive_headers
-                else mask_sensitive_data(v, sensitive_headers)
-            )
-            for k, v in data.items()
-        }
-    if isinstance(data, str):
-        try:
-            json_data = json.loads(data)
-            if isinstance(json_data, dict):
-                return json.dumps(
-                    mask_sensitive_data(json_data, sensitive_headers)
-                )
-        except JSONDecodeError:
-            pass
-    return data
+def json_loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(data: Any) -> str:
+    """Compact JSON with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, default=str).decode()
+    return json.dumps(data, separators=(",", ":"), default=str)
+
+
+class SensitiveDataMasker:
+    """
+    Masks the values of sensitive keys in a parsed structure.
+
+    The structure is walked once and each key is lowercased once and
+    looked up in a frozenset. Containers nested deeper than `max_depth`
+    and everything after roughly `max_bytes` of keys and values are
+    replaced by a marker, bounding the cost of huge or hostile payloads.
+    Strings holding a JSON object or array (e.g. a forwarded upstream
+    payload) are parsed, masked against the same budget and re-encoded.
+    """
+
+    def __init__(
+        self,
+        sensitive_keys: Iterable[str],
+        *,
+        max_depth: int = 32,
+        max_bytes: int = 1_048_576,
+    ):
+        self.sensitive_keys = frozenset(key.lower() for key in sensitive_keys)
+        self.max_depth = max_depth
+        self.max_bytes = max_bytes
+
+    def mask(self, data: Any) -> Any:
+        sensitive_keys = self.sensitive_keys
+        max_depth = self.max_depth
+        remaining = self.max_bytes
+        is_sensitive: Dict[str, bool] = {}
+
+        def walk(value: Any, depth: int) -> Any:
+            nonlocal remaining
+            if isinstance(value, dict):
+                if depth >= max_depth:
+                    return TRUNCATED_VALUE
+                masked = {}
+                for key, item in value.items():
+                    if remaining <= 0:
+                        masked[TRUNCATED_KEY] = TRUNCATED_VALUE
+                        break
+                    key = str(key)
+                    remaining -= len(key)
+                    sensitive = is_sensitive.get(key)
+                    if sensitive is None:
+                        sensitive = key.lower() in sensitive_keys
+                        is_sensitive[key] = sensitive
+                    if sensitive:
+                        masked[key] = MASKED_VALUE
+                    else:
+                        masked[key] = walk(item, depth + 1)
+                return masked
+            if isinstance(value, list):
+                if depth >= max_depth:
+                    return TRUNCATED_VALUE
+                masked = []
+                for item in value:
+                    if remaining <= 0:
+                        masked.append(TRUNCATED_VALUE)
+                        break
+                    masked.append(walk(item, depth + 1))
+                return masked
+            if isinstance(value, str):
+                if (
+                    value.startswith(("{", "["))
+                    and len(value) <= remaining
+                    and depth < max_depth
+                ):
+                    try:
+                        parsed = json_loads(value)
+                    except ValueError:
+                        parsed = None
+                    if isinstance(parsed, (dict, list)):
+                        return json_dumps(walk(parsed, depth + 1))
+                if len(value) > remaining:
+                    value = value[: max(remaining, 0)] + TRUNCATED_VALUE
+                remaining -= len(value)
+                return value
+            remaining -= 8
+            return value
+
+        return walk(data, 0)
 
 
 def get_client_ip(request: Request) -> str:
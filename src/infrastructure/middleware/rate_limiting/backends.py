@@ -0,0 +1,287 @@
+import asyncio
+import fcntl
+import hashlib
+import mmap
+import os
+import stat
+import struct
+import tempfile
+from abc import ABC, abstractmethod
+from time import time
+from typing import Optional, Tuple
+
+from .resp import RedisError, RespConnection
+from .store import SlidingWindowStore
+
+
+def _sliding_count(
+    current: int, previous: int, window: int, now: float
+) -> Tuple[int, float]:
+    elapsed = now % window
+    count = previous * (1 - elapsed / window) + current
+    return int(count), window - elapsed
+
+
+def _check_private(status: os.stat_result, path: str, file_type: int) -> None:
+    """Refuse paths another local user could have planted or can write."""
+    kind = "directory" if file_type == stat.S_IFDIR else "regular file"
+    if (
+        stat.S_IFMT(status.st_mode) != file_type
+        or status.st_uid != os.getuid()
+        or status.st_mode & 0o077
+        or (file_type == stat.S_IFREG and status.st_nlink != 1)
+    ):
+        raise PermissionError(
+            f"{path} must be a {kind} owned by the current user, "
+            "with no group or other permissions"
+        )
+
+
+def default_shared_memory_path() -> str:
+    """
+    Rate limit file in a directory only the current user can access:
+    $XDG_RUNTIME_DIR when set, otherwise a per-user 0700 directory under
+    the temporary directory.
+    """
+    directory = os.environ.get("XDG_RUNTIME_DIR")
+    if not directory:
+        directory = os.path.join(
+            tempfile.gettempdir(), f"what_the_feed-{os.getuid()}"
+        )
+        try:
+            os.mkdir(directory, 0o700)
+        except FileExistsError:
+            pass
+    _check_private(os.lstat(directory), directory, stat.S_IFDIR)
+    return os.path.join(directory, "what_the_feed_ratelimit")
+
+
+class RateLimitStore(ABC):
+    """Async interface of the rate limit state backends."""
+
+    @abstractmethod
+    async def hit(self, key: str, window: int) -> Tuple[int, float]:
+        """
+        Record a request of `key` and return the sliding count before it
+        together with the time until the current window resets.
+        """
+        pass
+
+    async def close(self) -> None:
+        """Release the resources held by the backend."""
+        pass
+
+
+class MemoryRateLimitStore(RateLimitStore):
+    """Per-process state; each worker enforces the limit on its own."""
+
+    def __init__(self, max_clients: int = 100_000):
+        self.store = SlidingWindowStore(max_clients=max_clients)
+
+    async def hit(self, key: str, window: int) -> Tuple[int, float]:
+        return self.store.hit(key, window)
+
+
+class SharedMemoryRateLimitStore(RateLimitStore):
+    """
+    State shared by the workers of one host through a memory-mapped
+    file.
+
+    The file is a fixed open-addressing table of
+    (key hash, window index, current count, previous count) slots, so
+    its size bounds the tracked clients. When the probed slots are all
+    taken the one with the oldest window is reused. Updates hold an
+    exclusive `flock` on the file for the few microseconds they take;
+    the lock is taken without blocking and retried with a short backoff,
+    so a contested lock never stalls the event loop.
+
+    The file must not be a symlink and must be a regular file owned by
+    the current user, with no group or other permissions, before it is
+    resized, so a file planted by another user is never written.
+    """
+
+    _SLOT = struct.Struct("<QqII")
+    _PROBES = 8
+    _LOCK_RETRY_SECONDS = (0.0001, 0.01)
+
+    def __init__(self, path: str, slots: int = 65_536):
+        self.path = path
+        self.slots = slots
+        size = slots * self._SLOT.size
+        self._fd = os.open(
+            path,
+            os.O_RDWR | os.O_CREAT | os.O_NOFOLLOW | os.O_CLOEXEC,
+            0o600,
+        )
+        try:
+            _check_private(os.fstat(self._fd), path, stat.S_IFREG)
+        except PermissionError:
+            os.close(self._fd)
+            raise
+        if os.fstat(self._fd).st_size != size:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                if os.fstat(self._fd).st_size != size:
+                    os.ftruncate(self._fd, size)
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+        self._map = mmap.mmap(self._fd, size)
+
+    @staticmethod
+    def _hash(key: str) -> int:
+        digest = hashlib.blake2b(key.encode(), digest_size=8).digest()
+        return int.from_bytes(digest, "little") or 1
+
+    def _find_slot(self, key_hash: int) -> Tuple[int, tuple]:
+        slot_size = self._SLOT.size
+        victim = None
+        for probe in range(self._PROBES):
+            offset = ((key_hash + probe) % self.slots) * slot_size
+            slot = self._SLOT.unpack_from(self._map, offset)
+            if slot[0] == key_hash or slot[0] == 0:
+                return offset, slot
+            if victim is None or slot[1] < victim[1][1]:
+                victim = (offset, slot)
+        return victim[0], (0, 0, 0, 0)
+
+    async def _lock(self) -> None:
+        delay, max_delay = self._LOCK_RETRY_SECONDS
+        while True:
+            try:
+                fcntl.flock(self._fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return
+            except BlockingIOError:
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, max_delay)
+
+    async def hit(self, key: str, window: int) -> Tuple[int, float]:
+        key_hash = self._hash(key)
+
+        await self._lock()
+        now = time()
+        window_index = int(now // window)
+        try:
+            offset, (stored_hash, stored_index, current, previous) = (
+                self._find_slot(key_hash)
+            )
+            if stored_hash != key_hash or stored_index < window_index - 1:
+                current = previous = 0
+            elif stored_index == window_index - 1:
+                current, previous = 0, current
+            self._SLOT.pack_into(
+                self._map,
+                offset,
+                key_hash,
+                window_index,
+                current + 1,
+                previous,
+            )
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        return _sliding_count(current, previous, window, now)
+
+    async def close(self) -> None:
+        self._map.close()
+        os.close(self._fd)
+
+
+class RedisRateLimitStore(RateLimitStore):
+    """
+    State shared by every replica through Redis.
+
+    Each client has one counter per fixed window, named after the window
+    index and expiring after two windows. By default a Lua script bumps
+    the current counter and reads the previous one in a single atomic
+    call; with `use_lua=False` the same is done with a pipelined
+    INCR + PEXPIRE + GET.
+    """
+
+    _SCRIPT = (
+        "local current = redis.call('INCR', KEYS[1]) "
+        "if current == 1 then redis.call('PEXPIRE', KEYS[1], ARGV[1]) end "
+        "return {current - 1, tonumber(redis.call('GET', KEYS[2])) or 0}"
+    )
+
+    def __init__(
+        self,
+        url: str = "redis://localhost:6379/0",
+        *,
+        prefix: str = "ratelimit",
+        use_lua: bool = True,
+        timeout_seconds: float = 1.0,
+        connection: RespConnection = None,
+    ):
+        self.prefix = prefix
+        self.use_lua = use_lua
+        self.connection = connection or RespConnection(
+            url, timeout_seconds=timeout_seconds
+        )
+        self._script_sha = None
+
+    async def _counts(
+        self, current_key: str, previous_key: str, ttl_ms: int
+    ) -> Tuple[int, int]:
+        if not self.use_lua:
+            current, _, previous = await self.connection.pipeline(
+                ("INCR", current_key),
+                ("PEXPIRE", current_key, ttl_ms),
+                ("GET", previous_key),
+            )
+            if isinstance(current, RedisError):
+                raise current
+            return current - 1, int(previous or 0)
+
+        keys = (2, current_key, previous_key, ttl_ms)
+        if self._script_sha is None:
+            sha = await self.connection.execute("SCRIPT", "LOAD", self._SCRIPT)
+            self._script_sha = sha.decode() if isinstance(sha, bytes) else sha
+        try:
+            reply = await self.connection.execute(
+                "EVALSHA", self._script_sha, *keys
+            )
+        except RedisError as exp:
+            if not str(exp).startswith("NOSCRIPT"):
+                raise
+            reply = await self.connection.execute("EVAL", self._SCRIPT, *keys)
+        return reply[0], reply[1]
+
+    async def hit(self, key: str, window: int) -> Tuple[int, float]:
+        now = time()
+        window_index = int(now // window)
+        current, previous = await self._counts(
+            f"{self.prefix}:{key}:{window_index}",
+            f"{self.prefix}:{key}:{window_index - 1}",
+            window * 2000,
+        )
+        return _sliding_count(current, previous, window, now)
+
+    async def close(self) -> None:
+        await self.connection.close()
+
+
+def create_rate_limit_store(
+    backend: str = "memory",
+    *,
+    max_clients: int = 100_000,
+    shared_memory_path: Optional[str] = None,
+    shared_memory_slots: int = 65_536,
+    redis_url: str = "redis://localhost:6379/0",
+    redis_timeout_seconds: float = 1.0,
+) -> RateLimitStore:
+    """
+    Build the store named by `backend`: memory, shared_memory, redis.
+    Without a `shared_memory_path` the file goes to a private runtime
+    directory (see `default_shared_memory_path`).
+    """
+    if backend == "memory":
+        return MemoryRateLimitStore(max_clients=max_clients)
+    if backend == "shared_memory":
+        return SharedMemoryRateLimitStore(
+            shared_memory_path or default_shared_memory_path(),
+            slots=shared_memory_slots,
+        )
+    if backend == "redis":
+        return RedisRateLimitStore(
+            redis_url, timeout_seconds=redis_timeout_seconds
+        )
+    raise ValueError(f"Unknown rate limit backend: {backend}")
@@ -1,62 +1,68 @@
-from fastapi import Request, Response
-from starlette.middleware.base import RequestResponseEndpoint
+from starlette.datastructures import Headers, MutableHeaders
 from starlette.responses import JSONResponse
 from starlette.status import HTTP_429_TOO_MANY_REQUESTS
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from loguru import logger
 
-from .store import InMemoryStore
-from ..logging.base import BaseCustomMiddleware
+from .backends import MemoryRateLimitStore, RateLimitStore
 
 
 class RateLimitExceeded(Exception):
     pass
 
 
-class RateLimitingMiddleware(BaseCustomMiddleware):
+class RateLimitingMiddleware:
     def __init__(
         self,
-        app,
+        app: ASGIApp,
         *,
         requests_limit: int = 100,
         window_seconds: int = 60,
         exclude_paths: set[str] = None,
+        max_clients: int = 100_000,
+        store: RateLimitStore = None,
     ):
-        super().__init__(app)
-        self.store = InMemoryStore()
+        self.app = app
+        self.store = store or MemoryRateLimitStore(max_clients=max_clients)
         self.requests_limit = requests_limit
         self.window_seconds = window_seconds
         self.exclude_paths = exclude_paths or set()
 
     @staticmethod
-    def _get_client_key(request: Request) -> str:
-        forwarded = request.headers.get("x-forwarded-for")
+    def _get_client_key(scope: Scope) -> str:
+        forwarded = Headers(scope=scope).get("x-forwarded-for")
         if forwarded:
             return forwarded.split(",")[0].strip()
-        return request.client.host if request.client else "unknown"
+        client = scope.get("client")
+        return client[0] if client else "unknown"
 
-    def _should_skip_rate_limiting(self, request: Request) -> bool:
-        return request.url.path in self.exclude_paths
+    def _should_skip_rate_limiting(self, scope: Scope) -> bool:
+        return scope["path"] in self.exclude_paths
 
-    async def dispatch(
-        self, request: Request, call_next: RequestResponseEndpoint
-    ) -> Response:
-        if self._should_skip_rate_limiting(request):
-            return await call_next(request)
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        if scope["type"] != "http" or self._should_skip_rate_limiting(scope):
+            await self.app(scope, receive, send)
+            return
 
-        client_key = self._get_client_key(request)
+        client_key = self._get_client_key(scope)
 
-        requests_count, time_until_reset = self.store.get_requests_count(
-            client_key, self.window_seconds
-        )
-
-        self.store.add_request(client_key)
+        try:
+            requests_count, time_until_reset = await self.store.hit(
+                client_key, self.window_seconds
+            )
+        except Exception as exp:
+            logger.error(f"Rate limit store unavailable, allowing: {exp}")
+            await self.app(scope, receive, send)
+            return
 
         if requests_count >= self.requests_limit:
             logger.warning(
                 f"Rate limit exceeded for client {client_key}. "
                 f"Count: {requests_count}, Limit: {self.requests_limit}"
             )
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=HTTP_429_TOO_MANY_REQUESTS,
                 content={
                     "error": "Rate limit exceeded",
@@ -72,12 +78,19 @@ class RateLimitingMiddleware(BaseCustomMiddleware):
                     "X-RateLimit-Reset": str(round(time_until_reset)),
                 },
             )
+            await response(scope, receive, send)
+            return
+
+        limit = str(self.requests_limit)
+        remaining = str(self.requests_limit - requests_count - 1)
+        reset = str(round(time_until_reset))
 
-        response = await call_next(request)
-        response.headers["X-RateLimit-Limit"] = str(self.requests_limit)
-        response.headers["X-RateLimit-Remaining"] = str(
-            self.requests_limit - requests_count - 1
-        )
-        response.headers["X-RateLimit-Reset"] = str(round(time_until_reset))
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers["X-RateLimit-Limit"] = limit
+                headers["X-RateLimit-Remaining"] = remaining
+                headers["X-RateLimit-Reset"] = reset
+            await send(message)
 
-        return response
+        await self.app(scope, receive, send_with_headers)
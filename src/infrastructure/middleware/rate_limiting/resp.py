@@ -0,0 +1,162 @@
+import asyncio
+from collections import deque
+from typing import Any, Deque, List, Optional, Sequence, Tuple
+from urllib.parse import urlparse
+
+
+class RedisError(Exception):
+    pass
+
+
+def _encode_command(args: Sequence[Any]) -> bytes:
+    parts = [b"*%d\r\n" % len(args)]
+    for arg in args:
+        if not isinstance(arg, bytes):
+            arg = str(arg).encode()
+        parts.append(b"$%d\r\n%s\r\n" % (len(arg), arg))
+    return b"".join(parts)
+
+
+class RespConnection:
+    """
+    Minimal pipelined client for the Redis protocol (RESP2).
+
+    Commands are written as soon as they are issued and their replies
+    are matched in order by a reader task, so concurrent requests share
+    one connection without waiting for each other's round trips. A
+    command not answered within `timeout_seconds` raises `TimeoutError`
+    and drops the connection, which is reopened by the next command.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        connect_timeout_seconds: float = 2.0,
+        timeout_seconds: float = 1.0,
+    ):
+        parsed = urlparse(url)
+        self.host = parsed.hostname or "localhost"
+        self.port = parsed.port or 6379
+        self.password = parsed.password
+        self.db = int(parsed.path.lstrip("/") or 0)
+        self.connect_timeout_seconds = connect_timeout_seconds
+        self.timeout_seconds = timeout_seconds
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._pending: Deque[asyncio.Future] = deque()
+        self._reader_task: Optional[asyncio.Task] = None
+        self._connect_lock = asyncio.Lock()
+
+    async def _connect(self) -> None:
+        async with self._connect_lock:
+            if self._writer is not None:
+                return
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port),
+                self.connect_timeout_seconds,
+            )
+            self._reader, self._writer = reader, writer
+            self._reader_task = asyncio.create_task(self._read_replies())
+            setup: List[Tuple[Any, ...]] = []
+            if self.password:
+                setup.append(("AUTH", self.password))
+            if self.db:
+                setup.append(("SELECT", self.db))
+            try:
+                for reply in await self._send_with_timeout(setup):
+                    if isinstance(reply, RedisError):
+                        raise reply
+            except BaseException as exp:
+                self._fail_pending(exp)
+                raise
+
+    async def _read_reply(self) -> Any:
+        line = await self._reader.readuntil(b"\r\n")
+        kind, payload = line[:1], line[1:-2]
+        if kind == b"+":
+            return payload.decode()
+        if kind == b"-":
+            return RedisError(payload.decode())
+        if kind == b":":
+            return int(payload)
+        if kind == b"$":
+            length = int(payload)
+            if length < 0:
+                return None
+            return (await self._reader.readexactly(length + 2))[:-2]
+        if kind == b"*":
+            length = int(payload)
+            if length < 0:
+                return None
+            return [await self._read_reply() for _ in range(length)]
+        raise RedisError(f"Unexpected reply type: {line!r}")
+
+    async def _read_replies(self) -> None:
+        try:
+            while True:
+                reply = await self._read_reply()
+                future = self._pending.popleft()
+                if not future.done():
+                    future.set_result(reply)
+        except Exception as exp:
+            self._fail_pending(exp)
+
+    def _fail_pending(self, exp: Exception) -> None:
+        if self._reader_task is not None:
+            if self._reader_task is not asyncio.current_task():
+                self._reader_task.cancel()
+            self._reader_task = None
+        if self._writer is not None:
+            self._writer.close()
+        self._reader = self._writer = None
+        error = ConnectionError(f"Redis connection lost: {exp}")
+        while self._pending:
+            future = self._pending.popleft()
+            if not future.done():
+                future.set_exception(error)
+
+    async def _send(self, commands: Sequence[Sequence[Any]]) -> List[Any]:
+        loop = asyncio.get_running_loop()
+        futures = [loop.create_future() for _ in commands]
+        self._pending.extend(futures)
+        self._writer.write(b"".join(map(_encode_command, commands)))
+        await self._writer.drain()
+        return list(await asyncio.gather(*futures))
+
+    async def _send_with_timeout(
+        self, commands: Sequence[Sequence[Any]]
+    ) -> List[Any]:
+        try:
+            return await asyncio.wait_for(
+                self._send(commands), self.timeout_seconds
+            )
+        except TimeoutError:
+            error = TimeoutError(
+                f"Redis did not reply within {self.timeout_seconds}s"
+            )
+            self._fail_pending(error)
+            raise error
+
+    async def pipeline(self, *commands: Sequence[Any]) -> List[Any]:
+        """
+        Send the commands in one write and return their replies; error
+        replies are returned as `RedisError` instances.
+        """
+        if self._writer is None:
+            await self._connect()
+        return await self._send_with_timeout(commands)
+
+    async def execute(self, *args: Any) -> Any:
+        (reply,) = await self.pipeline(args)
+        if isinstance(reply, RedisError):
+            raise reply
+        return reply
+
+    async def close(self) -> None:
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            self._reader_task = None
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+            self._reader = None
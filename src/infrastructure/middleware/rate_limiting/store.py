@@ -1,32 +1,83 @@
-from typing import Dict, Tuple
+from typing import Tuple
 from time import time
-from collections import defaultdict
+from collections import OrderedDict
 
 
-class InMemoryStore:
-    def __init__(self):
-        self._requests: Dict[str, list] = defaultdict(list)
+class SlidingWindowStore:
+    """
+    Sliding-window counter store with O(1) work per request.
 
-    def add_request(self, key: str, timestamp: float = None) -> None:
-        if timestamp is None:
-            timestamp = time()
-        self._requests[key].append(timestamp)
+    Each client keeps the counts of the current and previous fixed
+    windows; the sliding count weighs the previous window by how much of
+    it still overlaps the sliding window. Clients are kept in access
+    order, so idle ones are evicted from the front and the number of
+    tracked clients never exceeds `max_clients`.
+    """
 
-    def clean_old_requests(self, key: str, window: int) -> None:
-        if key in self._requests:
-            current_time = time()
-            self._requests[key] = [
-                ts for ts in self._requests[key] if current_time - ts < window
-            ]
+    def __init__(
+        self,
+        max_clients: int = 100_000,
+        eviction_interval_seconds: float = 60,
+    ):
+        self.max_clients = max_clients
+        self.eviction_interval_seconds = eviction_interval_seconds
+        # key -> [window_start, current_count, previous_count, last_seen]
+        self._clients: OrderedDict[str, list] = OrderedDict()
+        self._next_eviction = 0.0
+        self.evicted = 0
 
-    def get_requests_count(self, key: str, window: int) -> Tuple[int, float]:
-        self.clean_old_requests(key, window)
+    def __len__(self) -> int:
+        return len(self._clients)
 
-        if not self._requests[key]:
-            return 0, 0
+    def _entry(self, key: str, window: int, now: float) -> list:
+        window_start = now - now % window
+        entry = self._clients.get(key)
+        if entry is None:
+            entry = [window_start, 0, 0, now]
+            self._clients[key] = entry
+            if len(self._clients) > self.max_clients:
+                self._clients.popitem(last=False)
+                self.evicted += 1
+            return entry
 
-        current_time = time()
-        oldest_timestamp = min(self._requests[key])
-        time_until_reset = max(0, window - (current_time - oldest_timestamp))
+        self._clients.move_to_end(key)
+        if entry[0] != window_start:
+            elapsed_windows = (window_start - entry[0]) // window
+            entry[2] = entry[1] if elapsed_windows == 1 else 0
+            entry[1] = 0
+            entry[0] = window_start
+        entry[3] = now
+        return entry
 
-        return len(self._requests[key]), time_until_reset
+    @staticmethod
+    def _count(entry: list, window: int, now: float) -> Tuple[int, float]:
+        elapsed = now - entry[0]
+        count = entry[2] * (1 - elapsed / window) + entry[1]
+        return int(count), window - elapsed
+
+    def _evict_idle(self, window: int, now: float) -> None:
+        """Drop clients idle for two windows, oldest access first."""
+        if now < self._next_eviction:
+            return
+        self._next_eviction = now + self.eviction_interval_seconds
+        clients = self._clients
+        while clients:
+            key, entry = next(iter(clients.items()))
+            if now - entry[3] < 2 * window:
+                break
+            del clients[key]
+            self.evicted += 1
+
+    def hit(
+        self, key: str, window: int, timestamp: float = None
+    ) -> Tuple[int, float]:
+        """
+        Record a request and return the count before it together with
+        the time until the current window resets.
+        """
+        now = time() if timestamp is None else timestamp
+        self._evict_idle(window, now)
+        entry = self._entry(key, window, now)
+        count, time_until_reset = self._count(entry, window, now)
+        entry[1] += 1
+        return count, time_until_reset
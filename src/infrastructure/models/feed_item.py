@@ -0,0 +1,38 @@
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from sqlalchemy import JSON, DateTime, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.seedwork.infra.defaults import AbstractCreatedModel
+from src.seedwork.infra.defaults.base import Base
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class FeedItemModel(Base, AbstractCreatedModel):
+    """
+    Items fetched from the feed sources. Dates are timezone aware, as
+    the parser produces them; feeds are identified by their URL.
+    """
+
+    __tablename__ = "feed_item"
+
+    feed_item_id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    guid: Mapped[str] = mapped_column(String(2048), unique=True, index=True)
+    feed_source_id: Mapped[Optional[str]] = mapped_column(
+        String(2048), index=True
+    )
+    title: Mapped[str] = mapped_column(String(1024))
+    content: Mapped[str] = mapped_column(Text)
+    link: Mapped[str] = mapped_column(String(2048))
+    published_date: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), index=True
+    )
+    author: Mapped[Optional[str]] = mapped_column(String(256))
+    tags: Mapped[Optional[List[str]]] = mapped_column(JSON)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=_utc_now, index=True
+    )
@@ -0,0 +1,16 @@
+from sqlalchemy import String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.seedwork.infra.defaults import AbstractCreatedModel
+from src.seedwork.infra.defaults.base import Base
+
+
+class SeenItemModel(Base, AbstractCreatedModel):
+    """Identity keys (guid, link, content hash) of already seen items"""
+
+    __tablename__ = "seen_item"
+
+    seen_item_id: Mapped[int] = mapped_column(
+        primary_key=True, autoincrement=True
+    )
+    key: Mapped[str] = mapped_column(String(512), unique=True, index=True)
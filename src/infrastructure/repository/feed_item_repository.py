@@ -0,0 +1,96 @@
+from typing import Any, Dict, List
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.feed.entities.feed_item import FeedItem
+from src.domain.feed.repositories.feed_item_repository import (
+    FeedItemRepository,
+)
+from src.domain.feed.services.item_fingerprint import content_hash
+from src.infrastructure.common.db.sessions import DatabaseSessions
+from src.infrastructure.config.settings import settings
+from src.infrastructure.models.feed_item import FeedItemModel
+
+_UPDATABLE_COLUMNS = (
+    "feed_source_id",
+    "title",
+    "content",
+    "link",
+    "published_date",
+    "author",
+    "tags",
+)
+
+
+def _as_row(item: FeedItem) -> Dict[str, Any]:
+    """
+    Items without a guid are keyed by their link, and items without
+    either by their content hash, so the unique guid is never empty.
+    """
+    return {
+        "feed_item_id": item.id,
+        "guid": item.guid or item.link or content_hash(item),
+        "feed_source_id": item.feed_source_id,
+        "title": item.title,
+        "content": item.content,
+        "link": item.link,
+        "published_date": item.published_date,
+        "author": item.author,
+        "tags": item.tags,
+    }
+
+
+def _as_item(model: FeedItemModel) -> FeedItem:
+    """
+    Inverse of `_as_row`: a guid that is only the link or content hash
+    fallback is not restored, so the item keeps the identity it had when
+    it was fetched.
+    """
+    item = FeedItem(
+        model.title,
+        model.content,
+        model.link,
+        model.published_date,
+        feed_id=model.feed_item_id,
+        author=model.author,
+        feed_source_id=model.feed_source_id,
+        tags=model.tags,
+    )
+    if model.guid not in (model.link, content_hash(item)):
+        item.guid = model.guid
+    return item
+
+
+class SqlFeedItemRepository(FeedItemRepository):
+    """SQLAlchemy backed store of fetched items, written in bulk."""
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        batch_size: int = settings.FEED_ITEM_BATCH_SIZE,
+    ):
+        self.session = session
+        self.batch_size = batch_size
+        self.database_session = DatabaseSessions()
+
+    async def add_many(
+        self, items: List[FeedItem], update_existing: bool = False
+    ) -> int:
+        rows = list({row["guid"]: row for row in map(_as_row, items)}.values())
+        return await self.database_session.bulk_upsert_session(
+            self.session,
+            FeedItemModel,
+            rows,
+            conflict_columns=("guid",),
+            update_columns=_UPDATABLE_COLUMNS if update_existing else None,
+            batch_size=self.batch_size,
+        )
+
+    async def recent(self, limit: int) -> List[FeedItem]:
+        rows = await self.session.scalars(
+            select(FeedItemModel)
+            .order_by(FeedItemModel.published_date.desc())
+            .limit(limit)
+        )
+        return [_as_item(row) for row in rows]
@@ -0,0 +1,53 @@
+from typing import AsyncIterator, List
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.feed.repositories.seen_item_repository import (
+    SeenItemRepository,
+)
+from src.infrastructure.models.seen_item import SeenItemModel
+
+
+class SqlSeenItemRepository(SeenItemRepository):
+    """SQLAlchemy backed index of seen item keys."""
+
+    def __init__(self, session: AsyncSession, chunk_size: int = 500):
+        self.session = session
+        self.chunk_size = chunk_size
+
+    async def contains(self, key: str) -> bool:
+        result = await self.session.execute(
+            select(SeenItemModel.seen_item_id)
+            .where(SeenItemModel.key == key)
+            .limit(1)
+        )
+        return result.first() is not None
+
+    async def add_many(self, keys: List[str]) -> None:
+        keys = list(dict.fromkeys(keys))
+        try:
+            for start in range(0, len(keys), self.chunk_size):
+                end = start + self.chunk_size
+                chunk = keys[start:end]
+                existing = set(
+                    await self.session.scalars(
+                        select(SeenItemModel.key).where(
+                            SeenItemModel.key.in_(chunk)
+                        )
+                    )
+                )
+                rows = [{"key": key} for key in chunk if key not in existing]
+                if rows:
+                    await self.session.execute(insert(SeenItemModel), rows)
+            await self.session.commit()
+        except Exception as e:
+            await self.session.rollback()
+            raise e
+
+    async def all_keys(self) -> AsyncIterator[str]:
+        keys = await self.session.stream_scalars(
+            select(SeenItemModel.key).execution_options(yield_per=10_000)
+        )
+        async for key in keys:
+            yield key
@@ -0,0 +1,162 @@
+import heapq
+import math
+import re
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from src.domain.feed.entities.feed_item import FeedItem
+from src.domain.feed.services.item_fingerprint import item_keys
+from src.seedwork.infra.utils.pagination import Pagination
+from .models import SearchHit, SearchPage
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    return _TOKEN_PATTERN.findall(text.lower()) if text else []
+
+
+class InvertedIndex:
+    """
+    In-memory inverted index over feed item titles and contents.
+
+    Items are added incrementally as feeds are fetched. A query only
+    walks the postings of its own terms, so latency depends on how many
+    items contain those terms rather than on the archive size. Hits are
+    ranked with BM25 (title terms weigh `title_boost` times more) and
+    paginated with an opaque (score, key) cursor.
+
+    Items are keyed by their identity (guid, else normalized link, else
+    content hash) rather than by `FeedItem.id`, which is new on every
+    parse, so re-adding a refetched item replaces it.
+
+    The index only holds the `max_items` most recently added items; the
+    oldest are evicted as new ones arrive. Fetched items are stored in
+    the `feed_item` table, which the application reloads the index from
+    on startup.
+    """
+
+    def __init__(
+        self,
+        k1: float = 1.2,
+        b: float = 0.75,
+        title_boost: int = 2,
+        max_items: Optional[int] = None,
+    ):
+        self.k1 = k1
+        self.b = b
+        self.title_boost = title_boost
+        self.max_items = max_items
+        self._postings: Dict[str, Dict[str, int]] = {}
+        self._items: Dict[str, FeedItem] = {}
+        self._terms: Dict[str, Counter] = {}
+        self._lengths: Dict[str, int] = {}
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def _term_frequencies(self, item: FeedItem) -> Counter:
+        frequencies = Counter(tokenize(item.content))
+        for term in tokenize(item.title):
+            frequencies[term] += self.title_boost
+        return frequencies
+
+    @staticmethod
+    def item_key(item: FeedItem) -> str:
+        return item_keys(item)[0]
+
+    def add(self, item: FeedItem) -> None:
+        key = self.item_key(item)
+        self._discard(key)
+
+        frequencies = self._term_frequencies(item)
+        self._items[key] = item
+        self._terms[key] = frequencies
+        self._lengths[key] = sum(frequencies.values())
+        self._total_length += self._lengths[key]
+        for term, frequency in frequencies.items():
+            self._postings.setdefault(term, {})[key] = frequency
+        if self.max_items is not None and len(self._items) > self.max_items:
+            self._discard(next(iter(self._items)))
+
+    def add_many(self, items: Iterable[FeedItem]) -> None:
+        for item in items:
+            self.add(item)
+
+    def remove(self, item: FeedItem) -> None:
+        self._discard(self.item_key(item))
+
+    def _discard(self, key: str) -> None:
+        frequencies = self._terms.pop(key, None)
+        if frequencies is None:
+            return
+        del self._items[key]
+        self._total_length -= self._lengths.pop(key)
+        for term in frequencies:
+            postings = self._postings[term]
+            del postings[key]
+            if not postings:
+                del self._postings[term]
+
+    def _scores(
+        self, terms: List[str], feed_source_ids: Optional[Set[str]]
+    ) -> Dict[str, float]:
+        total_items = len(self._items)
+        average_length = self._total_length / total_items
+        scores: Dict[str, float] = {}
+        for term in set(terms):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(
+                1 + (total_items - len(postings) + 0.5) / (len(postings) + 0.5)
+            )
+            for key, frequency in postings.items():
+                if (
+                    feed_source_ids is not None
+                    and self._items[key].feed_source_id not in feed_source_ids
+                ):
+                    continue
+                norm = self.k1 * (
+                    1 - self.b + self.b * self._lengths[key] / average_length
+                )
+                scores[key] = scores.get(key, 0.0) + idf * (
+                    frequency * (self.k1 + 1) / (frequency + norm)
+                )
+        return scores
+
+    def search(
+        self,
+        query: str,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        feed_source_ids: Optional[Set[str]] = None,
+    ) -> SearchPage:
+        """
+        Rank the items matching any query term. `feed_source_ids`
+        restricts the search, e.g. to the feeds of the user's mixers.
+        """
+        terms = tokenize(query)
+        if not terms or not self._items:
+            return SearchPage()
+
+        scores = self._scores(terms, feed_source_ids)
+        candidates: Iterable[Tuple[float, str]] = (
+            (-score, key) for key, score in scores.items()
+        )
+        if cursor is not None:
+            last_score, last_key = Pagination.decode_cursor(cursor)
+            after = (-last_score, last_key)
+            candidates = (key for key in candidates if key > after)
+
+        page = heapq.nsmallest(limit + 1, candidates)
+        hits = [
+            SearchHit(self._items[key], -negative_score)
+            for negative_score, key in page[:limit]
+        ]
+        next_cursor = None
+        if len(page) > limit:
+            last_score, last_key = page[limit - 1]
+            next_cursor = Pagination.encode_cursor([-last_score, last_key])
+        return SearchPage(hits, len(scores), next_cursor)
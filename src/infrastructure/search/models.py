@@ -0,0 +1,17 @@
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from src.domain.feed.entities.feed_item import FeedItem
+
+
+@dataclass
+class SearchHit:
+    item: FeedItem
+    score: float
+
+
+@dataclass
+class SearchPage:
+    hits: List[SearchHit] = field(default_factory=list)
+    total_hits: int = 0
+    next_cursor: Optional[str] = None
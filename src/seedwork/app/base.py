@@ -5,7 +5,9 @@ from src.seedwork.infra.repository.base import (
     GetManyRepository,
     PostRepository,
     PutRepository,
+    PutManyRepository,
     DeleteRepository,
+    DeleteManyRepository,
 )
 
 
@@ -48,7 +50,19 @@ class PutService(GenericService):
         super().__init__(repository)
 
 
+class PutManyService(GenericService):
+
+    def __init__(self, repository: PutManyRepository):
+        super().__init__(repository)
+
+
 class DeleteService(GenericService):
 
     def __init__(self, repository: DeleteRepository):
         super().__init__(repository)
+
+
+class DeleteManyService(GenericService):
+
+    def __init__(self, repository: DeleteManyRepository):
+        super().__init__(repository)
@@ -1,7 +1,7 @@
 import sys
 from typing import List, Optional, Type
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import APIRouter, Depends, Request, status, HTTPException
 from loguru import logger
 from src.seedwork.app.base import (
@@ -9,15 +9,20 @@ from src.seedwork.app.base import (
     GetManyService,
     PostService,
     PutService,
+    PutManyService,
     DeleteService,
+    DeleteManyService,
 )
 from src.seedwork.infra.defaults.base import Base
+from src.seedwork.infra.utils.count import CountStrategy
 from src.seedwork.infra.repository.base import (
     GetOneRepository,
     GetManyRepository,
     PostRepository,
     PutRepository,
+    PutManyRepository,
     DeleteRepository,
+    DeleteManyRepository,
 )
 
 # from infra.common.logging import LogAPIRoute
@@ -25,6 +30,7 @@ from src.seedwork.infra.schemas.base import (
     GetGenericInput,
     GetGenericOutput,
     DeleteGenericOutput,
+    ManyGenericInput,
 )
 
 
@@ -53,15 +59,24 @@ class GetApi:
         self,
         request: Request,
         model: Type[Base],
-        session: Session,
+        session: AsyncSession,
         output_param: GetGenericOutput,
         input_params: GetGenericInput = Depends(),
+        cursor_pagination: bool = False,
+        count_strategy: CountStrategy = CountStrategy.EXACT,
     ) -> BaseModel:
         try:
             url = request.url
             input_params._actual_page = f"{url.path}?{url.query}"
             usecase = GetManyService(
-                GetManyRepository(model, input_params, output_param, session)
+                GetManyRepository(
+                    model,
+                    input_params,
+                    output_param,
+                    session,
+                    cursor_pagination=cursor_pagination,
+                    count_strategy=count_strategy,
+                )
             )
             output = await usecase.execute()
             return output
@@ -75,7 +90,7 @@ class GetApi:
         self,
         request: Request,
         model: Type[Base],
-        session: Session,
+        session: AsyncSession,
         output_param: BaseModel,
         input_params: BaseModel = Depends(),
     ) -> BaseModel:
@@ -97,7 +112,7 @@ class PostApi:
         self,
         request: Request,
         model: Type[Base],
-        session: Session,
+        session: AsyncSession,
         output_param: BaseModel,
         input_params: BaseModel,
     ):
@@ -119,7 +134,7 @@ class PutApi:
         self,
         request: Request,
         model: Type[Base],
-        session: Session,
+        session: AsyncSession,
         output_param: BaseModel,
         input_params: BaseModel,
     ):
@@ -135,13 +150,33 @@ class PutApi:
                 status_code=status.HTTP_400_BAD_REQUEST, detail=detail
             )
 
+    async def put_many_route(
+        self,
+        request: Request,
+        model: Type[Base],
+        session: AsyncSession,
+        output_param: BaseModel,
+        input_params: ManyGenericInput,
+    ):
+        try:
+            usecase = PutManyService(
+                PutManyRepository(model, input_params, output_param, session)
+            )
+            output = await usecase.execute()
+            return [item.model_dump() for item in output]
+        except Exception as exp:
+            detail = f"Put API error {str(exp)}"
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail=detail
+            )
+
 
 class DeleteApi:
     async def delete_route(
         self,
         request: Request,
         model: Type[Base],
-        session: Session,
+        session: AsyncSession,
         output_param: DeleteGenericOutput,
         input_params: BaseModel = Depends(),
     ):
@@ -156,3 +191,25 @@ class DeleteApi:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST, detail=detail
             )
+
+    async def delete_many_route(
+        self,
+        request: Request,
+        model: Type[Base],
+        session: AsyncSession,
+        output_param: DeleteGenericOutput,
+        input_params: ManyGenericInput,
+    ):
+        try:
+            usecase = DeleteManyService(
+                DeleteManyRepository(
+                    model, input_params, output_param, session
+                )
+            )
+            output = await usecase.execute()
+            return output.model_dump()
+        except Exception as exp:
+            detail = f"Delete API error {str(exp)}"
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail=detail
+            )
@@ -1,12 +1,15 @@
-from src.infra.common.db.sessions import DatabaseSessions
+from src.infrastructure.common.db.sessions import DatabaseSessions
 from src.seedwork.infra.utils.pagination import Pagination
 from pydantic import BaseModel
-from typing import Type
+from typing import Any, List, Type
 from src.seedwork.infra.defaults.base import Base
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from loguru import logger
-from sqlalchemy import desc
+from sqlalchemy import ColumnElement, delete, desc, select, update
+from sqlalchemy.sql.dml import Update
+from src.seedwork.infra.utils.count import CountStrategy
 from src.seedwork.infra.utils.filter import Filtering
+from src.seedwork.infra.utils.metadata import ModelRegistry
 from src.seedwork.infra.utils.model import ModelUtils
 from src.seedwork.infra.schemas.pagination import (
     PageResult,
@@ -22,7 +25,7 @@ class GenericRepository:
         model: Type[Base],
         input_schema: BaseModel,
         output_schema: BaseModel,
-        session: Session,
+        session: AsyncSession,
     ):
         self.pagination = Pagination
         self.filtering = Filtering
@@ -32,24 +35,73 @@ class GenericRepository:
         self.output_schema = output_schema
         self.session = session
         self.repository_utils = ModelUtils
-        self._metadata()
-
-    def _metadata(self):
-        self.metadata = {
-            "model": self.model,
-            "primary_key_attr": getattr(
-                self.model, f"{self.model.__tablename__}_id", "id"
-            ),
-            "primary_key_name": self.model.__table__.primary_key.columns.keys()[
-                0
-            ],
-            "columns": self.model.__table__.columns.keys(),
-            "table": self.model.__tablename__,
-        }
+        self.metadata = ModelRegistry.get(self.model)
 
     async def case(self) -> BaseModel:
         pass
 
+    async def _update_returning(
+        self, statement: Update, where: ColumnElement
+    ) -> List[Base]:
+        """
+        UPDATE ... RETURNING em uma ida ao banco quando o dialeto suporta;
+        caso contrário, UPDATE seguido de SELECT das linhas alteradas.
+        """
+        if self.session.get_bind().dialect.update_returning:
+            result = await self.database_session.update_session(
+                self.session,
+                statement.returning(self.model).execution_options(
+                    populate_existing=True
+                ),
+            )
+            return list(result.scalars())
+
+        await self.database_session.update_session(self.session, statement)
+        return list(
+            await self.session.scalars(
+                select(self.model)
+                .where(where)
+                .execution_options(populate_existing=True)
+            )
+        )
+
+    async def _update_rows(
+        self, where: ColumnElement, values: dict
+    ) -> List[Base]:
+        """
+        Atualiza as linhas de `where` com `values` e as retorna; sem
+        valores a alterar, apenas as seleciona.
+        """
+        if not values:
+            return list(
+                await self.session.scalars(select(self.model).where(where))
+            )
+        return await self._update_returning(
+            update(self.model).where(where).values(**values), where
+        )
+
+    async def _delete_returning(self, where: ColumnElement) -> List[Any]:
+        """
+        DELETE ... RETURNING das chaves removidas quando o dialeto
+        suporta; caso contrário, SELECT das chaves seguido de DELETE.
+        """
+        primary_key = self.metadata.primary_key_attr
+        statement = delete(self.model).where(where)
+        if self.session.get_bind().dialect.delete_returning:
+            result = await self.database_session.execute_session(
+                self.session, statement.returning(primary_key)
+            )
+            return list(result.scalars())
+
+        deleted = list(
+            await self.session.scalars(select(primary_key).where(where))
+        )
+        if deleted:
+            await self.database_session.execute_session(
+                self.session, statement
+            )
+        return deleted
+
 
 class GetOneRepository(GenericRepository):
     def __init__(
@@ -57,17 +109,17 @@ class GetOneRepository(GenericRepository):
         model: Type[Base],
         input_schema: BaseModel,
         output_schema: BaseModel,
-        session: Session,
+        session: AsyncSession,
     ):
 
         super().__init__(model, input_schema, output_schema, session)
 
     async def case(self) -> BaseModel | None:
-        query = self.session.query(self.model).order_by(
-            desc(self.metadata.get("primary_key_attr"))
+        query = select(self.model).order_by(
+            desc(self.metadata.primary_key_attr)
         )
         query = self.filtering(query, self.input_schema).query
-        output = query.one_or_none()
+        output = (await self.session.scalars(query)).one_or_none()
         if output:
             return self.output_schema.model_validate(output)
 
@@ -78,23 +130,42 @@ class GetManyRepository(GenericRepository):
         model: Type[Base],
         input_schema: BaseModel,
         output_schema: BaseModel,
-        session: Session,
+        session: AsyncSession,
+        cursor_pagination: bool = False,
+        count_strategy: CountStrategy = CountStrategy.EXACT,
+        count_ttl_seconds: float = 60,
     ):
 
         super().__init__(model, input_schema, output_schema, session)
+        self.cursor_pagination = cursor_pagination
+        self.count_strategy = count_strategy
+        self.count_ttl_seconds = count_ttl_seconds
 
     async def case(self) -> PageResult:
         await self._validated_input()
-        query = self.session.query(self.model).order_by(
-            desc(self.metadata.get("primary_key_attr"))
+        query = select(self.model).order_by(
+            desc(self.metadata.primary_key_attr)
         )
         query = self.filtering(query, self.input_schema).query
-        output = self.pagination.paginate_to_dict(
-            query,
-            self.input_schema.page,
-            self.input_schema.page_size,
-            self.input_schema._actual_page,
-        )
+        if self.cursor_pagination:
+            output = await self.pagination.paginate_by_cursor_to_dict(
+                self.session,
+                query,
+                self.metadata.primary_key_attr,
+                self.input_schema.cursor,
+                self.input_schema.page_size,
+                self.input_schema._actual_page,
+            )
+        else:
+            output = await self.pagination.paginate_to_dict(
+                self.session,
+                query,
+                self.input_schema.page,
+                self.input_schema.page_size,
+                self.input_schema._actual_page,
+                self.count_strategy,
+                self.count_ttl_seconds,
+            )
         return self.output_schema(
             items=output.get("items"),
             links=PageLink(**output),
@@ -105,9 +176,14 @@ class GetManyRepository(GenericRepository):
         try:
             model_utils = self.repository_utils(self.model)
             model_utils.check_model_kwargs(
-                self.input_schema.model_dump(
-                    exclude={"page", "page_size", "_actual_page"}
-                )
+                {
+                    self.filtering.field_column_name(
+                        type(self.input_schema), key
+                    ): value
+                    for key, value in self.input_schema.model_dump(
+                        exclude={"page", "page_size", "cursor", "_actual_page"}
+                    ).items()
+                }
             )
         except AttributeError as aterror:
             raise aterror
@@ -119,14 +195,16 @@ class PostRepository(GenericRepository):
         model: Type[Base],
         input_schema: BaseModel,
         output_schema: BaseModel,
-        session: Session,
+        session: AsyncSession,
     ):
         super().__init__(model, input_schema, output_schema, session)
 
     async def case(self) -> BaseModel:
         insert = self.model(**self.input_schema.model_dump())
 
-        insert = self.database_session.create_session(self.session, insert)
+        insert = await self.database_session.create_session(
+            self.session, insert
+        )
         return self.output_schema.model_validate(insert)
 
 
@@ -136,35 +214,60 @@ class PutRepository(GenericRepository):
         model: Type[Base],
         input_schema: BaseModel,
         output_schema: BaseModel,
-        session: Session,
+        session: AsyncSession,
     ):
         super().__init__(model, input_schema, output_schema, session)
 
     async def case(self) -> BaseModel:
-        put = self.session.query(self.model).filter(
-            self.metadata.get("primary_key_attr")
-            == getattr(
-                self.input_schema, self.metadata.get("primary_key_name")
-            )
-        )
+        primary_key_name = self.metadata.primary_key_name
+        put_id = getattr(self.input_schema, primary_key_name)
         to_update = self.input_schema.model_dump(
             exclude_unset=True,
             exclude_none=True,
-            exclude={self.metadata.get("primary_key_name")},
+            exclude={primary_key_name},
         )
-        result = put.update(to_update)
-        self.database_session.update_session(self.session, put)
-        logger.info(f"Rows updated: {result}")
+        where = self.metadata.primary_key_attr == put_id
+        rows = await self._update_rows(where, to_update)
+        if not rows:
+            logger.error("No item was found to be updated")
+            raise ValueError("Put item not found")
         logger.info(
-            f'{self.input_schema.__repr_name__()} with id: {getattr(self.input_schema, self.metadata.get("primary_key_name"))} changed to {to_update}'
+            "{} with id: {} changed to {}",
+            self.input_schema.__repr_name__(),
+            put_id,
+            to_update,
         )
-        result = self.session.query(self.model).filter(
-            self.metadata.get("primary_key_attr")
-            == getattr(
-                self.input_schema, self.metadata.get("primary_key_name")
-            )
+        return self.output_schema.model_validate(rows[0])
+
+
+class PutManyRepository(GenericRepository):
+    """Aplica os mesmos valores a várias linhas (`ids`) em um só UPDATE"""
+
+    def __init__(
+        self,
+        model: Type[Base],
+        input_schema: BaseModel,
+        output_schema: BaseModel,
+        session: AsyncSession,
+    ):
+        super().__init__(model, input_schema, output_schema, session)
+
+    async def case(self) -> List[BaseModel]:
+        ids = self.input_schema.ids
+        to_update = self.input_schema.model_dump(
+            exclude_unset=True,
+            exclude_none=True,
+            exclude={"ids", self.metadata.primary_key_name},
         )
-        return self.output_schema.model_validate(result.one_or_none())
+        where = self.metadata.primary_key_attr.in_(ids)
+        rows = await self._update_rows(where, to_update)
+        logger.info(
+            "{} rows of {} changed to {}",
+            len(rows),
+            self.metadata.table,
+            to_update,
+        )
+        return [self.output_schema.model_validate(row) for row in rows]
 
 
 class DeleteRepository(GenericRepository):
@@ -173,34 +276,61 @@ class DeleteRepository(GenericRepository):
         model: Type[Base],
         input_schema: BaseModel,
         output_schema: BaseModel,
-        session: Session,
+        session: AsyncSession,
     ):
         super().__init__(model, input_schema, output_schema, session)
 
     async def case(self) -> BaseModel:
-        delete_id = getattr(
-            self.input_schema, self.metadata.get("primary_key_name")
+        delete_id = getattr(self.input_schema, self.metadata.primary_key_name)
+        deleted = await self._delete_returning(
+            self.metadata.primary_key_attr == delete_id
         )
-        delete = (
-            self.session.query(self.model)
-            .filter(self.metadata.get("primary_key_attr") == delete_id)
-            .one()
-        )
-        if not delete:
+        if not deleted:
             logger.error("No item was found to be deleted")
             raise ValueError("Delete item not found")
-        # del_result = item.delete()
-        self.database_session.delete_session(self.session, delete)
-        logger.info("Row deleted")
         logger.info(
-            f"{self.metadata.get('table')} tabled deleted row with id {delete_id}"
+            "{} table deleted row with id {}",
+            self.metadata.table,
+            delete_id,
         )
         return self.output_schema(
             **{
                 "status": "deleted",
                 "metadata": {
-                    "tablename": self.metadata.get("table"),
+                    "tablename": self.metadata.table,
                     "id": delete_id,
                 },
             }
         )
+
+
+class DeleteManyRepository(GenericRepository):
+    """Remove várias linhas (`ids`) em um só DELETE"""
+
+    def __init__(
+        self,
+        model: Type[Base],
+        input_schema: BaseModel,
+        output_schema: BaseModel,
+        session: AsyncSession,
+    ):
+        super().__init__(model, input_schema, output_schema, session)
+
+    async def case(self) -> BaseModel:
+        deleted = await self._delete_returning(
+            self.metadata.primary_key_attr.in_(self.input_schema.ids)
+        )
+        logger.info(
+            "{} table deleted {} rows",
+            self.metadata.table,
+            len(deleted),
+        )
+        return self.output_schema(
+            **{
+                "status": "deleted",
+                "metadata": {
+                    "tablename": self.metadata.table,
+                    "ids": deleted,
+                },
+            }
+        )
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional
+from typing import ClassVar, Dict, Optional
 
 from pydantic import (
     BaseModel,
@@ -40,6 +40,12 @@ class GetInput(PydanticModel):
 
     page: Optional[int] = Field(default=1, gt=0)
     page_size: Optional[int] = Field(default=20, gt=0, le=100)
+    cursor: Optional[str] = Field(
+        default=None, description="Cursor da paginação por cursor (keyset)"
+    )
     _actual_page: Optional[str] = PrivateAttr(default="/")
+    # modo de busca por campo texto: exact, contains, prefix, full_text
+    # ou trigram (ver MatchMode em seedwork.infra.utils.filter)
+    filter_match_modes: ClassVar[Dict[str, str]] = {}
     # sort: str = "desc"
     # order_by: str = "id"
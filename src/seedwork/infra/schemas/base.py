@@ -1,3 +1,5 @@
+from typing import Any, List
+
 from src.seedwork.infra.schemas import GetInput
 from src.seedwork.infra.schemas.pagination import PageResult
 from src.seedwork.infra.schemas import PydanticModel
@@ -14,3 +16,9 @@ class GetGenericOutput(PageResult):
 class DeleteGenericOutput(PydanticModel):
     status: str
     metadata: dict
+
+
+class ManyGenericInput(PydanticModel):
+    "Primary keys affected by a batch PUT/DELETE"
+
+    ids: List[Any]
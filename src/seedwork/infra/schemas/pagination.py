@@ -6,13 +6,23 @@ T = TypeVar("T", bound=BaseModel)
 
 
 class PageMeta(PydanticModel):
-    page: int = Field(description="Página atual")
+    page: Optional[int] = Field(
+        default=None,
+        description="Página atual (vazia na paginação por cursor)",
+    )
     page_size: int = Field(description="Items solicitados por página")
-    total_items: int = Field(
-        description="Total de itens que podem ser consultados"
+    total_items: Optional[int] = Field(
+        default=None, description="Total de itens que podem ser consultados"
+    )
+    total_pages: Optional[int] = Field(
+        default=None,
+        description=(
+            "Total de páginas gerado pelo total de itens dividido pelo "
+            "itens solicitados"
+        ),
     )
-    total_pages: int = Field(
-        description="Total de páginas gerado pelo total de itens dividido pelo itens solicitados"
+    has_more: Optional[bool] = Field(
+        default=None, description="Se existem itens após esta página"
     )
 
 
@@ -24,6 +34,10 @@ class PageLink(PydanticModel):
     actual_page: str = Field(
         description="The actual page url that was queried"
     )
+    next_cursor: Optional[str] = Field(
+        default=None,
+        description="Opaque cursor of the next page, in cursor pagination",
+    )
 
 
 class PageResult(PydanticModel, Generic[T]):
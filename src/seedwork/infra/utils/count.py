@@ -0,0 +1,129 @@
+import time
+from collections import OrderedDict
+from enum import Enum
+from typing import Optional, Tuple
+from weakref import WeakKeyDictionary
+
+from loguru import logger
+from sqlalchemy import Engine, Executable, Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement
+
+CountCache = OrderedDict[Tuple[str, str], Tuple[float, int]]
+
+
+class Explain(Executable, ClauseElement):
+    """
+    `EXPLAIN (FORMAT JSON)` de uma consulta, cujos valores seguem como
+    parâmetros vinculados, nunca interpolados no SQL.
+    """
+
+    inherit_cache = False
+
+    def __init__(self, query: Select):
+        self.query = query
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element: Explain, compiler, **kw) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.query, **kw)
+
+
+class CountStrategy(str, Enum):
+    EXACT = "exact"
+    ESTIMATED = "estimated"
+    CACHED = "cached"
+    NONE = "none"
+
+
+class QueryCounter:
+    """
+    Contagem de itens para paginação segundo a estratégia escolhida.
+
+    - EXACT: `COUNT(*)` a cada requisição.
+    - ESTIMATED: estimativa do planner (`EXPLAIN` no PostgreSQL, em um
+      savepoint), com fallback para a contagem exata em caso de erro e
+      nos demais dialetos.
+    - CACHED: contagem exata guardada por `ttl_seconds` para cada
+      assinatura de filtro (SQL + parâmetros), separada por engine.
+    - NONE: sem contagem; a paginação usa `has_more` buscando
+      page_size + 1 itens.
+    """
+
+    _caches: "WeakKeyDictionary[Engine, CountCache]" = WeakKeyDictionary()
+    max_cached_signatures = 1024
+
+    @staticmethod
+    def _signature(query: Select, bind: Engine) -> Tuple[str, str]:
+        """
+        SQL e parâmetros da consulta; os valores entram pelo `repr`, pois
+        podem não ser hashable (ex.: a lista de um `in_()`).
+        """
+        compiled = query.compile(dialect=bind.dialect)
+        return (str(compiled), repr(sorted(compiled.params.items())))
+
+    @classmethod
+    def _cache_for(cls, bind: Engine) -> CountCache:
+        cache = cls._caches.get(bind)
+        if cache is None:
+            cache = cls._caches[bind] = OrderedDict()
+        return cache
+
+    @staticmethod
+    async def exact(session: AsyncSession, query: Select) -> int:
+        statement = select(func.count()).select_from(
+            query.order_by(None).subquery()
+        )
+        return (await session.execute(statement)).scalar_one()
+
+    @classmethod
+    async def estimated(cls, session: AsyncSession, query: Select) -> int:
+        dialect = session.get_bind().dialect
+        if dialect.name != "postgresql":
+            return await cls.exact(session, query)
+        try:
+            async with session.begin_nested():
+                plan = (
+                    await session.execute(Explain(query.order_by(None)))
+                ).scalar()
+            return int(plan[0]["Plan"]["Plan Rows"])
+        except Exception as exp:
+            logger.warning(f"Count estimate failed, counting rows: {exp}")
+            return await cls.exact(session, query)
+
+    @classmethod
+    async def cached(
+        cls, session: AsyncSession, query: Select, ttl_seconds: float
+    ) -> int:
+        bind = session.get_bind()
+        cache = cls._cache_for(bind)
+        signature = cls._signature(query, bind)
+        now = time.monotonic()
+        entry = cache.get(signature)
+        if entry is not None and entry[0] > now:
+            cache.move_to_end(signature)
+            return entry[1]
+
+        total = await cls.exact(session, query)
+        cache[signature] = (now + ttl_seconds, total)
+        cache.move_to_end(signature)
+        if len(cache) > cls.max_cached_signatures:
+            cache.popitem(last=False)
+        return total
+
+    @classmethod
+    async def count(
+        cls,
+        session: AsyncSession,
+        query: Select,
+        strategy: CountStrategy = CountStrategy.EXACT,
+        ttl_seconds: float = 60,
+    ) -> Optional[int]:
+        if strategy == CountStrategy.NONE:
+            return None
+        if strategy == CountStrategy.ESTIMATED:
+            return await cls.estimated(session, query)
+        if strategy == CountStrategy.CACHED:
+            return await cls.cached(session, query, ttl_seconds)
+        return await cls.exact(session, query)
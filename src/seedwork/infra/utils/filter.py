@@ -1,74 +1,161 @@
 from datetime import date, datetime
-from sqlalchemy.orm import Query
-from sqlalchemy import text
+from enum import Enum
+from typing import Any, Callable, Dict, List, Tuple, Type, get_args
+
+from pydantic import BaseModel
+from sqlalchemy import ColumnElement, Select
 from src.seedwork.infra.schemas.pagination import PydanticModel
 
+RANGE_SUFFIXES = {"_start": "__ge__", "_end": "__le__"}
+
+
+class MatchMode(str, Enum):
+    EXACT = "exact"
+    CONTAINS = "contains"
+    PREFIX = "prefix"
+    FULL_TEXT = "full_text"
+    TRIGRAM = "trigram"
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _string_condition(
+    mode: MatchMode,
+) -> Callable[[Any, str], ColumnElement]:
+    """
+    String match modes. EXACT and PREFIX (`LIKE 'v%'`) can use a B-tree
+    index; FULL_TEXT compiles to the dialect's match operator (tsquery on
+    PostgreSQL); TRIGRAM is a case-insensitive `ILIKE '%v%'`, which a
+    pg_trgm GIN index accelerates. CONTAINS keeps the plain
+    `LIKE '%v%'` scan.
+    """
+    if mode == MatchMode.EXACT:
+        return lambda column, value: column == value
+    if mode == MatchMode.PREFIX:
+        return lambda column, value: column.like(
+            f"{_escape_like(value)}%", escape="\\"
+        )
+    if mode == MatchMode.FULL_TEXT:
+        return lambda column, value: column.match(value)
+    if mode == MatchMode.TRIGRAM:
+        return lambda column, value: column.ilike(
+            f"%{_escape_like(value)}%", escape="\\"
+        )
+    return lambda column, value: column.like(
+        f"%{_escape_like(value)}%", escape="\\"
+    )
+
 
 class Filtering:
+    """
+    Compila os parâmetros do schema de entrada em expressões de coluna
+    do SQLAlchemy.
+
+    - Strings usam o `MatchMode` definido em `filter_match_modes` do
+      schema (padrão CONTAINS).
+    - Datas aceitam intervalo com os sufixos `_start` (>=) e `_end` (<=),
+      ex.: `published_date_start`; sem sufixo continua sendo >=.
+    - O plano do filtro é guardado por formato do schema (classe + campos
+      informados + tipos), então cada requisição só associa os valores.
+    """
+
+    _plans: Dict[Tuple, List[Tuple[str, Callable]]] = {}
 
-    def __init__(self, query: Query, input_schema: PydanticModel):
-        self.query: Query = query
+    def __init__(self, query: Select, input_schema: PydanticModel):
+        self.query: Select = query
         self.input_schema: PydanticModel = input_schema
         self.input_dict: dict = input_schema.model_dump(
-            exclude={"page", "page_size"}, exclude_none=True
+            exclude={"page", "page_size", "cursor"}, exclude_none=True
         )
         if self.input_dict:
             self._filter_conditions()
             self._add_filter()
 
-    def _add_filter(self) -> None:
-        "Generate the filtered query"
-        self.query = self.query.filter(
-            text(self.filter_result).params(self.filter_value)
-        )
+    @staticmethod
+    def _strip_range_suffix(key: str) -> str:
+        for suffix in RANGE_SUFFIXES:
+            if key.endswith(suffix):
+                return key[: -len(suffix)]
+        return key
+
+    @classmethod
+    def column_name(cls, key: str, value: Any) -> str:
+        """
+        Nome da coluna de um parâmetro. O sufixo de intervalo só vale
+        para datas: `period_end: int` continua sendo a coluna `period_end`.
+        """
+        if isinstance(value, date):
+            return cls._strip_range_suffix(key)
+        return key
 
-    @property
-    def filter_result(self):
-        return self.filters.get("filter")
+    @classmethod
+    def field_column_name(cls, schema: Type[BaseModel], key: str) -> str:
+        "Nome da coluna de um campo do schema, pelo tipo anotado"
+        annotation = schema.model_fields[key].annotation
+        types = get_args(annotation) or (annotation,)
+        if any(isinstance(t, type) and issubclass(t, date) for t in types):
+            return cls._strip_range_suffix(key)
+        return key
 
-    @property
-    def filter_value(self):
-        return self.filters.get("values")
+    def _add_filter(self) -> None:
+        "Generate the filtered query"
+        if self.conditions:
+            self.query = self.query.filter(*self.conditions)
 
-    def _filter_conditions(self) -> dict:
+    def _filter_conditions(self) -> None:
         """
-        Main function that generates filter conditions and parameter values.
+        Main function that generates filter conditions, reusing the plan
+        compiled for this schema shape.
         """
-        filter_conditions = []
-        values = {}
+        shape = (
+            type(self.input_schema),
+            tuple(
+                (key, type(value)) for key, value in self.input_dict.items()
+            ),
+        )
+        plan = self._plans.get(shape)
+        if plan is None:
+            plan = [
+                (key, self._get_condition_for_type(key, value))
+                for key, value in self.input_dict.items()
+            ]
+            self._plans[shape] = plan
 
-        for i, (key, value) in enumerate(self.input_dict.items()):
-            param_key = f"value_{i}"
-            condition, param_value = self._get_condition_for_type(
-                key, value, param_key
+        model = self.query.column_descriptions[0]["entity"]
+        self.conditions: List[ColumnElement] = [
+            build(
+                getattr(model, self.column_name(key, self.input_dict[key])),
+                self.input_dict[key],
             )
-            if condition:
-                filter_conditions.append(condition)
-                values[param_key] = param_value
-
-        # Join conditions into a filter string
-        filter_str = (
-            " AND ".join(filter_conditions) if filter_conditions else ""
-        )
-        self.filters = {"filter": filter_str, "values": values}
+            for key, build in plan
+        ]
 
     def _get_condition_for_type(
-        self, key: str, value, param_key: str
-    ) -> tuple:
+        self, key: str, value
+    ) -> Callable[[Any, Any], ColumnElement]:
         """
-        Returns the SQL condition and parameter value based on the type of the value.
-        This function can be easily extended for more types.
+        Returns the builder of the SQL condition based on the type of the
+        value. This function can be easily extended for more types.
         """
         if isinstance(value, (int, float, bool)):
-            return f"{key} = :{param_key}", value
+            return lambda column, value: column == value
 
         elif isinstance(value, str):
             # Handles pattern matching for strings
-            return f"{key} LIKE :{param_key}", f"%{value}%"
+            modes = getattr(self.input_schema, "filter_match_modes", {})
+            return _string_condition(
+                MatchMode(modes.get(key, MatchMode.CONTAINS))
+            )
 
         elif isinstance(value, (date, datetime)):
-            # Handles date and datetime comparisons
-            return f"{key} >= :{param_key}", value
+            # Handles date and datetime comparisons and ranges
+            operator = "__ge__"
+            for suffix, range_operator in RANGE_SUFFIXES.items():
+                if key.endswith(suffix):
+                    operator = range_operator
+            return lambda column, value: getattr(column, operator)(value)
 
         else:
             # Unsupported data type
@@ -0,0 +1,109 @@
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Callable, Dict, FrozenSet, Optional, Type
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import InstrumentedAttribute
+
+Converter = Callable[[Any], Any]
+
+
+def _bool_converter(value: Any) -> Any:
+    if isinstance(value, str):
+        if value.lower() == "false":
+            return False
+        if value.lower() == "true":
+            return True
+    return bool(value)
+
+
+def _datetime_converter(value: Any) -> Any:
+    if isinstance(value, str):
+        return datetime.strptime(value, "%Y-%m-%d %H:%M:%S")
+    return value
+
+
+def _date_converter(value: Any) -> Any:
+    if isinstance(value, str):
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    return value
+
+
+def _converter_for(python_type: Optional[type]) -> Optional[Converter]:
+    "Conversor de valores recebidos (ex.: query string) para a coluna"
+    if python_type is None:
+        return None
+    if python_type is bool:
+        return _bool_converter
+    if python_type is datetime:
+        return _datetime_converter
+    if python_type is date:
+        return _date_converter
+    return python_type
+
+
+def _python_type(column) -> Optional[type]:
+    try:
+        return column.type.python_type
+    except NotImplementedError:
+        return None
+
+
+@dataclass(frozen=True)
+class ModelMetadata:
+    """Metadados de um modelo, introspectados uma única vez"""
+
+    model: Type
+    table: str
+    primary_key_name: str
+    primary_key_attr: InstrumentedAttribute
+    columns: FrozenSet[str]
+    attribute_names: FrozenSet[str]
+    python_types: Dict[str, Optional[type]]
+    converters: Dict[str, Optional[Converter]]
+
+    @classmethod
+    def from_model(cls, model: Type) -> "ModelMetadata":
+        mapper = inspect(model)
+        primary_key = mapper.primary_key[0]
+        python_types = {
+            attr.key: _python_type(attr.columns[0])
+            for attr in mapper.column_attrs
+        }
+        return cls(
+            model=model,
+            table=model.__tablename__,
+            primary_key_name=primary_key.key,
+            primary_key_attr=getattr(
+                model, mapper.get_property_by_column(primary_key).key
+            ),
+            columns=frozenset(model.__table__.columns.keys()),
+            attribute_names=frozenset(python_types),
+            python_types=python_types,
+            converters={
+                key: _converter_for(python_type)
+                for key, python_type in python_types.items()
+            },
+        )
+
+
+class ModelRegistry:
+    """
+    Registro de `ModelMetadata` por modelo, compartilhado pelos
+    repositórios e pelo `ModelUtils`, para não repetir a introspecção do
+    SQLAlchemy a cada requisição.
+    """
+
+    _metadata: Dict[Type, ModelMetadata] = {}
+
+    @classmethod
+    def get(cls, model: Type) -> ModelMetadata:
+        metadata = cls._metadata.get(model)
+        if metadata is None:
+            metadata = ModelMetadata.from_model(model)
+            cls._metadata[model] = metadata
+        return metadata
+
+    @classmethod
+    def clear(cls) -> None:
+        cls._metadata.clear()
@@ -1,8 +1,9 @@
-from datetime import date, datetime
 from typing import Tuple
 
 from loguru import logger
-from sqlalchemy import asc, desc, inspect
+from sqlalchemy import asc, desc
+
+from src.seedwork.infra.utils.metadata import ModelRegistry
 
 
 class ModelUtils:
@@ -10,21 +11,7 @@ class ModelUtils:
 
     def __init__(self, model):
         self.model = model
-
-    def __bool_handler(self, value: str) -> int:
-        if value.lower() == "false":
-            return 0
-        if value.lower() == "true":
-            return 1
-        return value
-
-    def __datetime_handler(
-        self, value: str, date_type: date | datetime
-    ) -> datetime | date:
-        if isinstance(date_type, datetime):
-            value = datetime.strptime(value, "%Y-%m-%d %H:%M:%S")
-        value = datetime.strptime(value, "%Y-%m-%d")
-        return value
+        self.metadata = ModelRegistry.get(model)
 
     def order_by_conditions(self, kwargs: dict) -> Tuple[list, dict]:
         order_by = []
@@ -41,42 +28,37 @@ class ModelUtils:
         "Converte os kwargs retornados para o tipo especificado pelo modelo"
         converted_kwargs = {}
         for key, value in kwargs.items():
-            attr_type = getattr(self.model, key).type.python_type
+            if key not in self.metadata.converters:
+                raise AttributeError(
+                    f"The inserted key {key} is not present at the Model "
+                    f"{self.model.__tablename__}"
+                )
+            convert = self.metadata.converters[key]
             try:
-                if attr_type is bool:
-                    value = self.__bool_handler(value)
-                if attr_type is date or attr_type is date:
-                    converted_value = self.__datetime_handler(value, attr_type)
-                else:
-                    converted_value = attr_type(value)
-                converted_kwargs[key] = converted_value
+                converted_kwargs[key] = (
+                    convert(value) if convert is not None else value
+                )
             except ValueError as exp:
                 logger.error(exp)
+                type_name = self.metadata.python_types[key].__name__
                 raise ValueError(
-                    f"Could not convert {key} to {attr_type.__name__}. >>> {exp}"
+                    f"Could not convert {key} to {type_name}. >>> {exp}"
                 )
         return converted_kwargs
 
     def check_model_types(self, kwargs: dict) -> None:
         "Adicionar um kwarg checker que confere se o tipo encaminhado atende ao critério do modelo para criar exceção do tipo TypeError"
-        inspector = inspect(self.model)
-        attr_names = [
-            column_attr.key for column_attr in inspector.mapper.column_attrs
-        ]
-
+        python_types = self.metadata.python_types
         for key, value in kwargs.items():
-            if key in attr_names:
-                attr_type = type(getattr(self.model, key))
+            attr_type = python_types.get(key)
+            if attr_type is not None and value is not None:
                 assert isinstance(
                     value, attr_type
                 ), f"Expected type {attr_type.__name__} for {key}, got {type(value).__name__}"
 
     def check_model_kwargs(self, kwargs: dict) -> None:
         "Confere se os kwargs utilizados existem no modelo utilizado. Se não retorna erro de atributo"
-        inspector = inspect(self.model)
-        attr_names = [
-            column_attr.key for column_attr in inspector.mapper.column_attrs
-        ]
+        attr_names = self.metadata.attribute_names
         for key in kwargs.keys():
             if key not in attr_names or key == "dt_start" or key == "dt_end":
                 logger.error("Key is not present at the model`s attributes")
@@ -1,10 +1,19 @@
+import base64
+import json
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
 from typing import List, Any, Type, Generic, TypeVar, Optional
 from urllib.parse import parse_qsl, urlencode
 
 from fastapi import Request
 from loguru import logger
 from pydantic import BaseModel
+from sqlalchemy import Select, desc
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
 
+from src.seedwork.infra.utils.count import CountStrategy, QueryCounter
 from src.seedwork.infra.schemas.pagination import (
     PageMeta,
     PageLink,
@@ -13,6 +22,29 @@ from src.seedwork.infra.schemas.pagination import (
 
 T = TypeVar("T", bound=BaseModel)
 
+_CURSOR_DECODERS = {
+    datetime: datetime.fromisoformat,
+    date: date.fromisoformat,
+    uuid.UUID: uuid.UUID,
+    Decimal: Decimal,
+}
+
+
+def _encode_cursor_key(value: Any) -> str:
+    "Serializa chaves que o JSON não conhece (UUID, datas, Decimal)"
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (uuid.UUID, Decimal)):
+        return str(value)
+    raise TypeError(f"Unsupported cursor key: {type(value).__name__}")
+
+
+def _cursor_key_type(column: InstrumentedAttribute) -> Optional[type]:
+    try:
+        return column.type.python_type
+    except NotImplementedError:
+        return None
+
 
 class Pagination(Generic[T]):
     """
@@ -135,3 +167,150 @@ class Pagination(Generic[T]):
                 actual_page=actual_page,
             ),
         )
+
+    @staticmethod
+    def _build_url(actual_page: str, **params: Optional[str]) -> str:
+        path, _, query_string = actual_page.partition("?")
+        existing_params = dict(parse_qsl(query_string))
+        for key, value in params.items():
+            if value is None:
+                existing_params.pop(key, None)
+            else:
+                existing_params[key] = value
+        return f"{path}?{urlencode(existing_params)}"
+
+    @classmethod
+    async def paginate_to_dict(
+        cls,
+        session: AsyncSession,
+        query: Select,
+        page: int,
+        page_size: int,
+        actual_page: str,
+        count_strategy: CountStrategy = CountStrategy.EXACT,
+        count_ttl_seconds: float = 60,
+    ) -> dict:
+        """
+        Paginação por OFFSET. O total de itens segue `count_strategy`;
+        com CountStrategy.NONE não há contagem e `has_more` é obtido
+        buscando page_size + 1 itens.
+        """
+        total_items = await QueryCounter.count(
+            session, query, count_strategy, count_ttl_seconds
+        )
+        rows = (
+            await session.scalars(
+                query.offset((page - 1) * page_size).limit(page_size + 1)
+            )
+        ).all()
+        items = rows[:page_size]
+        has_more = len(rows) > page_size
+        total_pages = None
+        if total_items is not None:
+            total_pages = max(1, (total_items + page_size - 1) // page_size)
+
+        return {
+            "items": items,
+            "page": page,
+            "page_size": page_size,
+            "total_items": total_items,
+            "total_pages": total_pages,
+            "has_more": has_more,
+            "actual_page": actual_page,
+            "next_page": (
+                cls._build_url(
+                    actual_page, page=str(page + 1), page_size=str(page_size)
+                )
+                if has_more
+                else None
+            ),
+            "prev_page": (
+                cls._build_url(
+                    actual_page, page=str(page - 1), page_size=str(page_size)
+                )
+                if page > 1
+                else None
+            ),
+        }
+
+    @staticmethod
+    def encode_cursor(value: Any) -> str:
+        "Cursor opaco com a última chave de ordenação vista"
+        payload = json.dumps(
+            {"k": value}, separators=(",", ":"), default=_encode_cursor_key
+        )
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    @staticmethod
+    def decode_cursor(
+        cursor: str, column: Optional[InstrumentedAttribute] = None
+    ) -> Any:
+        """
+        Lê a chave do cursor; com `column`, a converte de volta para o
+        tipo Python da coluna (UUID, datetime...), recusando cursores cuja
+        chave não corresponde a esse tipo.
+        """
+        try:
+            padding = "=" * (-len(cursor) % 4)
+            payload = base64.urlsafe_b64decode(cursor + padding)
+            value = json.loads(payload)["k"]
+            key_type = _cursor_key_type(column) if column is not None else None
+            if key_type is None:
+                return value
+            if isinstance(value, (dict, list, bool)) or value is None:
+                raise TypeError(f"Unexpected cursor key: {value!r}")
+            if isinstance(value, key_type):
+                return value
+            return _CURSOR_DECODERS.get(key_type, key_type)(value)
+        except (ValueError, KeyError, TypeError) as exp:
+            raise ValueError(f"Invalid pagination cursor: {cursor}") from exp
+
+    @classmethod
+    async def paginate_by_cursor_to_dict(
+        cls,
+        session: AsyncSession,
+        query: Select,
+        key_column: InstrumentedAttribute,
+        cursor: Optional[str],
+        page_size: int,
+        actual_page: str,
+    ) -> dict:
+        """
+        Paginação por cursor (keyset): `WHERE key < :cursor LIMIT n` em
+        ordem decrescente da chave, com custo constante em qualquer
+        profundidade, ao contrário do OFFSET.
+        """
+        query = query.order_by(None).order_by(desc(key_column))
+        if cursor is not None:
+            query = query.filter(
+                key_column < cls.decode_cursor(cursor, key_column)
+            )
+        rows = (await session.scalars(query.limit(page_size + 1))).all()
+        items = rows[:page_size]
+
+        has_more = len(rows) > page_size
+        next_cursor = None
+        if has_more:
+            next_cursor = cls.encode_cursor(getattr(items[-1], key_column.key))
+
+        return {
+            "items": items,
+            "page": None,
+            "page_size": page_size,
+            "total_items": None,
+            "total_pages": None,
+            "has_more": has_more,
+            "actual_page": actual_page,
+            "next_cursor": next_cursor,
+            "next_page": (
+                cls._build_url(
+                    actual_page,
+                    cursor=next_cursor,
+                    page=None,
+                    page_size=str(page_size),
+                )
+                if next_cursor
+                else None
+            ),
+            "prev_page": None,
+        }
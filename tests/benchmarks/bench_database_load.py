@@ -0,0 +1,150 @@
+"""
+Throughput of concurrent single-row reads through the seedwork, before
+(synchronous Session called from the event loop, as the repositories
+did) and after (GetOneRepository on the pooled async engine).
+
+Every SELECT waits `latency_ms` inside the driver, standing in for the
+round trip to a database server: a blocking session serializes those
+waits, while the async engine overlaps them across its pool.
+
+    python -m tests.benchmarks.bench_database_load [requests] [latency_ms]
+"""
+
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+from sqlalchemy import String, create_engine, event, func, insert, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Mapped, Session, column_property, mapped_column
+
+from src.seedwork.infra.defaults.base import Base
+from src.seedwork.infra.repository.base import GetOneRepository
+from src.seedwork.infra.schemas import GetInput, PydanticModel
+
+ROWS = 1_000
+CONCURRENCY = 32
+
+
+class LoadArticleModel(Base):
+    __tablename__ = "bench_load_article"
+
+    article_id: Mapped[int] = mapped_column(primary_key=True)
+    title: Mapped[str] = mapped_column(String(128))
+    round_trip = column_property(func.round_trip(1))
+
+
+class LoadArticleInput(GetInput):
+    article_id: Optional[int] = None
+
+
+class LoadArticleOutput(PydanticModel):
+    article_id: int
+    title: str
+
+
+def add_round_trip(sync_engine, latency_ms: float) -> None:
+    def round_trip(value):
+        time.sleep(latency_ms / 1000)
+        return value
+
+    @event.listens_for(sync_engine, "connect")
+    def register(dbapi_connection, _):
+        dbapi_connection.create_function("round_trip", 1, round_trip)
+
+
+async def run_load(handle, requests: int) -> float:
+    """Requests per second of `requests` calls, CONCURRENCY at a time."""
+    pending = iter(range(requests))
+
+    async def client():
+        for number in pending:
+            await handle(number % ROWS + 1)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(CONCURRENCY)))
+    return requests / (time.perf_counter() - start)
+
+
+async def blocking_load(url: str, requests: int, latency_ms: float):
+    engine = create_engine(f"sqlite:///{url}")
+    add_round_trip(engine, latency_ms)
+
+    async def handle(article_id: int):
+        with Session(engine) as session:
+            output = session.scalars(
+                select(LoadArticleModel).where(
+                    LoadArticleModel.article_id == article_id
+                )
+            ).one_or_none()
+            return LoadArticleOutput.model_validate(output)
+
+    try:
+        return await run_load(handle, requests)
+    finally:
+        engine.dispose()
+
+
+async def async_load(url: str, requests: int, latency_ms: float):
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{url}", pool_size=CONCURRENCY
+    )
+    add_round_trip(engine.sync_engine, latency_ms)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    async def handle(article_id: int):
+        async with session_factory() as session:
+            return await GetOneRepository(
+                LoadArticleModel,
+                LoadArticleInput(article_id=article_id),
+                LoadArticleOutput,
+                session,
+            ).case()
+
+    try:
+        return await run_load(handle, requests)
+    finally:
+        await engine.dispose()
+
+
+async def main_async(requests: int, latency_ms: float) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        url = Path(directory) / "bench.db"
+        engine = create_async_engine(f"sqlite+aiosqlite:///{url}")
+        async with engine.begin() as connection:
+            await connection.run_sync(
+                Base.metadata.create_all,
+                tables=[LoadArticleModel.__table__],
+            )
+            await connection.execute(
+                insert(LoadArticleModel),
+                [
+                    {"article_id": i, "title": f"article {i}"}
+                    for i in range(1, ROWS + 1)
+                ],
+            )
+        await engine.dispose()
+
+        print(
+            f"{requests:,} requests, {CONCURRENCY} concurrent, "
+            f"{latency_ms:g} ms per round trip"
+        )
+        for name, load in (
+            ("blocking session", blocking_load),
+            ("async engine", async_load),
+        ):
+            throughput = await load(url, requests, latency_ms)
+            print(f"{name}: {throughput:,.0f} requests/s")
+
+
+def main() -> None:
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000
+    latency_ms = float(sys.argv[2]) if len(sys.argv) > 2 else 2
+    asyncio.run(main_async(requests, latency_ms))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Time to store a refresh batch of fetched items with one commit per row
+against SqlFeedItemRepository's multi-row upsert, on a SQLite file.
+
+    python -m tests.benchmarks.bench_feed_item_upsert [items] [batch_size]
+"""
+
+import asyncio
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.domain.feed.entities.feed_item import FeedItem
+from src.infrastructure.common.db.sessions import DatabaseSessions
+from src.infrastructure.models.feed_item import FeedItemModel
+from src.infrastructure.repository.feed_item_repository import (
+    SqlFeedItemRepository,
+    _as_row,
+)
+from src.seedwork.infra.defaults.base import Base
+
+
+def make_items(count: int, prefix: str):
+    return [
+        FeedItem(
+            f"Item {number}",
+            "Lorem ipsum dolor sit amet. " * 20,
+            f"https://example.com/{prefix}/{number}",
+            datetime(2024, 1, 1),
+            feed_source_id="bench",
+            guid=f"{prefix}-{number}",
+            tags=["bench"],
+        )
+        for number in range(count)
+    ]
+
+
+async def per_row(session_factory, items, batch_size: int) -> None:
+    database_session = DatabaseSessions()
+    async with session_factory() as session:
+        for item in items:
+            await database_session.create_session(
+                session, FeedItemModel(**_as_row(item))
+            )
+
+
+async def bulk(session_factory, items, batch_size: int) -> None:
+    async with session_factory() as session:
+        await SqlFeedItemRepository(session, batch_size).add_many(items)
+
+
+async def main_async(count: int, batch_size: int) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{Path(directory) / 'bench.db'}"
+        )
+        async with engine.begin() as connection:
+            await connection.run_sync(
+                Base.metadata.create_all, tables=[FeedItemModel.__table__]
+            )
+        session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+        print(f"{count:,} items, {batch_size} rows per statement")
+        for name, write in (("per row", per_row), ("bulk", bulk)):
+            items = make_items(count, name.replace(" ", "-"))
+            start = time.perf_counter()
+            await write(session_factory, items, batch_size)
+            elapsed = time.perf_counter() - start
+            print(f"{name}: {elapsed:.3f} s ({count / elapsed:,.0f} rows/s)")
+
+        items = make_items(count, "bulk")
+        start = time.perf_counter()
+        await bulk(session_factory, items, batch_size)
+        elapsed = time.perf_counter() - start
+        print(f"bulk, all conflicting: {elapsed:.3f} s")
+        await engine.dispose()
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000
+    batch_size = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    asyncio.run(main_async(count, batch_size))
+
+
+if __name__ == "__main__":
+    main()
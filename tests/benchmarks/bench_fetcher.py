@@ -0,0 +1,92 @@
+"""
+Refresh time of FeedFetcher against a local server with a fixed delay per
+feed: one feed at a time (the old sequential refresh) against the pooled
+concurrent fetch, plus the time single-feed hosts wait when one host owns
+most of the feeds.
+
+    python -m tests.benchmarks.bench_fetcher [feeds] [delay_seconds]
+"""
+
+import asyncio
+import sys
+import time
+
+from src.domain.feed.entities.feed import Feed
+from src.domain.feed.value_objects.feed_url import FeedUrl
+from src.infrastructure.fetching.fetcher import FeedFetcher
+from tests.infrastructure.fetching.conftest import (
+    FeedServer,
+    Route,
+    rss,
+    rss_item,
+)
+
+
+def make_feeds(server: FeedServer, hosts, delay_seconds: float):
+    feeds = []
+    for host in hosts:
+        path = f"/{len(server.routes)}"
+        server.routes[path] = Route(
+            rss(rss_item(path)), delay_seconds=delay_seconds
+        )
+        feeds.append(Feed(path, FeedUrl(server.url(path, host)), path))
+    return feeds
+
+
+async def refresh(server: FeedServer, feeds, **limits) -> float:
+    async with FeedFetcher(client=server.client(), **limits) as fetcher:
+        start = time.perf_counter()
+        await fetcher.fetch_many(feeds)
+        return time.perf_counter() - start
+
+
+async def quiet_host_wait(server: FeedServer, delay_seconds: float) -> float:
+    busy = make_feeds(server, ["busy.test"] * 20, delay_seconds)
+    quiet = make_feeds(
+        server, [f"quiet-{i}.test" for i in range(10)], delay_seconds
+    )
+    finished = []
+    async with FeedFetcher(
+        client=server.client(), max_concurrency=10, max_per_host=2
+    ) as fetcher:
+        start = time.perf_counter()
+
+        async def fetch(feed: Feed, record: bool) -> None:
+            await fetcher.fetch(feed)
+            if record:
+                finished.append(time.perf_counter() - start)
+
+        await asyncio.gather(
+            *(fetch(feed, False) for feed in busy),
+            *(fetch(feed, True) for feed in quiet),
+        )
+    return max(finished)
+
+
+async def main_async(count: int, delay_seconds: float) -> None:
+    server = FeedServer().start()
+    try:
+        feeds = make_feeds(
+            server, [f"host-{i}.test" for i in range(count)], delay_seconds
+        )
+        sequential = await refresh(server, feeds, max_concurrency=1)
+        concurrent = await refresh(server, feeds)
+        print(f"sequential: {count} feeds in {sequential:.2f}s")
+        print(f"concurrent: {count} feeds in {concurrent:.2f}s")
+        wait = await quiet_host_wait(server, delay_seconds)
+        print(
+            "single-feed hosts next to a 20-feed host "
+            f"(global=10, per host=2): done after {wait:.2f}s"
+        )
+    finally:
+        server.stop()
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    delay_seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 0.1
+    asyncio.run(main_async(count, delay_seconds))
+
+
+if __name__ == "__main__":
+    main()
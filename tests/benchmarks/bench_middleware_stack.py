@@ -0,0 +1,111 @@
+"""
+Requests per second through the full APIBuilder middleware stack (CORS,
+rate limiting and request logging) with an in-process ASGI client.
+
+`BaseHTTPMiddleware hops` adds two pass-through BaseHTTPMiddleware
+layers on top, the task and memory-stream hop each middleware paid
+before they became pure ASGI. `bare routes` has no middleware at all.
+POSTs send a JSON body the route never reads, which the logging
+middleware buffers up front so it can still be logged.
+
+    python -m tests.benchmarks.bench_middleware_stack [requests]
+"""
+
+import asyncio
+import sys
+import time
+
+import httpx
+from fastapi import FastAPI
+from loguru import logger
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from src.infrastructure.api import APIBuilder
+
+CONCURRENCY = 32
+BODY = b'{"title": "News", "tags": ["a", "b"], "password": "secret"}'
+
+
+async def pass_through(request, call_next):
+    return await call_next(request)
+
+
+def add_routes(app: FastAPI) -> FastAPI:
+    @app.get("/bench")
+    async def read():
+        return {"items": []}
+
+    @app.post("/bench")
+    async def write():
+        return {"ok": True}
+
+    return app
+
+
+def bare_app() -> FastAPI:
+    return add_routes(FastAPI())
+
+
+def builder_app() -> FastAPI:
+    return add_routes(APIBuilder.create())
+
+
+def hops_app() -> FastAPI:
+    app = builder_app()
+    for _ in range(2):
+        app.add_middleware(BaseHTTPMiddleware, dispatch=pass_through)
+    return app
+
+
+def client_address(number: int) -> str:
+    """One address per request, so no client hits the rate limit."""
+    return f"10.{number >> 16 & 255}.{number >> 8 & 255}.{number & 255}"
+
+
+async def run_load(app: FastAPI, method: str, requests: int) -> float:
+    pending = iter(range(requests))
+    content = BODY if method == "POST" else None
+
+    async def client(http: httpx.AsyncClient):
+        for number in pending:
+            await http.request(
+                method,
+                "/bench",
+                content=content,
+                headers={"x-forwarded-for": client_address(number)},
+            )
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app), base_url="http://bench"
+    ) as http:
+        await http.get("/bench")
+        start = time.perf_counter()
+        await asyncio.gather(*(client(http) for _ in range(CONCURRENCY)))
+        elapsed = time.perf_counter() - start
+
+    pipeline = getattr(app.state, "log_pipeline", None)
+    if pipeline is not None:
+        await pipeline.stop()
+    return requests / elapsed
+
+
+async def main_async(requests: int) -> None:
+    logger.remove()
+    print(f"{requests:,} requests, {CONCURRENCY} concurrent")
+    for name, build in (
+        ("bare routes", bare_app),
+        ("APIBuilder stack", builder_app),
+        ("BaseHTTPMiddleware hops", hops_app),
+    ):
+        for method in ("GET", "POST"):
+            throughput = await run_load(build(), method, requests)
+            print(f"{name}, {method}: {throughput:,.0f} requests/s")
+
+
+def main() -> None:
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+    asyncio.run(main_async(requests))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Latency of page 1 against a deep page with OFFSET and cursor (keyset)
+pagination, on a SQLite table of synthetic rows.
+
+    python -m tests.benchmarks.bench_pagination [page] [page_size]
+"""
+
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.seedwork.infra.defaults.base import Base
+from src.seedwork.infra.utils.count import CountStrategy
+from src.seedwork.infra.utils.pagination import Pagination
+from tests.seedwork.models import ArticleModel
+
+RUNS = 20
+INSERT_BATCH = 10_000
+
+
+async def create_rows(session_factory, count: int) -> None:
+    async with session_factory() as session:
+        for start in range(1, count + 1, INSERT_BATCH):
+            end = min(start + INSERT_BATCH, count + 1)
+            await session.execute(
+                insert(ArticleModel),
+                [
+                    {"article_id": i, "title": f"article {i}", "views": i}
+                    for i in range(start, end)
+                ],
+            )
+        await session.commit()
+
+
+async def timed(session_factory, fetch) -> float:
+    async with session_factory() as session:
+        await fetch(session)
+        start = time.perf_counter()
+        for _ in range(RUNS):
+            await fetch(session)
+        return (time.perf_counter() - start) / RUNS * 1000
+
+
+def by_offset(page: int, page_size: int):
+    async def fetch(session):
+        return await Pagination.paginate_to_dict(
+            session,
+            select(ArticleModel).order_by(ArticleModel.article_id.desc()),
+            page,
+            page_size,
+            "/articles",
+            CountStrategy.NONE,
+        )
+
+    return fetch
+
+
+def by_cursor(page: int, page_size: int, total: int):
+    cursor = None
+    if page > 1:
+        cursor = Pagination.encode_cursor(total - (page - 1) * page_size + 1)
+
+    async def fetch(session):
+        return await Pagination.paginate_by_cursor_to_dict(
+            session,
+            select(ArticleModel),
+            ArticleModel.article_id,
+            cursor,
+            page_size,
+            "/articles",
+        )
+
+    return fetch
+
+
+async def main_async(page: int, page_size: int) -> None:
+    total = page * page_size + page_size
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{Path(directory) / 'bench.db'}"
+        )
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        session_factory = async_sessionmaker(engine, expire_on_commit=False)
+        await create_rows(session_factory, total)
+
+        print(f"{total:,} rows, {page_size} per page")
+        for name, fetch_page in (
+            ("offset", lambda p: by_offset(p, page_size)),
+            ("cursor", lambda p: by_cursor(p, page_size, total)),
+        ):
+            first = await timed(session_factory, fetch_page(1))
+            deep = await timed(session_factory, fetch_page(page))
+            print(
+                f"{name}: page 1 {first:.2f} ms, "
+                f"page {page:,} {deep:.2f} ms"
+            )
+        await engine.dispose()
+
+
+def main() -> None:
+    page = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    page_size = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    asyncio.run(main_async(page, page_size))
+
+
+if __name__ == "__main__":
+    main()
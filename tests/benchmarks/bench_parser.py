@@ -0,0 +1,70 @@
+"""
+Parse throughput of FeedParser on large synthetic RSS and Atom documents.
+
+    python -m tests.benchmarks.bench_parser [items]
+"""
+
+import sys
+import time
+import tracemalloc
+
+from src.infrastructure.fetching.parser import FeedParser
+
+CHUNK_SIZE = 64 * 1024
+
+
+def rss_document(items: int) -> bytes:
+    entries = "".join(
+        f"<item><title>Item {i}</title><guid>item-{i}</guid>"
+        f"<link>http://example.org/{i}</link>"
+        f"<pubDate>Mon, 01 Jan 2024 10:00:00 GMT</pubDate>"
+        f"<category>news</category>"
+        f"<description>{'lorem ipsum ' * 40}</description></item>"
+        for i in range(items)
+    )
+    return (
+        '<?xml version="1.0"?><rss version="2.0"><channel><title>t</title>'
+        f"{entries}</channel></rss>"
+    ).encode()
+
+
+def atom_document(items: int) -> bytes:
+    entries = "".join(
+        f"<entry><id>urn:item-{i}</id><title>Item {i}</title>"
+        f'<link rel="alternate" href="http://example.org/{i}"/>'
+        f"<updated>2024-01-01T10:00:00Z</updated>"
+        f"<author><name>Ann</name></author>"
+        f"<summary>{'lorem ipsum ' * 40}</summary></entry>"
+        for i in range(items)
+    )
+    return (
+        '<?xml version="1.0"?><feed xmlns="http://www.w3.org/2005/Atom">'
+        f"{entries}</feed>"
+    ).encode()
+
+
+def run(name: str, document: bytes) -> None:
+    starts = range(0, len(document), CHUNK_SIZE)
+    ends = range(CHUNK_SIZE, len(document) + CHUNK_SIZE, CHUNK_SIZE)
+    chunks = (document[start:end] for start, end in zip(starts, ends))
+    tracemalloc.start()
+    start = time.perf_counter()
+    count = sum(1 for _ in FeedParser().parse(chunks))
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{name}: {count} items, {len(document) / 2**20:.1f} MiB "
+        f"in {elapsed:.2f}s ({count / elapsed:,.0f} items/s), "
+        f"peak {peak / 2**20:.1f} MiB"
+    )
+
+
+def main() -> None:
+    items = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    run("rss", rss_document(items))
+    run("atom", atom_document(items))
+
+
+if __name__ == "__main__":
+    main()
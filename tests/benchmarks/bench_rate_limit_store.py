@@ -0,0 +1,61 @@
+"""
+Per-request cost and memory of SlidingWindowStore as the number of
+distinct clients grows, e.g. behind a public endpoint hit by 100k IPs.
+
+    python -m tests.benchmarks.bench_rate_limit_store [clients] [requests]
+"""
+
+import sys
+import time
+import tracemalloc
+
+from src.infrastructure.middleware.rate_limiting.store import (
+    SlidingWindowStore,
+)
+
+WINDOW = 60
+
+
+def hit_all(keys, requests: int, max_clients: int) -> SlidingWindowStore:
+    """Round-robin `requests` hits over `keys` within one window."""
+    store = SlidingWindowStore(max_clients=max_clients)
+    now = 1_000_000.0
+    for number in range(requests):
+        store.hit(keys[number % len(keys)], WINDOW, now)
+        now += 0.00001
+    return store
+
+
+def run(clients: int, requests: int, max_clients: int):
+    keys = [f"client-{number}" for number in range(clients)]
+    start = time.perf_counter()
+    store = hit_all(keys, requests, max_clients)
+    per_hit = (time.perf_counter() - start) / requests * 1e6
+
+    tracemalloc.start()
+    hit_all(keys, requests, max_clients)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return per_hit, peak, len(store), store.evicted
+
+
+def main() -> None:
+    clients = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    requests = int(sys.argv[2]) if len(sys.argv) > 2 else 500_000
+
+    print(f"{requests:,} requests")
+    for distinct, max_clients in (
+        (1_000, clients),
+        (clients, clients),
+        (clients, clients // 10),
+    ):
+        per_hit, peak, tracked, evicted = run(distinct, requests, max_clients)
+        print(
+            f"{distinct:,} clients, max {max_clients:,}: "
+            f"{per_hit:.2f} us/hit, peak {peak / 2**20:.1f} MiB, "
+            f"{tracked:,} tracked, {evicted:,} evicted"
+        )
+
+
+if __name__ == "__main__":
+    main()
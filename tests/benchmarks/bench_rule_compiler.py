@@ -0,0 +1,107 @@
+"""
+Compiled rule pipeline against the per-item rule interpreter.
+
+    python -m tests.benchmarks.bench_rule_compiler [items] [rules]
+"""
+
+import random
+import sys
+import time
+
+from src.domain.rule.entities.rule import Rule
+from src.domain.rule.enums.comparison_operator import ComparisonOperator
+from src.domain.rule.enums.logic_operator import LogicOperator
+from src.domain.rule.enums.rule_type import RuleType
+from src.domain.rule.enums.transformation_type import TransformationType
+from src.domain.rule.services.rule_compiler import CompiledRuleSet
+from src.domain.rule.value_objects.rule_condition import RuleCondition
+from src.domain.rule.value_objects.rule_transformation import (
+    RuleTransformation,
+)
+
+WORDS = ["python", "rust", "go", "news", "release", "tips", "weekly"]
+
+
+def make_items(count: int):
+    randomizer = random.Random(0)
+    return [
+        {
+            "title": " ".join(randomizer.choices(WORDS, k=5)),
+            "author": randomizer.choice(["Ann", "Bob", "Eve"]),
+            "score": randomizer.randint(0, 10),
+        }
+        for _ in range(count)
+    ]
+
+
+def make_rules(count: int):
+    randomizer = random.Random(1)
+    rules = []
+    for index in range(count):
+        rule_type = randomizer.choice(
+            [RuleType.FILTER, RuleType.TRANSFORM, RuleType.TAG]
+        )
+        conditions = [
+            RuleCondition(
+                "title", ComparisonOperator.CONTAINS, randomizer.choice(WORDS)
+            ),
+            RuleCondition(
+                "score",
+                ComparisonOperator.LESS_THAN,
+                randomizer.randint(0, 10),
+                LogicOperator.OR,
+            ),
+        ]
+        transformations = [
+            RuleTransformation(
+                f"label_{index}", TransformationType.APPEND, "x"
+            )
+        ]
+        rules.append(
+            Rule(
+                f"rule-{index}",
+                rule_type,
+                conditions=conditions,
+                transformations=transformations,
+                priority=randomizer.randint(0, 100),
+            )
+        )
+    return rules
+
+
+def interpret(rules, items):
+    ordered = sorted(rules, key=lambda rule: -rule.priority)
+    for item in items:
+        for rule in ordered:
+            if not rule.matches(item):
+                if rule.rule_type == RuleType.FILTER:
+                    item = None
+                    break
+                continue
+            item = rule.apply(item)
+        if item is not None:
+            yield item
+
+
+def timed(name: str, run) -> float:
+    start = time.perf_counter()
+    count = sum(1 for _ in run())
+    elapsed = time.perf_counter() - start
+    print(f"{name}: {count} items out in {elapsed:.3f}s")
+    return elapsed
+
+
+def main() -> None:
+    item_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    rule_count = int(sys.argv[2]) if len(sys.argv) > 2 else 30
+    items = make_items(item_count)
+    rules = make_rules(rule_count)
+
+    interpreted = timed("interpreter", lambda: interpret(rules, items))
+    compiled = CompiledRuleSet(rules)
+    fast = timed("compiled", lambda: compiled.run(items))
+    print(f"speedup: {interpreted / fast:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Cost of applying a rule's transformation chain to feed items: a deep copy
+per transformation, a shallow copy per transformation, and the copy-once
+pipeline of CompiledRuleSet.
+
+    python -m tests.benchmarks.bench_transformations [items]
+"""
+
+import copy
+import sys
+import time
+import tracemalloc
+
+from src.domain.rule.entities.rule import Rule
+from src.domain.rule.enums.rule_type import RuleType
+from src.domain.rule.enums.transformation_type import TransformationType
+from src.domain.rule.services.rule_compiler import CompiledRuleSet
+from src.domain.rule.value_objects.rule_transformation import (
+    RuleTransformation,
+)
+
+RULE = Rule(
+    "chain",
+    RuleType.TRANSFORM,
+    transformations=[
+        RuleTransformation("title", TransformationType.PREPEND, "[news] "),
+        RuleTransformation("title", TransformationType.APPEND, " !"),
+        RuleTransformation("author", TransformationType.REPLACE, "anon"),
+        RuleTransformation("tracking", TransformationType.REMOVE, None),
+        RuleTransformation("label", TransformationType.APPEND, "mixed"),
+    ],
+)
+
+
+def make_items(count: int):
+    return [
+        {
+            "title": f"Item {i}",
+            "author": "Ann",
+            "link": f"http://example.org/{i}",
+            "content": "lorem ipsum " * 200,
+            "tags": ["news", "tech", f"tag-{i % 50}"],
+            "tracking": {"source": "rss", "campaign": i},
+        }
+        for i in range(count)
+    ]
+
+
+def deep_copy_each(items):
+    for item in items:
+        for transformation in RULE.transformations:
+            item = copy.deepcopy(item)
+            transformation.apply_in_place(item)
+        yield item
+
+
+def copy_each(items):
+    for item in items:
+        for transformation in RULE.transformations:
+            item = transformation.apply(item)
+        yield item
+
+
+def copy_once(items):
+    return CompiledRuleSet([RULE]).run(items)
+
+
+def run(name: str, strategy, items) -> None:
+    tracemalloc.start()
+    start = time.perf_counter()
+    results = list(strategy(items))
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{name}: {len(results)} items in {elapsed:.2f}s "
+        f"({len(results) / elapsed:,.0f} items/s), "
+        f"peak {peak / 2**20:.1f} MiB"
+    )
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    items = make_items(count)
+    run("deep copy per transformation", deep_copy_each, items)
+    run("copy per transformation", copy_each, items)
+    run("copy once", copy_once, items)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+import asyncio
+from typing import Awaitable, Callable, TypeVar
+
+import pytest
+
+from src.seedwork.infra.defaults.base import Base
+
+T = TypeVar("T")
+
+
+class TestDatabase:
+    """SQLite database created per test on the async engine."""
+
+    def __init__(self, url: str):
+        self.url = url
+
+    def run(self, scenario: Callable[..., Awaitable[T]]) -> T:
+        """Run `scenario(session_factory)` against a fresh schema."""
+        from sqlalchemy.ext.asyncio import (
+            async_sessionmaker,
+            create_async_engine,
+        )
+
+        async def main() -> T:
+            engine = create_async_engine(self.url)
+            try:
+                async with engine.begin() as connection:
+                    await connection.run_sync(Base.metadata.create_all)
+                return await scenario(
+                    async_sessionmaker(engine, expire_on_commit=False)
+                )
+            finally:
+                await engine.dispose()
+
+        return asyncio.run(main())
+
+
+@pytest.fixture
+def database(tmp_path) -> TestDatabase:
+    return TestDatabase(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
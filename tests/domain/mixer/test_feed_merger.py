@@ -0,0 +1,75 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.domain.feed.entities.feed_item import FeedItem
+from src.domain.mixer.services.feed_merger import merge_feed_items, take_page
+
+START = datetime(2024, 1, 1)
+
+
+def feed(name, *hours, newest_first=True):
+    items = [
+        FeedItem(f"{name}{hour}", "", "", START + timedelta(hours=hour))
+        for hour in hours
+    ]
+    return sorted(
+        items, key=lambda item: item.published_date, reverse=newest_first
+    )
+
+
+def titles(items):
+    return [item.title for item in items]
+
+
+def test_merges_newest_first():
+    merged = merge_feed_items([feed("a", 1, 4, 6), feed("b", 2, 3), []])
+
+    assert titles(merged) == ["a6", "a4", "b3", "b2", "a1"]
+
+
+def test_merges_oldest_first():
+    sources = [
+        feed("a", 1, 4, newest_first=False),
+        feed("b", 2, 3, newest_first=False),
+    ]
+
+    merged = merge_feed_items(sources, newest_first=False)
+
+    assert titles(merged) == ["a1", "b2", "b3", "a4"]
+
+
+def test_merge_keeps_source_order_on_equal_dates():
+    merged = merge_feed_items([feed("a", 1), feed("b", 1), feed("c", 1)])
+
+    assert titles(merged) == ["a1", "b1", "c1"]
+
+
+def test_take_page_consumes_only_up_to_the_page():
+    consumed = []
+
+    def source():
+        for item in feed("a", *range(100)):
+            consumed.append(item)
+            yield item
+
+    page = take_page(merge_feed_items([source()]), page=2, page_size=10)
+
+    assert titles(page) == [f"a{hour}" for hour in range(89, 79, -1)]
+    assert len(consumed) <= 21
+
+
+@pytest.mark.parametrize(
+    "page, expected",
+    [(1, ["a4", "a3"]), (3, ["a0"]), (4, [])],
+)
+def test_take_page_bounds(page, expected):
+    items = feed("a", 0, 1, 2, 3, 4)
+
+    assert titles(take_page(iter(items), page, page_size=2)) == expected
+
+
+@pytest.mark.parametrize("page, page_size", [(0, 10), (-1, 10), (1, 0)])
+def test_take_page_rejects_invalid_pages(page, page_size):
+    with pytest.raises(ValueError):
+        take_page(iter([]), page, page_size)
@@ -0,0 +1,164 @@
+from datetime import datetime, timedelta
+
+from src.domain.feed.entities.feed import Feed
+from src.domain.feed.entities.feed_item import FeedItem
+from src.domain.feed.value_objects.feed_url import FeedUrl
+from src.domain.mixer.entities.mixer import Mixer
+from src.domain.mixer.services.incremental_mixer import IncrementalMixer
+from src.domain.rule.entities.rule import Rule
+from src.domain.rule.enums.comparison_operator import ComparisonOperator
+from src.domain.rule.enums.rule_type import RuleType
+from src.domain.rule.enums.transformation_type import TransformationType
+from src.domain.rule.services.rule_compiler import RuleCompiler
+from src.domain.rule.value_objects.rule_condition import RuleCondition
+from src.domain.rule.value_objects.rule_transformation import (
+    RuleTransformation,
+)
+
+START = datetime(2024, 1, 1)
+
+
+def make_feed(feed_id: str) -> Feed:
+    return Feed(feed_id, FeedUrl(f"http://{feed_id}.test/rss"), feed_id)
+
+
+def add_items(feed: Feed, *hours: int):
+    items = [
+        FeedItem(
+            f"{feed.id} {'skip' if hour % 3 == 0 else 'keep'} {hour}",
+            "",
+            f"http://{feed.id}.test/{hour}",
+            START + timedelta(hours=hour),
+            feed_source_id=feed.id,
+            guid=f"{feed.id}-{hour}",
+        )
+        for hour in hours
+    ]
+    for item in items:
+        feed.add_item(item)
+    return items
+
+
+def make_mixer():
+    first, second = make_feed("first"), make_feed("second")
+    mixer = Mixer("mixer", "mixer")
+    mixer.add_feed(first)
+    mixer.add_feed(second)
+    mixer.add_rule(
+        Rule(
+            "drop skipped",
+            RuleType.FILTER,
+            conditions=[
+                RuleCondition("title", ComparisonOperator.NOT_CONTAINS, "skip")
+            ],
+            priority=1,
+        )
+    )
+    mixer.add_rule(
+        Rule(
+            "label",
+            RuleType.TAG,
+            transformations=[
+                RuleTransformation("label", TransformationType.APPEND, "x")
+            ],
+        )
+    )
+    return mixer, first, second
+
+
+def full_recompute(mixer):
+    return IncrementalMixer(RuleCompiler()).recompute(mixer)
+
+
+def titles(items):
+    return [item["title"] for item in items]
+
+
+def test_update_matches_full_recompute_after_additions():
+    mixer, first, second = make_mixer()
+    add_items(first, 1, 4, 7)
+    add_items(second, 2, 5)
+    incremental = IncrementalMixer(RuleCompiler())
+    incremental.recompute(mixer)
+
+    incremental.update(mixer, add_items(first, 8, 10, 12))
+    result = incremental.update(mixer, add_items(second, 11, 13))
+
+    assert titles(result) == titles(full_recompute(mixer))
+    assert all(item["label"] == "x" for item in result)
+    assert incremental.full_recomputes == 1
+    assert incremental.incremental_updates == 2
+
+
+def test_output_after_unreported_additions_is_recomputed():
+    mixer, first, _ = make_mixer()
+    add_items(first, 1)
+    incremental = IncrementalMixer(RuleCompiler())
+    assert titles(incremental.output(mixer)) == ["first keep 1"]
+
+    add_items(first, 2)
+
+    assert titles(incremental.output(mixer)) == [
+        "first keep 2",
+        "first keep 1",
+    ]
+    assert incremental.full_recomputes == 2
+
+
+def test_update_with_unaccounted_changes_recomputes():
+    mixer, first, second = make_mixer()
+    add_items(first, 1)
+    incremental = IncrementalMixer(RuleCompiler())
+    incremental.recompute(mixer)
+    add_items(second, 2)
+
+    result = incremental.update(mixer, add_items(first, 4))
+
+    assert titles(result) == titles(full_recompute(mixer))
+    assert incremental.full_recomputes == 2
+    assert incremental.incremental_updates == 0
+
+
+def test_rule_edit_recomputes_to_the_new_rules():
+    mixer, first, _ = make_mixer()
+    add_items(first, 1, 2, 3, 4)
+    incremental = IncrementalMixer(RuleCompiler())
+    incremental.recompute(mixer)
+
+    mixer.rules[0].conditions = [
+        RuleCondition("title", ComparisonOperator.CONTAINS, "skip")
+    ]
+    result = incremental.update(mixer, add_items(first, 6))
+
+    assert titles(result) == ["first skip 6", "first skip 3"]
+    assert titles(result) == titles(full_recompute(mixer))
+
+
+def test_stateful_rules_always_recompute():
+    mixer, first, _ = make_mixer()
+    mixer.add_rule(Rule("sort", RuleType.SORT))
+    add_items(first, 1)
+    incremental = IncrementalMixer(RuleCompiler())
+    incremental.output(mixer)
+
+    result = incremental.update(mixer, add_items(first, 2))
+
+    assert titles(result) == titles(full_recompute(mixer))
+    assert incremental.full_recomputes == 2
+
+
+def test_update_feed_updates_every_tracked_mixer_with_the_feed():
+    mixer, first, second = make_mixer()
+    other = Mixer("other", "other")
+    other.add_feed(second)
+    add_items(first, 1)
+    incremental = IncrementalMixer(RuleCompiler())
+    incremental.output(mixer)
+    incremental.output(other)
+
+    assert incremental.update_feed(first, add_items(first, 2)) == 1
+    assert incremental.update_feed(second, add_items(second, 4)) == 2
+
+    assert titles(incremental.output(mixer)) == titles(full_recompute(mixer))
+    assert titles(incremental.output(other)) == ["second keep 4"]
+    assert incremental.full_recomputes == 2
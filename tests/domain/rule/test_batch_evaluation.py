@@ -0,0 +1,252 @@
+from datetime import datetime, timedelta, timezone
+
+import numpy
+import pytest
+
+from src.domain.feed.entities.feed_item import FeedItem
+from src.domain.feed.value_objects import feed_item_batch
+from src.domain.feed.value_objects.feed_item_batch import (
+    MAX_ARRAY_STRING_LENGTH,
+    MISSING,
+    FeedItemBatch,
+)
+from src.domain.rule.entities.rule import Rule
+from src.domain.rule.enums.comparison_operator import ComparisonOperator
+from src.domain.rule.enums.logic_operator import LogicOperator
+from src.domain.rule.enums.rule_type import RuleType
+from src.domain.rule.value_objects.rule_condition import RuleCondition
+
+ITEMS = [
+    {"title": "Python news", "author": "Ann", "score": 5},
+    {"title": "Rust news", "author": None, "score": 1},
+    {"title": "None", "score": 3},
+    {"title": "weekly", "author": "None", "score": None},
+    {"author": "Bob"},
+]
+
+CONDITIONS = [
+    RuleCondition("author", ComparisonOperator.EQUALS, None),
+    RuleCondition("author", ComparisonOperator.NOT_EQUALS, None),
+    RuleCondition("author", ComparisonOperator.EQUALS, "Ann"),
+    RuleCondition("author", ComparisonOperator.NOT_EQUALS, "Ann"),
+    RuleCondition("author", ComparisonOperator.REGEX, "^None$"),
+    RuleCondition("title", ComparisonOperator.CONTAINS, "news"),
+    RuleCondition("title", ComparisonOperator.NOT_CONTAINS, "news"),
+    RuleCondition("title", ComparisonOperator.REGEX, "(?i)^n"),
+    RuleCondition("score", ComparisonOperator.EQUALS, None),
+    RuleCondition("score", ComparisonOperator.REGEX, "None"),
+    RuleCondition("missing", ComparisonOperator.EQUALS, None),
+]
+
+
+def evaluate_each(condition, items):
+    results = []
+    for item in items:
+        try:
+            results.append(condition.evaluate(item))
+        except TypeError:
+            results.append(TypeError)
+    return results
+
+
+def evaluate_batch(condition, items, fields):
+    try:
+        return list(
+            condition.evaluate_batch(FeedItemBatch.from_dicts(items, fields))
+        )
+    except TypeError:
+        return TypeError
+
+
+@pytest.mark.parametrize("condition", CONDITIONS, ids=repr)
+def test_batch_evaluation_matches_item_evaluation(condition):
+    fields = ["title", "author", "score", "missing"]
+
+    expected = evaluate_each(condition, ITEMS)
+
+    if TypeError in expected:
+        assert evaluate_batch(condition, ITEMS, fields) is TypeError
+    else:
+        assert evaluate_batch(condition, ITEMS, fields) == expected
+
+
+@pytest.mark.parametrize(
+    "operator, value",
+    [
+        (ComparisonOperator.GREATER_THAN, 2),
+        (ComparisonOperator.LESS_THAN, 2),
+        (ComparisonOperator.CONTAINS, "x"),
+    ],
+)
+def test_batch_raises_on_none_like_item_evaluation(operator, value):
+    condition = RuleCondition("score", operator, value)
+    items = [{"score": None}]
+
+    with pytest.raises(TypeError):
+        condition.evaluate(items[0])
+    with pytest.raises(TypeError):
+        condition.evaluate_batch(FeedItemBatch.from_dicts(items, ["score"]))
+
+
+def test_from_dicts_keeps_missing_fields_apart_from_none():
+    batch = FeedItemBatch.from_dicts([{"a": None}, {}], ["a"])
+
+    assert list(batch.column("a")) == [None, MISSING]
+
+
+def test_rule_matches_batch_agrees_with_matches():
+    rule = Rule(
+        "rule",
+        RuleType.FILTER,
+        conditions=[
+            RuleCondition("title", ComparisonOperator.CONTAINS, "news"),
+            RuleCondition("author", ComparisonOperator.EQUALS, None),
+            RuleCondition(
+                "author",
+                ComparisonOperator.EQUALS,
+                "Bob",
+                logic=LogicOperator.OR,
+            ),
+        ],
+    )
+    items = [item for item in ITEMS if "title" in item or "author" in item]
+    batch = FeedItemBatch.from_dicts(items, ["title", "author"])
+
+    assert list(rule.matches_batch(batch)) == [
+        rule.matches(item) for item in items
+    ]
+    assert list(rule.matches_batch(batch)) == [
+        False,
+        True,
+        False,
+        False,
+        True,
+    ]
+
+
+def test_from_items_builds_one_column_per_field():
+    published = datetime(2024, 1, 1)
+    items = [
+        FeedItem("a", "c", "l", published, author=None, tags=["x"]),
+        FeedItem("b", "c", "l", published, author="Ann", tags=[]),
+    ]
+    condition = RuleCondition("author", ComparisonOperator.EQUALS, None)
+
+    batch = FeedItemBatch.from_items(items)
+
+    assert list(condition.evaluate_batch(batch)) == [True, False]
+
+
+def test_numeric_columns_are_compared_as_arrays():
+    batch = FeedItemBatch({"score": numpy.array([1, 5, 3])})
+    condition = RuleCondition("score", ComparisonOperator.GREATER_THAN, 2)
+
+    mask = condition.evaluate_batch(batch)
+
+    assert isinstance(mask, numpy.ndarray)
+    assert mask.tolist() == [False, True, True]
+
+
+UTC = timezone.utc
+PUBLISHED = [datetime(2024, 1, day, tzinfo=UTC) for day in (1, 5, 9)] + [
+    datetime(2024, 1, 3, 21, tzinfo=timezone(timedelta(hours=-3)))
+]
+
+
+def parsed_items():
+    return [
+        FeedItem(
+            f"Item {number} about Python" if number % 2 else f"Item {number}",
+            "text",
+            f"https://example.com/{number}",
+            published,
+            author="Ann",
+        )
+        for number, published in enumerate(PUBLISHED)
+    ]
+
+
+def test_from_items_builds_typed_arrays():
+    batch = FeedItemBatch.from_items(parsed_items())
+
+    assert batch.column("published_date").dtype.kind == "M"
+    assert batch.column("title").dtype.kind == "U"
+    assert isinstance(batch.column("tags"), list)
+    assert isinstance(batch.column("guid"), list)
+
+
+def test_from_dicts_keeps_columns_with_gaps_as_lists():
+    batch = FeedItemBatch.from_dicts(ITEMS, ["title", "score"])
+    scores = FeedItemBatch.from_dicts(ITEMS[:3], ["score"])
+
+    assert isinstance(batch.column("title"), list)
+    assert isinstance(batch.column("score"), list)
+    assert scores.column("score").dtype.kind == "i"
+
+
+def test_long_strings_stay_in_lists():
+    long_title = "x" * (MAX_ARRAY_STRING_LENGTH + 1)
+    batch = FeedItemBatch.from_dicts([{"title": long_title}], ["title"])
+
+    assert isinstance(batch.column("title"), list)
+
+
+@pytest.mark.parametrize(
+    "condition",
+    [
+        RuleCondition("title", ComparisonOperator.CONTAINS, "Python"),
+        RuleCondition("title", ComparisonOperator.NOT_CONTAINS, "Python"),
+        RuleCondition("title", ComparisonOperator.EQUALS, "Item 0"),
+        RuleCondition("title", ComparisonOperator.REGEX, "[13]"),
+        RuleCondition(
+            "published_date",
+            ComparisonOperator.GREATER_THAN,
+            datetime(2024, 1, 4, tzinfo=UTC),
+        ),
+        RuleCondition(
+            "published_date",
+            ComparisonOperator.EQUALS,
+            datetime(2024, 1, 4, 0, tzinfo=UTC),
+        ),
+        RuleCondition(
+            "published_date",
+            ComparisonOperator.EQUALS,
+            datetime(2024, 1, 4),
+        ),
+        RuleCondition(
+            "published_date",
+            ComparisonOperator.NOT_EQUALS,
+            datetime(2024, 1, 4),
+        ),
+    ],
+)
+def test_typed_arrays_match_per_item_evaluation(condition):
+    items = parsed_items()
+    batch = FeedItemBatch.from_items(items)
+
+    mask = condition.evaluate_batch(batch)
+
+    vectorized = condition.operator != ComparisonOperator.REGEX
+    assert isinstance(mask, numpy.ndarray) == vectorized
+    assert list(mask) == [condition.evaluate(vars(item)) for item in items]
+
+
+def test_naive_date_ordering_raises_like_python():
+    batch = FeedItemBatch.from_items(parsed_items())
+    condition = RuleCondition(
+        "published_date", ComparisonOperator.LESS_THAN, datetime(2024, 1, 4)
+    )
+
+    with pytest.raises(TypeError):
+        condition.evaluate_batch(batch)
+
+
+def test_batches_fall_back_to_lists_without_numpy(monkeypatch):
+    monkeypatch.setattr(feed_item_batch, "numpy", None)
+    items = parsed_items()
+    condition = RuleCondition("title", ComparisonOperator.CONTAINS, "Python")
+
+    batch = FeedItemBatch.from_items(items)
+
+    assert isinstance(batch.column("title"), list)
+    assert condition.evaluate_batch(batch) == [False, True, False, True]
@@ -0,0 +1,127 @@
+import re
+
+import pytest
+
+from src.domain.rule.entities.rule import Rule
+from src.domain.rule.enums.comparison_operator import ComparisonOperator
+from src.domain.rule.enums.logic_operator import LogicOperator
+from src.domain.rule.enums.rule_type import RuleType
+from src.domain.rule.services.pattern_cache import PatternCache, pattern_cache
+from src.domain.rule.services.rule_compiler import compile_predicate
+from src.domain.rule.value_objects.rule_condition import RuleCondition
+
+
+def alternatives(*conditions):
+    return Rule(
+        "rule",
+        RuleType.FILTER,
+        conditions=[
+            RuleCondition(field, operator, value, logic=LogicOperator.OR)
+            for field, operator, value in conditions
+        ],
+    )
+
+
+def test_counts_hits_and_misses():
+    cache = PatternCache()
+
+    first = cache.get("a+")
+    second = cache.get("a+")
+    cache.get("b+")
+
+    assert first is second
+    assert cache.stats() == {
+        "hits": 1,
+        "misses": 2,
+        "size": 2,
+        "max_entries": 1024,
+    }
+
+
+def test_evicts_least_recently_used():
+    cache = PatternCache(max_entries=2)
+    first = cache.get("a")
+    cache.get("b")
+    cache.get("a")
+    cache.get("c")
+
+    assert cache.get("a") is first
+    assert cache.stats()["size"] == 2
+    cache.get("b")
+    assert cache.misses == 4
+
+
+def test_invalid_pattern_is_not_cached():
+    cache = PatternCache()
+
+    with pytest.raises(re.error):
+        cache.get("(")
+
+    assert cache.stats()["size"] == 0
+
+
+def test_clear_resets_counters():
+    cache = PatternCache()
+    cache.get("a")
+    cache.get("a")
+
+    cache.clear()
+
+    assert cache.stats()["hits"] == cache.stats()["misses"] == 0
+    assert cache.stats()["size"] == 0
+
+
+def test_regex_conditions_share_compiled_patterns():
+    first = RuleCondition("title", ComparisonOperator.REGEX, "shared-[0-9]+")
+    second = RuleCondition("body", ComparisonOperator.REGEX, "shared-[0-9]+")
+
+    assert first.pattern is second.pattern
+    assert first.pattern is pattern_cache.get("shared-[0-9]+")
+
+
+def test_invalid_regex_condition_is_rejected():
+    with pytest.raises(ValueError):
+        RuleCondition("title", ComparisonOperator.REGEX, "(")
+
+
+def test_fold_alternatives_compiles_one_alternation():
+    rule = alternatives(
+        ("title", ComparisonOperator.CONTAINS, "a.b"),
+        ("title", ComparisonOperator.REGEX, "^go"),
+    )
+
+    predicate = compile_predicate(rule, fold_alternatives=True)
+    misses = pattern_cache.misses
+
+    pattern_cache.get(r"(?:a\.b)|(?:^go)")
+
+    assert pattern_cache.misses == misses
+    assert predicate({"title": "xa.bx"})
+    assert predicate({"title": "gopher"})
+    assert not predicate({"title": "axb"})
+    assert not predicate({})
+
+
+def test_fold_alternatives_falls_back_on_non_string_values():
+    rule = alternatives(
+        ("tags", ComparisonOperator.CONTAINS, "go"),
+        ("tags", ComparisonOperator.CONTAINS, "rust"),
+    )
+
+    predicate = compile_predicate(rule, fold_alternatives=True)
+
+    assert predicate({"tags": ["rust"]})
+    assert not predicate({"tags": ["gopher"]})
+    assert predicate({"tags": "gopher"})
+
+
+def test_fold_alternatives_keeps_patterns_with_groups_apart():
+    rule = alternatives(
+        ("title", ComparisonOperator.REGEX, r"(a)\1"),
+        ("title", ComparisonOperator.REGEX, r"(b)\1"),
+    )
+
+    predicate = compile_predicate(rule, fold_alternatives=True)
+
+    assert predicate({"title": "xbb"})
+    assert not predicate({"title": "ab"})
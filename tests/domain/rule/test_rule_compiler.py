@@ -0,0 +1,312 @@
+import pytest
+
+from src.domain.mixer.entities.mixer import Mixer
+from src.domain.rule.entities.rule import Rule
+from src.domain.rule.enums.comparison_operator import ComparisonOperator
+from src.domain.rule.enums.logic_operator import LogicOperator
+from src.domain.rule.enums.rule_type import RuleType
+from src.domain.rule.enums.transformation_type import TransformationType
+from src.domain.rule.services.rule_compiler import (
+    CompiledRuleSet,
+    RuleCompiler,
+    compile_predicate,
+)
+from src.domain.rule.value_objects.rule_condition import RuleCondition
+from src.domain.rule.value_objects.rule_transformation import (
+    RuleTransformation,
+)
+
+ITEMS = [
+    {"title": "Python 3.13 released", "author": "Ann", "score": 9},
+    {"title": "Rust weekly", "author": "Bob", "score": 4, "tags": ["rust"]},
+    {"title": "python tips", "author": None, "score": 1},
+    {"title": "Go news", "score": 7, "tags": ["go", "news"]},
+    {"author": "Ann"},
+]
+
+
+def condition(field, operator, value, logic=LogicOperator.AND):
+    return RuleCondition(field, operator, value, logic=logic)
+
+
+def interpret(rules, item):
+    """The per-item interpreter the compiled pipeline must agree with."""
+    for rule in sorted(rules, key=lambda rule: -rule.priority):
+        if rule.rule_type in (RuleType.SORT, RuleType.GROUP):
+            continue
+        if not rule.matches(item):
+            if rule.rule_type == RuleType.FILTER:
+                return None
+            continue
+        item = rule.apply(item)
+    return item
+
+
+GROUPED_CONDITIONS = [
+    [
+        condition("title", ComparisonOperator.CONTAINS, "Python"),
+        condition("score", ComparisonOperator.GREATER_THAN, 5),
+    ],
+    [
+        condition("title", ComparisonOperator.REGEX, "(?i)python"),
+        condition(
+            "author", ComparisonOperator.EQUALS, "Bob", LogicOperator.OR
+        ),
+    ],
+    [
+        condition("author", ComparisonOperator.EQUALS, "Ann"),
+        condition("score", ComparisonOperator.LESS_THAN, 5),
+        condition("tags", ComparisonOperator.CONTAINS, "go", LogicOperator.OR),
+    ],
+    [
+        condition("author", ComparisonOperator.NOT_EQUALS, None),
+        condition(
+            "title", ComparisonOperator.NOT_CONTAINS, "o", LogicOperator.OR
+        ),
+    ],
+]
+
+
+@pytest.mark.parametrize("fold_alternatives", [False, True])
+@pytest.mark.parametrize("conditions", GROUPED_CONDITIONS)
+def test_compiled_predicate_agrees_with_rule_matches(
+    conditions, fold_alternatives
+):
+    rule = Rule("rule", RuleType.FILTER, conditions=conditions)
+    predicate = compile_predicate(rule, fold_alternatives)
+
+    assert [predicate(item) for item in ITEMS] == [
+        rule.matches(item) for item in ITEMS
+    ]
+
+
+def test_and_binds_tighter_than_or():
+    rule = Rule(
+        "rule",
+        RuleType.FILTER,
+        conditions=[
+            condition("author", ComparisonOperator.EQUALS, "Bob"),
+            condition("score", ComparisonOperator.GREATER_THAN, 100),
+            condition(
+                "author", ComparisonOperator.EQUALS, "Ann", LogicOperator.OR
+            ),
+        ],
+    )
+    predicate = compile_predicate(rule)
+
+    assert [predicate(item) for item in ITEMS] == [
+        True,
+        False,
+        False,
+        False,
+        True,
+    ]
+
+
+def test_or_short_circuits_on_first_true_group():
+    calls = []
+
+    def record(value):
+        calls.append(value)
+        return value
+
+    rule = Rule(
+        "rule",
+        RuleType.TRANSFORM,
+        conditions=[
+            condition("author", ComparisonOperator.EQUALS, "Ann"),
+            condition(
+                "author", ComparisonOperator.EQUALS, "Bob", LogicOperator.OR
+            ),
+        ],
+        transformations=[
+            RuleTransformation(
+                "author", TransformationType.CUSTOM, None, record
+            )
+        ],
+    )
+    compiled = CompiledRuleSet([rule])
+
+    assert compiled.process({"author": "Ann"}) == {"author": "Ann"}
+    assert compiled.process({"author": "Eve"}) == {"author": "Eve"}
+    assert calls == ["Ann"]
+
+
+def test_rule_without_conditions_matches_everything():
+    rule = Rule("rule", RuleType.FILTER)
+
+    assert compile_predicate(rule) is None
+    assert list(CompiledRuleSet([rule]).run(ITEMS)) == ITEMS
+
+
+def test_pipeline_agrees_with_interpreter():
+    rules = [
+        Rule(
+            "keep python or scored",
+            RuleType.FILTER,
+            conditions=[
+                condition("title", ComparisonOperator.REGEX, "(?i)python"),
+                condition(
+                    "score",
+                    ComparisonOperator.GREATER_THAN,
+                    3,
+                    LogicOperator.OR,
+                ),
+            ],
+            priority=10,
+        ),
+        Rule(
+            "tag ann",
+            RuleType.TAG,
+            conditions=[condition("author", ComparisonOperator.EQUALS, "Ann")],
+            transformations=[
+                RuleTransformation(
+                    "title", TransformationType.PREPEND, "[Ann] "
+                ),
+                RuleTransformation("label", TransformationType.APPEND, "ann"),
+            ],
+            priority=5,
+        ),
+        Rule(
+            "shout",
+            RuleType.TRANSFORM,
+            transformations=[
+                RuleTransformation(
+                    "title", TransformationType.CUSTOM, None, str.upper
+                ),
+                RuleTransformation("score", TransformationType.REMOVE, None),
+                RuleTransformation(
+                    "author", TransformationType.REPLACE, "anonymous"
+                ),
+            ],
+        ),
+        Rule("sort", RuleType.SORT),
+    ]
+    items = [item for item in ITEMS if "title" in item]
+
+    compiled = CompiledRuleSet(rules)
+
+    assert compiled.has_stateful_rules
+    assert list(compiled.run(items)) == [
+        result
+        for result in (interpret(rules, item) for item in items)
+        if result is not None
+    ]
+
+
+def test_filter_that_does_not_match_drops_the_item():
+    rule = Rule(
+        "rule",
+        RuleType.FILTER,
+        conditions=[condition("author", ComparisonOperator.EQUALS, "Ann")],
+    )
+    compiled = CompiledRuleSet([rule])
+
+    assert compiled.process({"author": "Bob"}) is None
+    assert compiled.process({}) is None
+
+
+def test_compiler_caches_by_version():
+    compiler = RuleCompiler(max_entries=2)
+    rules = [Rule("rule", RuleType.FILTER)]
+
+    first = compiler.compile(rules, "v1")
+
+    assert compiler.compile([], "v1") is first
+    assert compiler.compile(rules, "v2") is not first
+
+
+def test_compiler_evicts_least_recently_used():
+    compiler = RuleCompiler(max_entries=2)
+    first = compiler.compile([], "v1")
+    compiler.compile([], "v2")
+    compiler.compile([], "v1")
+    compiler.compile([], "v3")
+
+    assert compiler.compile([], "v1") is first
+    assert compiler.compile([], "v2").version == "v2"
+    assert len(compiler._cache) == 2
+
+
+def test_mixer_rule_edit_recompiles():
+    compiler = RuleCompiler()
+    mixer = Mixer("mixer")
+    rule = Rule("rule", RuleType.FILTER)
+    mixer.add_rule(rule)
+
+    first = compiler.compile_mixer(mixer)
+    assert compiler.compile_mixer(mixer) is first
+
+    rule.add_condition(condition("author", ComparisonOperator.EQUALS, "Ann"))
+    second = compiler.compile_mixer(mixer)
+
+    assert second is not first
+    assert list(second.run(ITEMS)) == [ITEMS[0], ITEMS[4]]
+
+
+@pytest.mark.parametrize(
+    "edit",
+    [
+        lambda rule: setattr(
+            rule,
+            "conditions",
+            [condition("author", ComparisonOperator.EQUALS, "Ann")],
+        ),
+        lambda rule: setattr(
+            rule,
+            "transformations",
+            [RuleTransformation("title", TransformationType.REMOVE, None)],
+        ),
+        lambda rule: setattr(rule, "rule_type", RuleType.TRANSFORM),
+        lambda rule: setattr(rule, "priority", 3),
+    ],
+)
+def test_mixer_rule_assignment_recompiles(edit):
+    compiler = RuleCompiler()
+    mixer = Mixer("mixer")
+    mixer.add_rule(Rule("rule", RuleType.FILTER))
+    first = compiler.compile_mixer(mixer)
+
+    edit(mixer.rules[0])
+
+    assert compiler.compile_mixer(mixer) is not first
+
+
+def test_reloaded_rule_with_new_conditions_recompiles():
+    compiler = RuleCompiler()
+
+    def load_mixer(word):
+        mixer = Mixer("mixer", mixer_id="m1")
+        mixer.add_rule(
+            Rule(
+                "rule",
+                RuleType.FILTER,
+                rule_id="r1",
+                conditions=[
+                    condition("title", ComparisonOperator.CONTAINS, word)
+                ],
+            )
+        )
+        return mixer
+
+    python = compiler.compile_mixer(load_mixer("python"))
+    rust = compiler.compile_mixer(load_mixer("Rust"))
+
+    assert compiler.compile_mixer(load_mixer("python")) is python
+    assert list(rust.run(ITEMS[:4])) == [ITEMS[1]]
+
+
+def test_in_place_condition_edit_recompiles():
+    compiler = RuleCompiler()
+    mixer = Mixer("mixer")
+    rule = Rule(
+        "rule",
+        RuleType.FILTER,
+        conditions=[condition("tags", ComparisonOperator.EQUALS, ["go"])],
+    )
+    mixer.add_rule(rule)
+    first = compiler.compile_mixer(mixer)
+
+    rule.conditions.append(condition("author", ComparisonOperator.EQUALS, "A"))
+
+    assert compiler.compile_mixer(mixer) is not first
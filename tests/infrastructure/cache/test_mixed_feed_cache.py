@@ -0,0 +1,111 @@
+from datetime import datetime
+
+from src.domain.feed.entities.feed import Feed
+from src.domain.feed.entities.feed_item import FeedItem
+from src.domain.feed.value_objects.feed_url import FeedUrl
+from src.domain.mixer.entities.mixer import Mixer
+from src.domain.rule.entities.rule import Rule
+from src.domain.rule.enums.comparison_operator import ComparisonOperator
+from src.domain.rule.enums.rule_type import RuleType
+from src.domain.rule.value_objects.rule_condition import RuleCondition
+from src.infrastructure.cache.mixed_feed_cache import MixedFeedCache
+
+
+def make_feed(feed_id: str) -> Feed:
+    return Feed(feed_id, FeedUrl(f"http://{feed_id}.test/rss"), feed_id)
+
+
+def make_mixer(mixer_id: str, *feeds: Feed) -> Mixer:
+    mixer = Mixer(mixer_id, mixer_id)
+    for feed in feeds:
+        mixer.add_feed(feed)
+    return mixer
+
+
+def test_hit_after_put_and_miss_before():
+    cache = MixedFeedCache()
+    mixer = make_mixer("m", make_feed("a"))
+
+    assert cache.get("m", "rss") is None
+    cache.put(mixer, "rss", b"<rss/>")
+
+    assert cache.get("m", "rss") == b"<rss/>"
+    assert cache.get("m", "atom") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 2
+
+
+def test_feed_refresh_invalidates_only_mixers_with_that_feed():
+    cache = MixedFeedCache()
+    shared, other = make_feed("shared"), make_feed("other")
+    cache.put(make_mixer("m1", shared), "rss", b"1")
+    cache.put(make_mixer("m1", shared), "atom", b"1")
+    cache.put(make_mixer("m2", shared, other), "rss", b"2")
+    cache.put(make_mixer("m3", other), "rss", b"3")
+
+    assert cache.invalidate_feed("shared") == 3
+
+    assert cache.get("m1", "rss") is None
+    assert cache.get("m2", "rss") is None
+    assert cache.get("m3", "rss") == b"3"
+    assert cache.invalidate_feed("shared") == 0
+    assert cache.stats()["size_bytes"] == 1
+
+
+def test_invalidate_mixer_drops_all_its_variants():
+    cache = MixedFeedCache()
+    mixer = make_mixer("m", make_feed("a"))
+    cache.put(mixer, "rss", b"r")
+    cache.put(mixer, "atom", b"a")
+    cache.put(make_mixer("n", make_feed("a")), "rss", b"n")
+
+    assert cache.invalidate_mixer("m") == 2
+
+    assert cache.get("n", "rss") == b"n"
+    assert cache.invalidate_feed("a") == 1
+
+
+def test_stale_version_is_a_miss():
+    cache = MixedFeedCache()
+    feed = make_feed("a")
+    mixer = make_mixer("m", feed)
+    cache.put(mixer, "rss", b"old")
+
+    assert cache.get("m", "rss", cache.version_of(mixer)) == b"old"
+
+    feed.add_item(FeedItem("t", "", "http://a.test/1", datetime(2024, 1, 1)))
+    assert cache.get("m", "rss", cache.version_of(mixer)) is None
+
+    rule = Rule("r", RuleType.FILTER)
+    mixer.add_rule(rule)
+    cache.put(mixer, "rss", b"new")
+    rule.add_condition(RuleCondition("title", ComparisonOperator.EQUALS, "t"))
+
+    assert cache.get("m", "rss", cache.version_of(mixer)) is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_evicts_least_recently_used_over_the_byte_budget():
+    cache = MixedFeedCache(max_bytes=10)
+    feed = make_feed("a")
+    cache.put(make_mixer("m1", feed), "rss", b"1234")
+    cache.put(make_mixer("m2", feed), "rss", b"1234")
+    cache.get("m1", "rss")
+    cache.put(make_mixer("m3", feed), "rss", b"1234")
+
+    assert cache.get("m2", "rss") is None
+    assert cache.get("m1", "rss") == b"1234"
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["size_bytes"] == 8
+    assert cache.invalidate_feed("a") == 2
+
+
+def test_output_larger_than_the_budget_is_not_cached():
+    cache = MixedFeedCache(max_bytes=4)
+    mixer = make_mixer("m", make_feed("a"))
+    cache.put(mixer, "rss", b"old")
+
+    cache.put(mixer, "rss", b"too large")
+
+    assert cache.get("m", "rss") is None
+    assert cache.stats()["size_bytes"] == 0
@@ -0,0 +1,128 @@
+from datetime import datetime
+
+from src.domain.feed.entities.feed_item import FeedItem
+from src.domain.feed.services.item_fingerprint import item_keys
+from src.infrastructure.dedup.deduplicator import FeedItemDeduplicator
+from src.infrastructure.repository.seen_item_repository import (
+    SqlSeenItemRepository,
+)
+
+PUBLISHED = datetime(2024, 1, 1)
+
+
+def item(guid=None, title="Daily digest", content="", link=None):
+    return FeedItem(title, content, link, PUBLISHED, guid=guid)
+
+
+def filter_new(database, *batches):
+    """Run each batch through a freshly warmed deduplicator."""
+
+    async def scenario(session_factory):
+        kept = []
+        for batch in batches:
+            async with session_factory() as session:
+                deduplicator = FeedItemDeduplicator(
+                    SqlSeenItemRepository(session), expected_items=1000
+                )
+                await deduplicator.warm()
+                new_items = await deduplicator.filter_new(batch)
+                kept.append([entry.guid or entry.title for entry in new_items])
+        return kept
+
+    return database.run(scenario)
+
+
+def test_guid_is_the_only_key_of_an_item_with_one():
+    assert item_keys(item("post-1", link="https://example.com/")) == [
+        "guid:post-1"
+    ]
+    assert [key.split(":")[0] for key in item_keys(item())] == ["hash"]
+    assert [
+        key.split(":")[0] for key in item_keys(item(link="http://a.test/x"))
+    ] == ["link", "hash"]
+
+
+def test_items_with_distinct_guids_sharing_link_and_title_are_kept(
+    database,
+):
+    homepage = "https://example.com/"
+    batch = [
+        item("post-1", link=homepage),
+        item("post-2", link=homepage),
+        item("post-3", title="Other", link=homepage),
+    ]
+
+    assert filter_new(database, batch) == [["post-1", "post-2", "post-3"]]
+
+
+def test_refetched_guid_is_a_duplicate(database):
+    assert filter_new(
+        database,
+        [item("post-1", link="http://a.test/1")],
+        [
+            item("post-1", title="edited", link="http://a.test/1"),
+            item("post-2", link="http://a.test/1"),
+        ],
+    ) == [["post-1"], ["post-2"]]
+
+
+def test_items_without_guid_match_on_link_or_content(database):
+    assert filter_new(
+        database,
+        [item(title="First", link="http://www.a.test/post/?utm_source=x")],
+        [
+            item(title="Copy", link="http://a.test/post"),
+            item(title="First", link="http://b.test/mirror"),
+            item(title="Second", link="http://a.test/other"),
+        ],
+    ) == [["First"], ["Second"]]
+
+
+def test_duplicates_within_one_batch_are_dropped(database):
+    batch = [item("post-1"), item("post-1"), item(title="a"), item(title="a")]
+
+    assert filter_new(database, batch) == [["post-1", "a"]]
+
+
+def test_seen_keys_are_stored_once(database):
+    async def scenario(session_factory):
+        async with session_factory() as session:
+            repository = SqlSeenItemRepository(session, chunk_size=2)
+            await repository.add_many(["a", "b", "a"])
+            await repository.add_many(["b", "c", "d"])
+            return (
+                [key async for key in repository.all_keys()],
+                await repository.contains("c"),
+                await repository.contains("z"),
+            )
+
+    keys, has_c, has_z = database.run(scenario)
+
+    assert sorted(keys) == ["a", "b", "c", "d"]
+    assert has_c and not has_z
+
+
+def test_near_duplicates_are_detected_after_warming(database):
+    text = (
+        "the quick brown fox jumps over the lazy dog while python ships a "
+        "new release with faster startup better errors and many library "
+        "fixes for everyone"
+    )
+
+    async def scenario(session_factory):
+        results = []
+        for title in ("News", "Update"):
+            async with session_factory() as session:
+                deduplicator = FeedItemDeduplicator(
+                    SqlSeenItemRepository(session),
+                    expected_items=1000,
+                    near_duplicates=True,
+                )
+                await deduplicator.warm()
+                new_items = await deduplicator.filter_new(
+                    [item(title=title, content=text)]
+                )
+                results.append(len(new_items))
+        return results
+
+    assert database.run(scenario) == [1, 0]
@@ -0,0 +1,143 @@
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+
+import httpx
+import pytest
+
+
+@dataclass
+class Route:
+    body: bytes = b""
+    status: int = 200
+    headers: Dict[str, str] = field(default_factory=dict)
+    delay_seconds: float = 0.0
+    not_modified_etag: Optional[str] = None
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+
+class FeedServer:
+    """Local HTTP server standing in for the feed origins."""
+
+    def __init__(self):
+        self.routes: Dict[str, Route] = {}
+        self.requests: List[Dict[str, str]] = []
+        self.active = 0
+        self.max_active = 0
+        self.active_per_host: Dict[str, int] = {}
+        self.max_active_per_host: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._server = _HTTPServer(("127.0.0.1", 0), self._handler())
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, daemon=True
+        )
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address
+        return f"http://{host}:{port}"
+
+    def url(self, path: str, host: str = "feeds.test") -> str:
+        return f"http://{host}{path}"
+
+    def client(self, **kwargs) -> httpx.AsyncClient:
+        """
+        Client sending every request to this server, keeping the original
+        host in the Host header, so feeds can use any `*.test` domain.
+        """
+        host, port = self._server.server_address
+
+        async def route_to_server(request: httpx.Request) -> None:
+            request.url = request.url.copy_with(host=host, port=port)
+
+        return httpx.AsyncClient(
+            event_hooks={"request": [route_to_server]}, **kwargs
+        )
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                host = self.headers.get("Host", "")
+                with server._lock:
+                    server.requests.append(
+                        {"path": self.path, **dict(self.headers)}
+                    )
+                    server.active += 1
+                    server.max_active = max(server.max_active, server.active)
+                    active = server.active_per_host.get(host, 0) + 1
+                    server.active_per_host[host] = active
+                    server.max_active_per_host[host] = max(
+                        server.max_active_per_host.get(host, 0), active
+                    )
+                try:
+                    route = server.routes.get(self.path)
+                    if route is None:
+                        self.send_response(404)
+                        self.send_header("Content-Length", "0")
+                        self.end_headers()
+                        return
+                    time.sleep(route.delay_seconds)
+                    etag = self.headers.get("If-None-Match")
+                    if etag and etag == route.not_modified_etag:
+                        self.send_response(304)
+                        for name, value in route.headers.items():
+                            self.send_header(name, value)
+                        self.send_header("Content-Length", "0")
+                        self.end_headers()
+                        return
+                    self.send_response(route.status)
+                    for name, value in route.headers.items():
+                        self.send_header(name, value)
+                    self.send_header("Content-Length", str(len(route.body)))
+                    self.end_headers()
+                    self.wfile.write(route.body)
+                finally:
+                    with server._lock:
+                        server.active -= 1
+                        server.active_per_host[host] -= 1
+
+        return Handler
+
+    def start(self) -> "FeedServer":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def feed_server():
+    server = FeedServer().start()
+    yield server
+    server.stop()
+
+
+def rss(*items: str) -> bytes:
+    return (
+        '<?xml version="1.0"?><rss version="2.0"><channel><title>t</title>'
+        + "".join(items)
+        + "</channel></rss>"
+    ).encode()
+
+
+def rss_item(guid: str, published: Optional[str] = None) -> str:
+    date = f"<pubDate>{published}</pubDate>" if published else ""
+    return (
+        f"<item><title>{guid}</title><guid>{guid}</guid>"
+        f"<link>http://example.org/{guid}</link>{date}</item>"
+    )
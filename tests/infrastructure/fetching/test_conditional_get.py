@@ -0,0 +1,140 @@
+import asyncio
+
+from src.domain.feed.entities.feed import Feed
+from src.domain.feed.value_objects.feed_url import FeedUrl
+from src.infrastructure.fetching.fetcher import FeedFetcher
+from .conftest import Route, rss, rss_item
+
+BODY = rss(rss_item("a"), rss_item("b"))
+
+
+def make_feed(feed_server, route: Route) -> Feed:
+    feed_server.routes["/feed"] = route
+    return Feed("feed", FeedUrl(feed_server.url("/feed")), "feed")
+
+
+def fetch_twice(feed_server, feed):
+    async def main():
+        async with FeedFetcher(client=feed_server.client()) as fetcher:
+            first = await fetcher.fetch_many([feed])
+            second = await fetcher.fetch_many([feed])
+            return first + second + [fetcher.last_cycle_metrics]
+
+    return asyncio.run(main())
+
+
+def stream_twice(feed_server, feed):
+    async def main():
+        async with FeedFetcher(client=feed_server.client()) as fetcher:
+            cycles = []
+            for _ in range(2):
+                items = [item async for item in fetcher.stream_items(feed)]
+                cycles.append((items, fetcher.collect_metrics()))
+            return cycles
+
+    return asyncio.run(main())
+
+
+def test_sends_validators_and_skips_parse_on_304(feed_server):
+    feed = make_feed(
+        feed_server,
+        Route(BODY, headers={"ETag": '"v1"'}, not_modified_etag='"v1"'),
+    )
+
+    first, second, metrics = fetch_twice(feed_server, feed)
+
+    assert first.needs_parse
+    assert feed_server.requests[1]["If-None-Match"] == '"v1"'
+    assert second.status_code == 304
+    assert second.not_modified
+    assert not second.needs_parse
+    assert second.bytes_saved == len(BODY)
+    assert metrics.parses_skipped == 1
+    assert metrics.bytes_saved == len(BODY)
+    assert metrics.bytes_downloaded == 0
+
+
+def test_304_refreshes_the_stored_validators(feed_server):
+    feed = make_feed(
+        feed_server,
+        Route(
+            BODY,
+            headers={"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024"},
+            not_modified_etag='"v1"',
+        ),
+    )
+    feed.etag = '"v1"'
+    feed.content_hash = "previous"
+
+    async def main():
+        async with FeedFetcher(client=feed_server.client()) as fetcher:
+            return await fetcher.fetch(feed)
+
+    result = asyncio.run(main())
+
+    assert result.not_modified
+    assert feed.last_modified == "Mon, 01 Jan 2024"
+    assert feed.etag == '"v1"'
+    assert feed.content_hash == "previous"
+
+
+def test_skips_parse_of_an_identical_body(feed_server):
+    feed = make_feed(feed_server, Route(BODY))
+
+    first, second, metrics = fetch_twice(feed_server, feed)
+
+    assert "If-None-Match" not in feed_server.requests[1]
+    assert first.needs_parse and not first.unchanged
+    assert second.status_code == 200
+    assert second.unchanged
+    assert not second.needs_parse
+    assert metrics.parses_skipped == 1
+    assert metrics.bytes_downloaded == len(BODY)
+
+
+def test_streamed_304_is_recorded(feed_server):
+    feed = make_feed(
+        feed_server,
+        Route(BODY, headers={"ETag": '"v1"'}, not_modified_etag='"v1"'),
+    )
+
+    (items, first), (again, second) = stream_twice(feed_server, feed)
+
+    assert [item.guid for item in items] == ["a", "b"]
+    assert first.requests == 1
+    assert first.bytes_downloaded == len(BODY)
+    assert first.parses_skipped == 0
+    assert again == []
+    assert second.not_modified == 1
+    assert second.parses_skipped == 1
+    assert second.bytes_saved == len(BODY)
+    assert second.bytes_downloaded == 0
+
+
+def test_streamed_identical_body_is_recorded(feed_server):
+    feed = make_feed(feed_server, Route(BODY))
+
+    (items, first), (again, second) = stream_twice(feed_server, feed)
+
+    assert len(items) == 2
+    assert first.unchanged == 0
+    assert again == []
+    assert second.unchanged == 1
+    assert second.parses_skipped == 1
+
+
+def test_streamed_http_error_is_recorded(feed_server):
+    feed = make_feed(feed_server, Route(status=500))
+
+    async def main():
+        async with FeedFetcher(client=feed_server.client()) as fetcher:
+            try:
+                [item async for item in fetcher.stream_items(feed)]
+            except Exception as exp:
+                return type(exp).__name__, fetcher.collect_metrics()
+
+    error, metrics = asyncio.run(main())
+
+    assert error == "HTTPStatusError"
+    assert metrics.requests == 1
+    assert metrics.errors == 1
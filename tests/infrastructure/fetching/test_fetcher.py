@@ -0,0 +1,114 @@
+import asyncio
+import time
+
+from src.domain.feed.entities.feed import Feed
+from src.domain.feed.value_objects.feed_url import FeedUrl
+from src.infrastructure.fetching.fetcher import FeedFetcher
+from src.infrastructure.fetching.models import FetchMetrics
+from .conftest import Route, rss, rss_item
+
+
+def make_feeds(feed_server, hosts, delay_seconds=0.0, prefix="feed"):
+    feeds = []
+    for index, host in enumerate(hosts):
+        feed_id = f"{prefix}-{index}"
+        path = f"/{feed_id}"
+        feed_server.routes[path] = Route(
+            rss(rss_item(f"item-{index}")), delay_seconds=delay_seconds
+        )
+        feeds.append(
+            Feed(feed_id, FeedUrl(feed_server.url(path, host)), feed_id)
+        )
+    return feeds
+
+
+def fetch_many(feed_server, feeds, **kwargs):
+    async def main():
+        async with FeedFetcher(
+            client=feed_server.client(), **kwargs
+        ) as fetcher:
+            return await fetcher.fetch_many(feeds)
+
+    return asyncio.run(main())
+
+
+def test_fetches_feeds_concurrently_in_order(feed_server):
+    feeds = make_feeds(feed_server, [f"host-{i}.test" for i in range(10)], 0.2)
+
+    start = time.perf_counter()
+    results = fetch_many(feed_server, feeds)
+    elapsed = time.perf_counter() - start
+
+    assert [result.feed_id for result in results] == [f.id for f in feeds]
+    assert all(result.ok and result.needs_parse for result in results)
+    assert feed_server.max_active == 10
+    assert elapsed < 1.0
+
+
+def test_bounds_global_concurrency(feed_server):
+    feeds = make_feeds(feed_server, [f"host-{i}.test" for i in range(8)], 0.1)
+
+    fetch_many(feed_server, feeds, max_concurrency=3)
+
+    assert feed_server.max_active == 3
+
+
+def test_bounds_concurrency_per_host(feed_server):
+    feeds = make_feeds(feed_server, ["busy.test"] * 6, 0.1)
+
+    fetch_many(feed_server, feeds, max_per_host=2)
+
+    assert feed_server.max_active_per_host["busy.test"] == 2
+
+
+def test_busy_host_does_not_starve_other_hosts(feed_server):
+    busy = make_feeds(feed_server, ["busy.test"] * 8, 0.2)
+    quiet = make_feeds(
+        feed_server, [f"host-{i}.test" for i in range(4)], prefix="quiet"
+    )
+    finished = {}
+
+    async def main():
+        async with FeedFetcher(
+            client=feed_server.client(), max_concurrency=4, max_per_host=2
+        ) as fetcher:
+            start = time.perf_counter()
+
+            async def fetch(feed):
+                await fetcher.fetch(feed)
+                finished[feed.id] = time.perf_counter() - start
+
+            await asyncio.gather(*(fetch(feed) for feed in busy + quiet))
+
+    asyncio.run(main())
+
+    assert max(finished[feed.id] for feed in quiet) < 0.2
+    assert feed_server.max_active_per_host["busy.test"] == 2
+
+
+def test_times_out_slow_feeds(feed_server):
+    slow, fast = make_feeds(feed_server, ["slow.test", "fast.test"])
+    feed_server.routes["/feed-0"].delay_seconds = 1.0
+
+    async def main():
+        async with FeedFetcher(
+            client=feed_server.client(timeout=0.2)
+        ) as fetcher:
+            return await fetcher.fetch_many([slow, fast])
+
+    slow_result, fast_result = asyncio.run(main())
+
+    assert slow_result.error.startswith("ReadTimeout")
+    assert not slow_result.ok
+    assert fast_result.ok
+    assert FetchMetrics.from_results([slow_result, fast_result]).errors == 1
+
+
+def test_reports_http_errors(feed_server):
+    feed = Feed("missing", FeedUrl(feed_server.url("/missing")), "missing")
+
+    (result,) = fetch_many(feed_server, [feed])
+
+    assert result.status_code == 404
+    assert result.error == "HTTP 404"
+    assert not result.needs_parse
@@ -0,0 +1,114 @@
+import asyncio
+from datetime import datetime, timezone
+
+from src.domain.feed.entities.feed import Feed
+from src.domain.feed.value_objects.feed_url import FeedUrl
+from src.infrastructure.fetching.fetcher import FeedFetcher
+from src.infrastructure.fetching.parser import FeedParser
+from .conftest import Route, rss, rss_item
+
+JAN_1 = "Mon, 01 Jan 2024 10:00:00 GMT"
+JAN_2 = "Tue, 02 Jan 2024 10:00:00 GMT"
+JAN_3 = "Wed, 03 Jan 2024 10:00:00 GMT"
+
+ATOM = b"""<?xml version="1.0"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <entry>
+    <id>urn:a</id><title>A</title>
+    <link rel="alternate" href="http://example.org/a"/>
+    <updated>2024-01-02T10:00:00Z</updated>
+    <author><name>Ann</name></author>
+    <category term="news"/>
+    <summary>first</summary>
+  </entry>
+  <entry>
+    <id>urn:b</id><title>B</title>
+    <link href="http://example.org/b"/>
+    <updated>2024-01-01T10:00:00Z</updated>
+  </entry>
+</feed>"""
+
+
+def chunks(data: bytes, size: int = 7):
+    starts = range(0, len(data), size)
+    ends = range(size, len(data) + size, size)
+    return [data[start:end] for start, end in zip(starts, ends)]
+
+
+def test_parses_rss_fed_in_small_chunks():
+    document = rss(rss_item("a", JAN_2), rss_item("b", JAN_1))
+
+    items = list(FeedParser("feed").parse(chunks(document)))
+
+    assert [item.guid for item in items] == ["a", "b"]
+    assert items[0].link == "http://example.org/a"
+    assert items[0].published_date == datetime(
+        2024, 1, 2, 10, tzinfo=timezone.utc
+    )
+    assert items[0].feed_source_id == "feed"
+
+
+def test_parses_atom_entries():
+    items = list(FeedParser().parse(chunks(ATOM)))
+
+    assert [item.guid for item in items] == ["urn:a", "urn:b"]
+    assert items[0].link == "http://example.org/a"
+    assert items[0].author == "Ann"
+    assert items[0].tags == ["news"]
+    assert items[0].content == "first"
+
+
+def test_yields_items_before_the_document_ends():
+    parser = FeedParser()
+    document = rss(rss_item("a", JAN_2), rss_item("b", JAN_1))
+    first_item_end = document.index(b"</item>") + len(b"</item>")
+
+    items = list(parser.feed(document[:first_item_end]))
+
+    assert [item.guid for item in items] == ["a"]
+
+
+def test_stops_at_the_high_water_mark():
+    since = datetime(2024, 1, 2, 10, tzinfo=timezone.utc)
+    parser = FeedParser(since=since)
+    document = rss(
+        rss_item("c", JAN_3), rss_item("b", JAN_2), rss_item("a", JAN_1)
+    )
+
+    items = list(parser.parse(chunks(document)))
+
+    assert [item.guid for item in items] == ["c"]
+    assert parser.stopped
+    assert parser.newest == datetime(2024, 1, 3, 10, tzinfo=timezone.utc)
+
+
+def test_undated_items_do_not_move_the_high_water_mark():
+    parser = FeedParser()
+
+    items = list(parser.parse([rss(rss_item("u"), rss_item("a", JAN_1))]))
+
+    assert [item.guid for item in items] == ["u", "a"]
+    assert items[0].published_date == parser.fetched_at
+    assert parser.newest == datetime(2024, 1, 1, 10, tzinfo=timezone.utc)
+    assert parser.undated_guids == {"u"}
+
+
+def test_refetch_keeps_new_items_older_than_the_fetch_time(feed_server):
+    feed = Feed("feed", FeedUrl(feed_server.url("/feed")), "feed")
+    route = Route(rss(rss_item("undated"), rss_item("a", JAN_1)))
+    feed_server.routes["/feed"] = route
+
+    async def fetch_guids():
+        async with FeedFetcher(client=feed_server.client()) as fetcher:
+            return [item.guid async for item in fetcher.stream_items(feed)]
+
+    assert asyncio.run(fetch_guids()) == ["undated", "a"]
+
+    route.body = rss(
+        rss_item("undated"), rss_item("b", JAN_2), rss_item("a", JAN_1)
+    )
+
+    assert asyncio.run(fetch_guids()) == ["b"]
+    assert feed.high_water_mark == datetime(
+        2024, 1, 2, 10, tzinfo=timezone.utc
+    )
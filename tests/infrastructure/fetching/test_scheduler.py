@@ -0,0 +1,185 @@
+import asyncio
+import heapq
+from datetime import datetime
+
+import pytest
+
+from src.domain.feed.entities.feed import Feed
+from src.domain.feed.enums.feed_status import FeedStatus
+from src.domain.feed.value_objects.feed_url import FeedUrl
+from src.infrastructure.fetching.models import FetchMetrics
+from src.infrastructure.fetching.scheduler import RefreshScheduler
+
+
+class StubFetcher:
+    """Fetcher returning scripted items, errors and delays per feed."""
+
+    def __init__(self):
+        self.outcomes = {}
+        self.delays = {}
+        self.cycles = 0
+        self.last_cycle_metrics = FetchMetrics()
+
+    async def stream_items(self, feed):
+        await asyncio.sleep(self.delays.get(feed.id, 0))
+        outcome = self.outcomes.get(feed.id, [])
+        if isinstance(outcome, Exception):
+            raise outcome
+        for item in outcome:
+            yield item
+
+    def collect_metrics(self):
+        self.cycles += 1
+        return self.last_cycle_metrics
+
+
+def make_feed(feed_id: str) -> Feed:
+    return Feed(feed_id, FeedUrl(f"http://{feed_id}.test/rss"), feed_id)
+
+
+def make_scheduler(fetcher, **kwargs):
+    options = dict(
+        default_interval_seconds=100,
+        min_interval_seconds=10,
+        max_interval_seconds=1000,
+    )
+    options.update(kwargs)
+    return RefreshScheduler(fetcher, **options)
+
+
+def refresh(scheduler, times=1):
+    """Run `times` ticks, forcing the feeds due before each one."""
+
+    async def main():
+        for _ in range(times):
+            for schedule in scheduler._schedules.values():
+                schedule.due_at = 0
+                heapq.heappush(scheduler._heap, (0, schedule.feed.id))
+            await scheduler.run_once()
+            await scheduler.wait_idle()
+
+    asyncio.run(main())
+
+
+def interval_of(scheduler, feed):
+    return scheduler._schedules[feed.id].interval_seconds
+
+
+def test_stale_feed_is_due_now_and_fresh_feed_later():
+    scheduler = make_scheduler(StubFetcher())
+    stale = make_feed("stale")
+    fresh = make_feed("fresh")
+    fresh.last_fetched = datetime.now()
+    inactive = make_feed("inactive")
+    inactive.status = FeedStatus.INACTIVE
+
+    for feed in (stale, fresh, inactive):
+        scheduler.schedule(feed)
+
+    assert scheduler.metrics()["queue_depth"] == 2
+    assert scheduler.metrics()["due"] == 1
+    assert scheduler._schedules["fresh"].due_at == pytest.approx(
+        fresh.last_fetched.timestamp() + 100
+    )
+
+
+def test_interval_shrinks_with_new_items_and_grows_without():
+    fetcher = StubFetcher()
+    scheduler = make_scheduler(fetcher)
+    feed = make_feed("feed")
+    scheduler.schedule(feed)
+
+    fetcher.outcomes["feed"] = ["item"]
+    refresh(scheduler)
+    assert interval_of(scheduler, feed) == 50
+
+    refresh(scheduler, times=3)
+    assert interval_of(scheduler, feed) == 10
+
+    fetcher.outcomes["feed"] = []
+    refresh(scheduler)
+    assert interval_of(scheduler, feed) == 15
+
+    refresh(scheduler, times=20)
+    assert interval_of(scheduler, feed) == 1000
+
+
+def test_failing_feed_backs_off_exponentially_and_recovers():
+    fetcher = StubFetcher()
+    scheduler = make_scheduler(fetcher)
+    feed = make_feed("feed")
+    scheduler.schedule(feed)
+    fetcher.outcomes["feed"] = RuntimeError("boom")
+
+    refresh(scheduler)
+    assert feed.status == FeedStatus.ERROR
+    assert interval_of(scheduler, feed) == 200
+
+    refresh(scheduler)
+    assert interval_of(scheduler, feed) == 400
+
+    refresh(scheduler, times=3)
+    assert interval_of(scheduler, feed) == 1000
+    assert scheduler.metrics()["failed"] == 5
+
+    fetcher.outcomes["feed"] = ["item"]
+    refresh(scheduler)
+    assert feed.status == FeedStatus.ACTIVE
+    assert scheduler._schedules["feed"].failures == 0
+    assert interval_of(scheduler, feed) == 500
+
+
+def test_slow_feed_does_not_hold_back_the_others():
+    fetcher = StubFetcher()
+    handled = []
+
+    async def on_items(feed, items):
+        handled.append(feed.id)
+
+    scheduler = make_scheduler(fetcher, on_items=on_items)
+    fetcher.outcomes = {"slow": ["item"], "fast": ["item"]}
+    fetcher.delays["slow"] = 0.5
+    scheduler.schedule(make_feed("slow"))
+    scheduler.schedule(make_feed("fast"))
+
+    async def main():
+        assert await scheduler.run_once() == 2
+        await asyncio.sleep(0.05)
+        progress = (list(handled), scheduler.metrics()["in_flight"])
+        await scheduler.wait_idle()
+        return progress
+
+    assert asyncio.run(main()) == (["fast"], 1)
+    assert handled == ["fast", "slow"]
+    assert fetcher.cycles == 1
+
+
+def test_unscheduled_feed_is_not_refreshed():
+    fetcher = StubFetcher()
+    scheduler = make_scheduler(fetcher)
+    scheduler.schedule(make_feed("feed"))
+    scheduler.unschedule("feed")
+
+    assert asyncio.run(scheduler.run_once()) == 0
+    assert scheduler.refreshed == 0
+
+
+def test_started_scheduler_refreshes_due_feeds_until_stopped():
+    fetcher = StubFetcher()
+    scheduler = make_scheduler(fetcher)
+    feed = make_feed("feed")
+
+    async def main():
+        await scheduler.start()
+        scheduler.schedule(feed)
+        for _ in range(100):
+            if scheduler.refreshed:
+                break
+            await asyncio.sleep(0.01)
+        await scheduler.stop()
+
+    asyncio.run(main())
+
+    assert scheduler.refreshed == 1
+    assert feed.last_fetched is not None
+    assert scheduler.metrics()["in_flight"] == 0
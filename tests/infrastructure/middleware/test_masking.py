@@ -0,0 +1,155 @@
+import json
+
+from src.infrastructure.middleware.logging.constants import (
+    MASKED_VALUE,
+    TRUNCATED_VALUE,
+)
+from src.infrastructure.middleware.logging.request_logger import RequestLogger
+from src.infrastructure.middleware.logging.response_logger import (
+    ResponseLogger,
+)
+from src.infrastructure.middleware.logging.utils import SensitiveDataMasker
+
+
+def request_raw(body: bytes, size: int = None) -> dict:
+    return {
+        "timestamp": 0.0,
+        "request_id": "id",
+        "correlation_id": None,
+        "method": "POST",
+        "url": "http://test/x",
+        "path_params": {},
+        "query_params": {},
+        "client_ip": "127.0.0.1",
+        "user_agent": None,
+        "headers": [(b"authorization", b"Bearer token")],
+        "body": body,
+        "body_size": len(body) if size is None else size,
+    }
+
+
+def test_masker_masks_keys_inside_dicts_and_lists():
+    masker = SensitiveDataMasker({"Password"})
+    data = {"items": [{"PASSWORD": "p", "name": "n"}], "password": "p"}
+
+    assert masker.mask(data) == {
+        "items": [{"PASSWORD": MASKED_VALUE, "name": "n"}],
+        "password": MASKED_VALUE,
+    }
+
+
+def test_masker_masks_json_encoded_strings():
+    masker = SensitiveDataMasker({"authorization"})
+    upstream = json.dumps({"authorization": "Bearer s3cret", "ok": True})
+    nested = json.dumps([{"authorization": "Bearer s3cret"}])
+
+    masked = masker.mask({"upstream": upstream, "nested": nested})
+
+    assert json.loads(masked["upstream"]) == {
+        "authorization": MASKED_VALUE,
+        "ok": True,
+    }
+    assert json.loads(masked["nested"]) == [{"authorization": MASKED_VALUE}]
+    assert "s3cret" not in json.dumps(masked)
+
+
+def test_masker_leaves_other_strings_alone():
+    masker = SensitiveDataMasker({"authorization"})
+    data = {"note": "{not json", "list": "[1, 2]", "text": "plain"}
+
+    assert masker.mask(data) == {
+        "note": "{not json",
+        "list": "[1,2]",
+        "text": "plain",
+    }
+
+
+def test_masker_does_not_parse_strings_over_the_budget():
+    masker = SensitiveDataMasker({"authorization"}, max_bytes=10)
+    upstream = json.dumps({"authorization": "Bearer s3cret"})
+
+    masked = masker.mask({"upstream": upstream})
+
+    assert "s3cret" not in masked["upstream"]
+    assert masked["upstream"].endswith(TRUNCATED_VALUE)
+
+
+def test_masker_stops_at_max_depth():
+    deep = current = {}
+    for _ in range(5000):
+        current["a"] = {}
+        current = current["a"]
+
+    masked = SensitiveDataMasker(set(), max_depth=4).mask(deep)
+
+    assert masked == {"a": {"a": {"a": {"a": TRUNCATED_VALUE}}}}
+
+
+def test_masker_stops_at_max_bytes():
+    data = {"items": [{"title": "t" * 40} for _ in range(100)]}
+
+    masked = SensitiveDataMasker(set(), max_bytes=100).mask(data)
+
+    assert len(masked["items"]) < 100
+    assert masked["items"][-1] == TRUNCATED_VALUE
+
+
+def test_request_logger_masks_headers_and_body():
+    logger = RequestLogger(sensitive_headers={"authorization", "password"})
+    body = json.dumps({"password": "secret", "name": "n"}).encode()
+
+    log_data = logger.render(request_raw(body))
+
+    assert log_data["headers"] == {"authorization": MASKED_VALUE}
+    assert log_data["body"] == {"password": MASKED_VALUE, "name": "n"}
+
+
+def test_request_logger_without_masking_logs_values():
+    logger = RequestLogger(
+        sensitive_headers={"authorization", "password"},
+        mask_sensitive_data=False,
+    )
+    body = json.dumps({"password": "secret"}).encode()
+
+    log_data = logger.render(request_raw(body))
+
+    assert log_data["headers"] == {"authorization": "Bearer token"}
+    assert log_data["body"] == {"password": "secret"}
+
+
+def test_truncated_body_is_not_logged_when_masking():
+    logger = RequestLogger(sensitive_headers={"password"})
+    body = json.dumps({"password": "secret", "pad": "x" * 50}).encode()
+
+    log_data = logger.render(request_raw(body[:20], size=len(body)))
+
+    assert "secret" not in str(log_data["body"])
+    assert str(len(body)) in log_data["body"]
+
+
+def test_truncated_body_prefix_is_logged_without_masking():
+    logger = RequestLogger(mask_sensitive_data=False)
+    body = json.dumps({"password": "secret", "pad": "x" * 50}).encode()
+
+    log_data = logger.render(request_raw(body[:20], size=len(body)))
+
+    assert log_data["body"].startswith(body[:20].decode())
+    assert log_data["body"].endswith(f"[truncated from {len(body)} bytes]")
+
+
+def test_response_logger_masking_flag():
+    body = json.dumps({"password": "secret"}).encode()
+    headers = [(b"set-cookie", b"c"), (b"cookie", b"c")]
+
+    masked = ResponseLogger(sensitive_headers={"cookie", "password"})
+    plain = ResponseLogger(
+        sensitive_headers={"cookie", "password"}, mask_sensitive_data=False
+    )
+
+    masked_log = masked.render(masked.capture(200, headers, body, len(body)))
+    plain_log = plain.render(plain.capture(200, headers, body, len(body)))
+
+    assert masked_log["response_headers"]["cookie"] == MASKED_VALUE
+    assert masked_log["response_body"] == {"password": MASKED_VALUE}
+    assert plain_log["response_headers"]["cookie"] == "c"
+    assert plain_log["response_body"] == {"password": "secret"}
@@ -0,0 +1,363 @@
+import asyncio
+import fcntl
+import os
+import stat
+import tempfile
+import threading
+import time
+
+import fakeredis
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from src.infrastructure.middleware.rate_limiting import backends
+from src.infrastructure.middleware.rate_limiting import store as window_store
+from src.infrastructure.middleware.rate_limiting.backends import (
+    MemoryRateLimitStore,
+    RedisRateLimitStore,
+    SharedMemoryRateLimitStore,
+    create_rate_limit_store,
+    default_shared_memory_path,
+)
+from src.infrastructure.middleware.rate_limiting.middleware import (
+    RateLimitingMiddleware,
+)
+from src.infrastructure.middleware.rate_limiting.resp import RedisError
+
+
+@pytest.fixture(autouse=True)
+def frozen_clock(monkeypatch):
+    """20 seconds into a 60 second window, so no test sees it roll over."""
+    now = 60 * 1_000_000 + 20.0
+    monkeypatch.setattr(backends, "time", lambda: now)
+    monkeypatch.setattr(window_store, "time", lambda: now)
+
+
+@pytest.fixture
+def redis_url():
+    """
+    fakeredis speaking the Redis protocol over a local TCP socket; its
+    Lua scripting (EVALSHA) needs lupa.
+    """
+    server = fakeredis.TcpFakeServer(("127.0.0.1", 0), server_type="redis")
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address
+    yield f"redis://{host}:{port}/0"
+    server.shutdown()
+    server.server_close()
+
+
+async def hits(store, key: str, count: int):
+    return [await store.hit(key, 60) for _ in range(count)]
+
+
+def sequential_counts(results):
+    return [count for count, _ in results]
+
+
+def test_memory_store_counts_per_client():
+    async def scenario():
+        store = MemoryRateLimitStore()
+        return await hits(store, "a", 3), await store.hit("b", 60)
+
+    a, (b_count, reset) = asyncio.run(scenario())
+
+    assert sequential_counts(a) == [0, 1, 2]
+    assert b_count == 0
+    assert reset == 40
+
+
+def test_shared_memory_store_is_shared_between_instances(tmp_path):
+    path = str(tmp_path / "ratelimit")
+
+    async def scenario():
+        worker_a = SharedMemoryRateLimitStore(path, slots=64)
+        worker_b = SharedMemoryRateLimitStore(path, slots=64)
+        try:
+            await hits(worker_a, "client", 3)
+            await hits(worker_b, "client", 2)
+            return await worker_a.hit("client", 60), await worker_b.hit(
+                "other", 60
+            )
+        finally:
+            await worker_a.close()
+            await worker_b.close()
+
+    (client_count, _), (other_count, _) = asyncio.run(scenario())
+
+    assert client_count == 5
+    assert other_count == 0
+
+
+def test_shared_memory_store_reuses_slots_when_full(tmp_path):
+    async def scenario():
+        store = SharedMemoryRateLimitStore(str(tmp_path / "rl"), slots=8)
+        try:
+            for i in range(100):
+                await store.hit(f"client-{i}", 60)
+            return await store.hit("client-99", 60)
+        finally:
+            await store.close()
+
+    count, _ = asyncio.run(scenario())
+
+    assert count == 1
+
+
+@pytest.mark.parametrize("use_lua", [True, False])
+def test_redis_store_counts_atomically(redis_url, use_lua):
+    async def scenario():
+        replica_a = RedisRateLimitStore(redis_url, use_lua=use_lua)
+        replica_b = RedisRateLimitStore(redis_url, use_lua=use_lua)
+        try:
+            concurrent = await asyncio.gather(
+                *(replica_a.hit("client", 60) for _ in range(50)),
+                *(replica_b.hit("client", 60) for _ in range(50)),
+            )
+            last = await replica_b.hit("client", 60)
+            other = await replica_a.hit("other", 60)
+            return concurrent, last, other
+        finally:
+            await replica_a.close()
+            await replica_b.close()
+
+    concurrent, (last, reset), (other, _) = asyncio.run(scenario())
+
+    assert sorted(count for count, _ in concurrent) == list(range(100))
+    assert last == 100
+    assert reset == 40
+    assert other == 0
+
+
+class FlushedScriptsConnection:
+    """Connection whose server lost its script cache after SCRIPT LOAD."""
+
+    def __init__(self):
+        self.commands = []
+
+    async def execute(self, *args):
+        self.commands.append(args[0])
+        if args[0] == "SCRIPT":
+            return "sha"
+        if args[0] == "EVALSHA":
+            raise RedisError("NOSCRIPT No matching script.")
+        return [3, 0]
+
+
+def test_redis_store_falls_back_to_eval_on_noscript():
+    connection = FlushedScriptsConnection()
+    store = RedisRateLimitStore(connection=connection)
+
+    count, _ = asyncio.run(store.hit("client", 60))
+
+    assert count == 3
+    assert connection.commands == ["SCRIPT", "EVALSHA", "EVAL"]
+
+
+def test_middleware_shares_the_limit_across_replicas(redis_url):
+    async def scenario():
+        stores, clients = [], []
+        for _ in range(2):
+            store = RedisRateLimitStore(redis_url)
+            app = FastAPI()
+            app.get("/x")(lambda: {"ok": True})
+            app.add_middleware(
+                RateLimitingMiddleware, requests_limit=4, store=store
+            )
+            stores.append(store)
+            clients.append(
+                httpx.AsyncClient(
+                    transport=httpx.ASGITransport(app),
+                    base_url="http://test",
+                )
+            )
+        try:
+            responses = [await clients[i % 2].get("/x") for i in range(6)]
+        finally:
+            for client, store in zip(clients, stores):
+                await client.aclose()
+                await store.close()
+        return responses
+
+    responses = asyncio.run(scenario())
+
+    assert [r.status_code for r in responses] == [200] * 4 + [429] * 2
+    assert responses[0].headers["x-ratelimit-remaining"] == "3"
+    assert responses[4].headers["x-ratelimit-remaining"] == "0"
+
+
+def test_create_rate_limit_store(tmp_path):
+    memory = create_rate_limit_store("memory")
+    shared = create_rate_limit_store(
+        "shared_memory", shared_memory_path=str(tmp_path / "rl")
+    )
+    redis = create_rate_limit_store("redis", redis_timeout_seconds=0.5)
+
+    assert isinstance(memory, MemoryRateLimitStore)
+    assert isinstance(shared, SharedMemoryRateLimitStore)
+    assert isinstance(redis, RedisRateLimitStore)
+    assert redis.connection.timeout_seconds == 0.5
+    with pytest.raises(ValueError):
+        create_rate_limit_store("unknown")
+    asyncio.run(shared.close())
+
+
+def planted(tmp_path, mode=0o600):
+    victim = tmp_path / "victim"
+    victim.write_bytes(b"precious")
+    victim.chmod(mode)
+    return victim
+
+
+def test_shared_memory_store_refuses_a_planted_symlink(tmp_path):
+    victim = planted(tmp_path)
+    (tmp_path / "rl").symlink_to(victim)
+
+    with pytest.raises(OSError):
+        SharedMemoryRateLimitStore(str(tmp_path / "rl"), slots=64)
+    assert victim.read_bytes() == b"precious"
+
+
+def test_shared_memory_store_refuses_shared_or_linked_files(tmp_path):
+    (tmp_path / "shared").mkdir()
+    shared = planted(tmp_path / "shared", mode=0o666)
+    linked = tmp_path / "linked"
+    os.link(planted(tmp_path), linked)
+
+    for path in (shared, linked):
+        with pytest.raises(PermissionError):
+            SharedMemoryRateLimitStore(str(path), slots=64)
+    assert shared.read_bytes() == b"precious"
+    assert linked.read_bytes() == b"precious"
+
+
+@pytest.mark.skipif(os.getuid() != 0, reason="needs chown")
+def test_shared_memory_store_refuses_files_of_other_users(tmp_path):
+    victim = planted(tmp_path)
+    os.chown(victim, 65534, 65534)
+
+    with pytest.raises(PermissionError):
+        SharedMemoryRateLimitStore(str(victim), slots=64)
+    assert victim.read_bytes() == b"precious"
+
+
+def test_default_path_is_in_a_private_directory(tmp_path, monkeypatch):
+    monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+
+    path = default_shared_memory_path()
+
+    directory = os.path.dirname(path)
+    assert directory.startswith(str(tmp_path))
+    assert stat.S_IMODE(os.stat(directory).st_mode) == 0o700
+    store = create_rate_limit_store("shared_memory")
+    assert store.path == path
+    asyncio.run(store.close())
+
+    os.chmod(directory, 0o777)
+    with pytest.raises(PermissionError):
+        default_shared_memory_path()
+
+
+def test_default_path_prefers_the_runtime_directory(tmp_path, monkeypatch):
+    runtime = tmp_path / "run"
+    runtime.mkdir(mode=0o700)
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(runtime))
+
+    assert default_shared_memory_path() == str(
+        runtime / "what_the_feed_ratelimit"
+    )
+
+
+async def silent_server():
+    """Accepts connections and reads commands without ever replying."""
+
+    async def handle(reader, writer):
+        while await reader.read(1024):
+            pass
+        writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    host, port = server.sockets[0].getsockname()[:2]
+    return server, f"redis://{host}:{port}/0"
+
+
+def test_redis_store_times_out_and_drops_the_connection():
+    async def scenario():
+        server, url = await silent_server()
+        store = RedisRateLimitStore(url, timeout_seconds=0.1)
+        try:
+            start = time.perf_counter()
+            with pytest.raises(TimeoutError):
+                await store.hit("client", 60)
+            elapsed = time.perf_counter() - start
+            return elapsed, store.connection._writer
+        finally:
+            await store.close()
+            server.close()
+
+    elapsed, writer = asyncio.run(scenario())
+
+    assert elapsed < 1
+    assert writer is None
+
+
+def test_middleware_fails_open_when_redis_stalls():
+    async def scenario():
+        server, url = await silent_server()
+        store = RedisRateLimitStore(url, timeout_seconds=0.1)
+        app = FastAPI()
+
+        @app.get("/x")
+        async def endpoint():
+            return {"ok": True}
+
+        app.add_middleware(
+            RateLimitingMiddleware, requests_limit=1, store=store
+        )
+        try:
+            async with httpx.AsyncClient(
+                transport=httpx.ASGITransport(app), base_url="http://test"
+            ) as client:
+                return [(await client.get("/x")).status_code for _ in "ab"]
+        finally:
+            await store.close()
+            server.close()
+
+    assert asyncio.run(scenario()) == [200, 200]
+
+
+def test_shared_memory_store_waits_for_the_lock_without_blocking(tmp_path):
+    path = str(tmp_path / "ratelimit")
+
+    async def scenario():
+        store = SharedMemoryRateLimitStore(path, slots=64)
+        other_worker = os.open(path, os.O_RDWR)
+        fcntl.flock(other_worker, fcntl.LOCK_EX)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.001)
+
+        ticking = asyncio.create_task(ticker())
+        hit = asyncio.create_task(store.hit("client", 60))
+        await asyncio.sleep(0.05)
+        waiting = not hit.done()
+        fcntl.flock(other_worker, fcntl.LOCK_UN)
+        count, _ = await asyncio.wait_for(hit, 1)
+        ticking.cancel()
+        os.close(other_worker)
+        await store.close()
+        return waiting, ticks, count
+
+    waiting, ticks, count = asyncio.run(scenario())
+
+    assert waiting
+    assert ticks > 10
+    assert count == 0
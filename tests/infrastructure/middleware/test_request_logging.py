@@ -0,0 +1,267 @@
+import asyncio
+
+import httpx
+from fastapi import FastAPI, HTTPException, Request
+
+from src.infrastructure.middleware.logging import pipeline as log_pipeline
+from src.infrastructure.middleware.logging.constants import LogLevel
+from src.infrastructure.middleware.logging.pipeline import LogPipeline
+from src.infrastructure.middleware.logging.request_logger import RequestLogger
+from src.infrastructure.middleware.logging.request_logging_middleware import (
+    RequestLoggingMiddleware,
+)
+
+
+class RecordingLogger:
+    def __init__(self):
+        self.records = []
+
+    def log(self, level, message):
+        self.records.append((level, message))
+
+    def error(self, message):
+        self.records.append((LogLevel.ERROR, message))
+
+
+def recording_logger(monkeypatch) -> RecordingLogger:
+    recorder = RecordingLogger()
+    monkeypatch.setattr(log_pipeline, "logger", recorder)
+    return recorder
+
+
+def logged_app(pipeline, **options) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/feeds")
+    async def feeds():
+        return {"feeds": []}
+
+    @app.get("/items")
+    async def items():
+        return {"items": []}
+
+    @app.get("/items/{item_id}/tags")
+    async def item_tags(item_id: int):
+        return {"tags": []}
+
+    @app.get("/items/broken")
+    async def broken():
+        raise HTTPException(status_code=503)
+
+    @app.post("/echo")
+    async def echo(request: Request):
+        return {"size": len(await request.body())}
+
+    app.add_middleware(RequestLoggingMiddleware, pipeline=pipeline, **options)
+    return app
+
+
+def request_paths(app, pipeline, *paths):
+    async def scenario():
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app), base_url="http://test"
+        ) as client:
+            for path in paths:
+                await client.get(path)
+        await pipeline.stop()
+
+    asyncio.run(scenario())
+
+
+def post(app, pipeline, path, content):
+    async def scenario():
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app), base_url="http://test"
+        ) as client:
+            response = await client.post(path, content=content)
+        await pipeline.stop()
+        return response
+
+    return asyncio.run(scenario())
+
+
+def test_full_queue_drops_and_counts_records(monkeypatch):
+    recorder = recording_logger(monkeypatch)
+
+    async def scenario():
+        pipeline = LogPipeline(max_queue_size=3)
+        accepted = [
+            pipeline.submit(LogLevel.INFO, str, number) for number in range(5)
+        ]
+        await pipeline.stop()
+        return pipeline, accepted
+
+    pipeline, accepted = asyncio.run(scenario())
+
+    assert accepted == [True, True, True, False, False]
+    assert pipeline.stats()["dropped"] == 2
+    assert [message for _, message in recorder.records] == ["0", "1", "2"]
+
+
+def test_stop_flushes_queued_records(monkeypatch):
+    recorder = recording_logger(monkeypatch)
+
+    async def scenario():
+        pipeline = LogPipeline()
+        for number in range(250):
+            pipeline.submit(LogLevel.INFO, str, number)
+        await pipeline.stop()
+        return pipeline
+
+    pipeline = asyncio.run(scenario())
+
+    assert len(recorder.records) == 250
+    assert pipeline.stats()["written"] == 250
+    assert pipeline.stats()["queued"] == 0
+
+
+def test_worker_yields_between_batches(monkeypatch):
+    recording_logger(monkeypatch)
+
+    async def scenario():
+        pipeline = LogPipeline(batch_size=10)
+        for number in range(35):
+            pipeline.submit(LogLevel.INFO, str, number)
+        observed = []
+        while pipeline.written < 35:
+            await asyncio.sleep(0)
+            observed.append(pipeline.written)
+        await pipeline.stop()
+        return observed
+
+    observed = asyncio.run(scenario())
+
+    assert [10, 20, 30, 35] == sorted(set(observed) - {0})
+
+
+def test_failed_render_is_counted(monkeypatch):
+    recorder = recording_logger(monkeypatch)
+
+    def broken_render(record):
+        raise ValueError(record)
+
+    async def scenario():
+        pipeline = LogPipeline()
+        pipeline.submit(LogLevel.INFO, broken_render, "bad")
+        pipeline.submit(LogLevel.INFO, str, "good")
+        await pipeline.stop()
+        return pipeline
+
+    pipeline = asyncio.run(scenario())
+
+    assert pipeline.stats()["failed"] == 1
+    assert recorder.records[-1] == (LogLevel.INFO, "good")
+
+
+def test_route_sample_rates_override_the_default(monkeypatch):
+    recorder = recording_logger(monkeypatch)
+    pipeline = LogPipeline()
+    app = logged_app(
+        pipeline, sample_rate=1.0, route_sample_rates={"/items": 0.0}
+    )
+
+    request_paths(app, pipeline, "/feeds", "/items", "/feeds")
+
+    assert [record["url"] for _, record in recorder.records] == [
+        "http://test/feeds",
+        "http://test/feeds",
+    ]
+
+
+def test_fractional_rate_samples_requests(monkeypatch):
+    recorder = recording_logger(monkeypatch)
+    draws = iter([0.1, 0.9, 0.2, 0.8])
+    monkeypatch.setattr(
+        "src.infrastructure.middleware.logging."
+        "request_logging_middleware.random.random",
+        lambda: next(draws),
+    )
+    pipeline = LogPipeline()
+    app = logged_app(pipeline, sample_rate=0.5)
+
+    request_paths(app, pipeline, *["/feeds"] * 4)
+
+    assert len(recorder.records) == 2
+
+
+def test_unsampled_server_errors_are_logged_without_bodies(monkeypatch):
+    recorder = recording_logger(monkeypatch)
+    pipeline = LogPipeline()
+    app = logged_app(pipeline, sample_rate=0.0)
+
+    request_paths(app, pipeline, "/items", "/items/broken")
+
+    [(level, record)] = recorder.records
+    assert level == LogLevel.ERROR
+    assert record["status_code"] == 503
+    assert "body" not in record
+
+
+def test_unsampled_requests_capture_nothing(monkeypatch):
+    recorder = recording_logger(monkeypatch)
+    captured = []
+    capture = RequestLogger.capture
+
+    def counting_capture(self, request, timestamp=None):
+        captured.append(request.url.path)
+        return capture(self, request, timestamp)
+
+    monkeypatch.setattr(RequestLogger, "capture", counting_capture)
+    pipeline = LogPipeline()
+    app = logged_app(pipeline, sample_rate=0.0)
+
+    request_paths(app, pipeline, "/feeds", "/items", "/items/broken")
+
+    assert captured == ["/items/broken"]
+    assert len(recorder.records) == 1
+
+
+def test_record_has_the_routed_path_params(monkeypatch):
+    recorder = recording_logger(monkeypatch)
+    pipeline = LogPipeline()
+    app = logged_app(pipeline)
+
+    request_paths(app, pipeline, "/items/7/tags")
+
+    [(_, record)] = recorder.records
+    assert record["path_params"] == {"item_id": "7"}
+
+
+def test_body_is_logged_when_the_route_never_reads_it(monkeypatch):
+    recorder = recording_logger(monkeypatch)
+    pipeline = LogPipeline()
+    app = logged_app(pipeline, max_body_bytes=1024)
+
+    response = post(app, pipeline, "/missing", b'{"title": "News"}')
+
+    [(_, record)] = recorder.records
+    assert response.status_code == 404
+    assert record["body"] == {"title": "News"}
+
+
+def test_buffered_body_is_replayed_to_the_route(monkeypatch):
+    recorder = recording_logger(monkeypatch)
+    pipeline = LogPipeline()
+    app = logged_app(pipeline, max_body_bytes=1024)
+
+    response = post(app, pipeline, "/echo", b'{"n": 1}')
+
+    [(_, record)] = recorder.records
+    assert response.json() == {"size": 8}
+    assert record["body"] == {"n": 1}
+
+
+def test_body_over_the_cap_still_reaches_the_route(monkeypatch):
+    recorder = recording_logger(monkeypatch)
+    pipeline = LogPipeline()
+    app = logged_app(pipeline, max_body_bytes=16)
+
+    async def chunks():
+        for _ in range(10):
+            yield b"x" * 10
+
+    response = post(app, pipeline, "/echo", chunks())
+
+    [(_, record)] = recorder.records
+    assert response.json() == {"size": 100}
+    assert record["body"] == "[truncated body of 100 bytes]"
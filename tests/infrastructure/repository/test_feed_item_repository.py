@@ -0,0 +1,165 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateTable
+
+from src.domain.feed.entities.feed_item import FeedItem
+from src.domain.feed.services.item_fingerprint import content_hash
+from src.infrastructure.models.feed_item import FeedItemModel
+from src.infrastructure.repository.feed_item_repository import (
+    SqlFeedItemRepository,
+)
+from src.infrastructure.search.inverted_index import InvertedIndex
+
+PUBLISHED = datetime(2024, 1, 1)
+
+
+def item(guid=None, title="Title", link="", content="text"):
+    return FeedItem(title, content, link, PUBLISHED, guid=guid)
+
+
+def store(database, *batches, update_existing=False, batch_size=500):
+    """Write each batch in its own session; return counts and rows."""
+
+    async def scenario(session_factory):
+        written = []
+        for batch in batches:
+            async with session_factory() as session:
+                written.append(
+                    await SqlFeedItemRepository(
+                        session, batch_size=batch_size
+                    ).add_many(batch, update_existing=update_existing)
+                )
+        async with session_factory() as session:
+            rows = await session.scalars(
+                select(FeedItemModel).order_by(FeedItemModel.guid)
+            )
+            return written, {row.guid: row.title for row in rows}
+
+    return database.run(scenario)
+
+
+def test_conflicting_guids_are_skipped(database):
+    written, rows = store(
+        database,
+        [item("a", "First"), item("b", "Second")],
+        [item("a", "First (edited)"), item("c", "Third")],
+    )
+
+    assert written == [2, 1]
+    assert rows == {"a": "First", "b": "Second", "c": "Third"}
+
+
+def test_update_existing_overwrites_conflicting_rows(database):
+    written, rows = store(
+        database,
+        [item("a", "First")],
+        [item("a", "First (edited)")],
+        update_existing=True,
+    )
+
+    assert written == [1, 1]
+    assert rows == {"a": "First (edited)"}
+
+
+def test_duplicates_within_a_batch_keep_the_last_one(database):
+    written, rows = store(database, [item("a", "Old"), item("a", "New")])
+
+    assert written == [1]
+    assert rows == {"a": "New"}
+
+
+def test_items_without_guid_fall_back_to_link_then_content(database):
+    untitled = item(title="No link", content="body")
+    written, rows = store(
+        database,
+        [
+            item(link="https://example.com/a", title="Linked"),
+            untitled,
+            item(title="Other", content="body"),
+        ],
+        [item(title="No link", content="body")],
+    )
+
+    assert written == [3, 0]
+    assert rows["https://example.com/a"] == "Linked"
+    assert rows[content_hash(untitled)] == "No link"
+    assert "" not in rows and None not in rows
+
+
+def test_rows_are_written_across_several_statements(database):
+    written, rows = store(
+        database,
+        [item(f"guid-{number:02}") for number in range(25)],
+        batch_size=10,
+    )
+
+    assert written == [25]
+    assert len(rows) == 25
+
+
+def test_postgresql_columns_take_parsed_items():
+    ddl = str(
+        CreateTable(FeedItemModel.__table__).compile(
+            dialect=postgresql.dialect()
+        )
+    )
+
+    assert "published_date TIMESTAMP WITH TIME ZONE" in ddl
+    assert "created_at TIMESTAMP WITH TIME ZONE" in ddl
+    assert "feed_source_id VARCHAR(2048)" in ddl
+    assert "guid VARCHAR(2048)" in ddl
+
+
+def test_aware_dates_and_url_feed_ids_are_stored(database):
+    feed_url = "https://example.com/" + "feeds/" * 20 + "rss.xml"
+    parsed = FeedItem(
+        "Title",
+        "text",
+        "https://example.com/a",
+        datetime(2024, 1, 1, 12, tzinfo=timezone.utc),
+        feed_source_id=feed_url,
+        guid="a",
+    )
+
+    async def scenario(session_factory):
+        async with session_factory() as session:
+            await SqlFeedItemRepository(session).add_many([parsed])
+            return await session.scalar(select(FeedItemModel))
+
+    row = database.run(scenario)
+
+    assert row.feed_source_id == feed_url
+    assert row.published_date.replace(tzinfo=timezone.utc) == (
+        parsed.published_date
+    )
+
+
+def test_recent_items_restore_the_search_index(database):
+    fetched = [
+        FeedItem("Python old", "text", "", datetime(2023, 1, 1), guid="a"),
+        FeedItem("Python linked", "text", "https://example.com/b", PUBLISHED),
+        FeedItem("Python plain", "text", "", datetime(2024, 3, 1)),
+        FeedItem("Python new", "text", "", datetime(2024, 4, 1), guid="d"),
+    ]
+
+    async def scenario(session_factory):
+        async with session_factory() as session:
+            repository = SqlFeedItemRepository(session)
+            await repository.add_many(fetched)
+            return await repository.recent(3)
+
+    restored = database.run(scenario)
+
+    assert [row.title for row in restored] == [
+        "Python new",
+        "Python plain",
+        "Python linked",
+    ]
+    assert [row.guid for row in restored] == ["d", None, None]
+    index = InvertedIndex()
+    index.add_many(reversed(restored))
+    index.add_many(fetched[1:])
+    assert len(index) == 3
+    assert index.search("python").total_hits == 3
@@ -0,0 +1,96 @@
+from datetime import datetime
+
+from src.domain.feed.entities.feed_item import FeedItem
+from src.infrastructure.search.inverted_index import InvertedIndex
+
+PUBLISHED = datetime(2024, 1, 1)
+
+
+def item(title, content="", guid=None, link=None, feed_source_id=None):
+    return FeedItem(
+        title,
+        content,
+        link,
+        PUBLISHED,
+        guid=guid,
+        feed_source_id=feed_source_id,
+    )
+
+
+def titles(page):
+    return [hit.item.title for hit in page.hits]
+
+
+def test_refetched_item_replaces_the_indexed_one():
+    index = InvertedIndex()
+    index.add(item("Python release", guid="post-1"))
+    index.add(item("Python release notes", guid="post-1"))
+
+    assert len(index) == 1
+    assert titles(index.search("python")) == ["Python release notes"]
+    assert index.search("python").total_hits == 1
+
+
+def test_items_without_guid_are_keyed_by_normalized_link():
+    index = InvertedIndex()
+    index.add(item("Rust news", link="https://www.example.com/a/?utm_x=1"))
+    index.add(item("Rust news", link="https://example.com/a"))
+    index.add(item("Rust news", link="https://example.com/b"))
+
+    assert len(index) == 2
+
+
+def test_removed_item_leaves_no_postings():
+    index = InvertedIndex()
+    index.add(item("Python tips", guid="post-1"))
+    index.add(item("Rust tips", guid="post-2"))
+
+    index.remove(item("Python tips (edited)", guid="post-1"))
+    index.remove(item("never indexed", guid="post-3"))
+
+    assert len(index) == 1
+    assert index.search("python").hits == []
+    assert titles(index.search("tips")) == ["Rust tips"]
+    assert "python" not in index._postings
+
+
+def test_pages_follow_the_cursor_without_repeats():
+    index = InvertedIndex()
+    index.add_many(
+        item(f"Python {number}", guid=f"post-{number}") for number in range(5)
+    )
+
+    seen, cursor = [], None
+    while True:
+        page = index.search("python", limit=2, cursor=cursor)
+        seen.extend(titles(page))
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert sorted(seen) == [f"Python {number}" for number in range(5)]
+
+
+def test_search_can_be_restricted_to_feed_sources():
+    index = InvertedIndex()
+    index.add(item("Python tips", guid="a", feed_source_id="feed-a"))
+    index.add(item("Python news", guid="b", feed_source_id="feed-b"))
+
+    page = index.search("python", feed_source_ids={"feed-b"})
+
+    assert titles(page) == ["Python news"]
+
+
+def test_oldest_items_are_evicted_past_max_items():
+    index = InvertedIndex(max_items=2)
+    index.add(item("Python one", guid="post-1"))
+    index.add(item("Python two", guid="post-2"))
+    index.add(item("Python one again", guid="post-1"))
+    index.add(item("Python three", guid="post-3"))
+
+    assert len(index) == 2
+    assert sorted(titles(index.search("python"))) == [
+        "Python one again",
+        "Python three",
+    ]
+    assert "two" not in index._postings
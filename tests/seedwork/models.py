@@ -0,0 +1,62 @@
+import uuid
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.seedwork.infra.defaults.base import Base
+from src.seedwork.infra.schemas import GetInput, PydanticModel
+from src.seedwork.infra.schemas.base import (
+    GetGenericOutput,
+    ManyGenericInput,
+)
+
+
+class ArticleModel(Base):
+    __tablename__ = "test_article"
+
+    article_id: Mapped[int] = mapped_column(primary_key=True)
+    title: Mapped[str] = mapped_column(String(128))
+    views: Mapped[int] = mapped_column(default=0)
+
+
+class EventModel(Base):
+    __tablename__ = "test_event"
+
+    event_id: Mapped[uuid.UUID] = mapped_column(primary_key=True)
+    happened_at: Mapped[datetime] = mapped_column(index=True)
+
+
+class ArticleOutput(PydanticModel):
+    article_id: int
+    title: str
+    views: int
+
+
+class ArticleGetInput(GetInput):
+    title: Optional[str] = None
+
+
+class ArticleGetOutput(GetGenericOutput):
+    items: list[ArticleOutput]
+
+
+class ArticlePutInput(PydanticModel):
+    article_id: int
+    title: Optional[str] = None
+    views: Optional[int] = None
+
+
+class ArticlePutManyInput(ManyGenericInput):
+    title: Optional[str] = None
+    views: Optional[int] = None
+
+
+async def add_articles(session_factory, count: int) -> None:
+    async with session_factory() as session:
+        session.add_all(
+            ArticleModel(article_id=i, title=f"article {i}", views=i)
+            for i in range(1, count + 1)
+        )
+        await session.commit()
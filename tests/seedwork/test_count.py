@@ -0,0 +1,161 @@
+import asyncio
+
+from sqlalchemy import insert, select
+from sqlalchemy.dialects.postgresql import asyncpg
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.seedwork.infra.defaults.base import Base
+from src.seedwork.infra.utils.count import (
+    CountStrategy,
+    Explain,
+    QueryCounter,
+)
+from src.seedwork.infra.utils.pagination import Pagination
+from .models import ArticleModel, add_articles
+
+ALL = select(ArticleModel)
+
+
+def count_with(database, strategy, *queries, rows=5, ttl_seconds=60):
+    """Count each query, adding a row between counts."""
+
+    async def scenario(session_factory):
+        await add_articles(session_factory, rows)
+        totals = []
+        async with session_factory() as session:
+            for index, query in enumerate(queries):
+                if index:
+                    await session.execute(
+                        insert(ArticleModel).values(
+                            article_id=100 + index, title="new"
+                        )
+                    )
+                    await session.commit()
+                totals.append(
+                    await QueryCounter.count(
+                        session, query, strategy, ttl_seconds
+                    )
+                )
+        return totals
+
+    return database.run(scenario)
+
+
+def test_exact_counts_every_time(database):
+    assert count_with(database, CountStrategy.EXACT, ALL, ALL) == [5, 6]
+
+
+def test_exact_ignores_ordering_and_honours_filters(database):
+    query = (
+        select(ArticleModel)
+        .where(ArticleModel.views > 2)
+        .order_by(ArticleModel.views)
+    )
+
+    assert count_with(database, CountStrategy.EXACT, query) == [3]
+
+
+def test_estimated_counts_rows_outside_postgresql(database):
+    assert count_with(database, CountStrategy.ESTIMATED, ALL) == [5]
+
+
+def test_explain_binds_filter_values():
+    query = select(ArticleModel).where(ArticleModel.title == "re :b")
+
+    compiled = Explain(query).compile(dialect=asyncpg.dialect())
+
+    assert str(compiled).startswith("EXPLAIN (FORMAT JSON) SELECT")
+    assert "re :b" not in str(compiled)
+    assert list(compiled.params.values()) == ["re :b"]
+
+
+def test_failed_estimate_falls_back_on_the_same_session(database):
+    async def scenario(session_factory):
+        async with session_factory() as session:
+            session.add_all(
+                ArticleModel(article_id=i, title="re :b") for i in range(3)
+            )
+            await session.flush()
+            # Renders the PostgreSQL EXPLAIN, which SQLite rejects.
+            session.get_bind().dialect.name = "postgresql"
+            try:
+                return await QueryCounter.estimated(
+                    session,
+                    select(ArticleModel).where(ArticleModel.title == "re :b"),
+                )
+            finally:
+                session.get_bind().dialect.name = "sqlite"
+
+    assert database.run(scenario) == 3
+
+
+def test_none_skips_counting(database):
+    assert count_with(database, CountStrategy.NONE, ALL) == [None]
+
+
+def test_cached_reuses_the_count_within_the_ttl(database):
+    assert count_with(database, CountStrategy.CACHED, ALL, ALL) == [5, 5]
+
+
+def test_cached_recounts_after_the_ttl(database):
+    assert count_with(
+        database, CountStrategy.CACHED, ALL, ALL, ttl_seconds=0
+    ) == [5, 6]
+
+
+def test_cached_keys_on_filter_values_including_lists(database):
+    def views_in(values):
+        return select(ArticleModel).where(ArticleModel.views.in_(values))
+
+    assert count_with(
+        database,
+        CountStrategy.CACHED,
+        views_in([1, 2]),
+        views_in([1, 2, 3]),
+        views_in([1, 2]),
+    ) == [2, 3, 2]
+
+
+def test_cached_counts_are_kept_per_database(tmp_path):
+    async def count_in(name, rows):
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / name}")
+        try:
+            async with engine.begin() as connection:
+                await connection.run_sync(Base.metadata.create_all)
+            session_factory = async_sessionmaker(engine)
+            await add_articles(session_factory, rows)
+            async with session_factory() as session:
+                return await QueryCounter.count(
+                    session, ALL, CountStrategy.CACHED
+                )
+        finally:
+            await engine.dispose()
+
+    async def main():
+        return [await count_in("one.db", 2), await count_in("two.db", 7)]
+
+    assert asyncio.run(main()) == [2, 7]
+
+
+def test_pagination_without_count_reports_has_more(database):
+    async def scenario(session_factory):
+        await add_articles(session_factory, 5)
+        async with session_factory() as session:
+            return [
+                await Pagination.paginate_to_dict(
+                    session,
+                    ALL.order_by(ArticleModel.article_id),
+                    page,
+                    2,
+                    "/articles",
+                    CountStrategy.NONE,
+                )
+                for page in (1, 3)
+            ]
+
+    first, last = database.run(scenario)
+
+    assert first["total_items"] is None and first["total_pages"] is None
+    assert first["has_more"] and first["next_page"]
+    assert [item.article_id for item in last["items"]] == [5]
+    assert not last["has_more"] and last["next_page"] is None
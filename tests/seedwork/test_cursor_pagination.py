@@ -0,0 +1,133 @@
+import base64
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+
+from src.seedwork.infra.repository.base import GetManyRepository
+from src.seedwork.infra.utils.pagination import Pagination
+from .models import (
+    ArticleGetInput,
+    ArticleGetOutput,
+    ArticleModel,
+    EventModel,
+    add_articles,
+)
+
+START = datetime(2024, 1, 1, 12, 30)
+
+
+def raw_cursor(payload: str) -> str:
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+@pytest.mark.parametrize(
+    "value, column",
+    [
+        (42, ArticleModel.article_id),
+        ("article 9", ArticleModel.title),
+        (uuid.UUID(int=7), EventModel.event_id),
+        (START, EventModel.happened_at),
+    ],
+)
+def test_cursor_round_trips_through_the_column_type(value, column):
+    cursor = Pagination.encode_cursor(value)
+
+    assert "=" not in cursor
+    assert Pagination.decode_cursor(cursor, column) == value
+
+
+def test_cursor_without_column_keeps_the_json_value():
+    cursor = Pagination.encode_cursor(uuid.UUID(int=7))
+
+    assert Pagination.decode_cursor(cursor) == str(uuid.UUID(int=7))
+
+
+@pytest.mark.parametrize(
+    "cursor, column",
+    [
+        ("%%%", None),
+        (raw_cursor("not json"), None),
+        (raw_cursor('{"key": 1}'), None),
+        (raw_cursor("[1]"), None),
+        (raw_cursor('{"k": "abc"}'), ArticleModel.article_id),
+        (raw_cursor('{"k": [1]}'), ArticleModel.article_id),
+        (raw_cursor('{"k": null}'), ArticleModel.article_id),
+        (raw_cursor('{"k": true}'), ArticleModel.article_id),
+        (raw_cursor('{"k": "not-a-uuid"}'), EventModel.event_id),
+        (raw_cursor('{"k": "yesterday"}'), EventModel.happened_at),
+    ],
+)
+def test_tampered_cursor_is_rejected(cursor, column):
+    with pytest.raises(ValueError, match="Invalid pagination cursor"):
+        Pagination.decode_cursor(cursor, column)
+
+
+def test_unsupported_key_cannot_be_encoded():
+    with pytest.raises(TypeError):
+        Pagination.encode_cursor(object())
+
+
+def test_repository_pages_through_every_row_by_cursor(database):
+    async def scenario(session_factory):
+        await add_articles(session_factory, 25)
+        pages = []
+        cursor = None
+        async with session_factory() as session:
+            while True:
+                page = await GetManyRepository(
+                    ArticleModel,
+                    ArticleGetInput(page_size=10, cursor=cursor),
+                    ArticleGetOutput,
+                    session,
+                    cursor_pagination=True,
+                ).case()
+                pages.append(page)
+                cursor = page.links.next_cursor
+                if cursor is None:
+                    return pages
+
+    pages = database.run(scenario)
+
+    assert [len(page.items) for page in pages] == [10, 10, 5]
+    assert [item.article_id for page in pages for item in page.items] == list(
+        range(25, 0, -1)
+    )
+    assert [page.meta.has_more for page in pages] == [True, True, False]
+    assert pages[0].meta.total_items is None
+    assert "cursor=" in pages[0].links.next_page
+
+
+@pytest.mark.parametrize("key", ["event_id", "happened_at"])
+def test_cursor_pages_over_uuid_and_datetime_keys(database, key):
+    events = [
+        EventModel(
+            event_id=uuid.UUID(int=i), happened_at=START + timedelta(hours=i)
+        )
+        for i in range(1, 8)
+    ]
+    column = getattr(EventModel, key)
+
+    async def scenario(session_factory):
+        async with session_factory() as session:
+            session.add_all(events)
+            await session.commit()
+        seen = []
+        cursor = None
+        async with session_factory() as session:
+            while True:
+                page = await Pagination.paginate_by_cursor_to_dict(
+                    session,
+                    select(EventModel),
+                    column,
+                    cursor,
+                    3,
+                    "/events",
+                )
+                seen.extend(event.event_id.int for event in page["items"])
+                cursor = page["next_cursor"]
+                if cursor is None:
+                    return seen
+
+    assert database.run(scenario) == list(range(7, 0, -1))
@@ -0,0 +1,182 @@
+from datetime import datetime
+from typing import ClassVar, Dict, Optional
+
+import pytest
+from sqlalchemy import DateTime, String, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.seedwork.infra.defaults.base import Base
+from src.seedwork.infra.schemas import GetInput
+from src.seedwork.infra.utils.filter import Filtering
+from .models import ArticleModel
+
+
+class PostModel(Base):
+    __tablename__ = "test_post"
+
+    post_id: Mapped[int] = mapped_column(primary_key=True)
+    title: Mapped[str] = mapped_column(String(128))
+    published: Mapped[datetime] = mapped_column(DateTime)
+
+
+class PostInput(GetInput):
+    title: Optional[str] = None
+    views: Optional[int] = None
+    published_start: Optional[datetime] = None
+    published_end: Optional[datetime] = None
+
+
+def schema_with_mode(mode: str):
+    class ModeInput(GetInput):
+        title: Optional[str] = None
+        filter_match_modes: ClassVar[Dict[str, str]] = {"title": mode}
+
+    return ModeInput
+
+
+def compiled(query, dialect=None):
+    return str(
+        query.compile(dialect=dialect, compile_kwargs={"literal_binds": True})
+    )
+
+
+def where_of(input_schema, model=ArticleModel, dialect=None) -> str:
+    query = Filtering(select(model), input_schema).query
+    return compiled(query, dialect).split("WHERE ", 1)[1]
+
+
+@pytest.mark.parametrize(
+    "mode, expected",
+    [
+        ("exact", "test_article.title = 'a_b'"),
+        ("prefix", "test_article.title LIKE 'a\\_b%%' ESCAPE '\\'"),
+        ("contains", "test_article.title LIKE '%%a\\_b%%' ESCAPE '\\'"),
+        ("trigram", "test_article.title ILIKE '%%a\\_b%%' ESCAPE '\\'"),
+        ("full_text", "test_article.title @@ plainto_tsquery('a_b')"),
+    ],
+)
+def test_string_match_modes_compile_to_index_friendly_sql(mode, expected):
+    input_schema = schema_with_mode(mode)(title="a_b")
+
+    assert where_of(input_schema, dialect=postgresql.dialect()) == expected
+
+
+def test_like_wildcards_in_values_are_escaped():
+    input_schema = schema_with_mode("prefix")(title="50%_off")
+
+    assert where_of(input_schema) == (
+        "test_article.title LIKE '50\\%\\_off%' ESCAPE '\\'"
+    )
+
+
+def test_strings_default_to_contains():
+    assert where_of(PostInput(title="x"), PostModel) == (
+        "test_post.title LIKE '%x%' ESCAPE '\\'"
+    )
+
+
+def test_unknown_match_mode_is_rejected():
+    with pytest.raises(ValueError):
+        Filtering(select(ArticleModel), schema_with_mode("fuzzy")(title="x"))
+
+
+def test_date_suffixes_compile_to_a_range():
+    input_schema = PostInput(
+        published_start=datetime(2024, 1, 1),
+        published_end=datetime(2024, 1, 31),
+    )
+
+    assert where_of(input_schema, PostModel) == (
+        "test_post.published >= '2024-01-01 00:00:00' "
+        "AND test_post.published <= '2024-01-31 00:00:00'"
+    )
+
+
+class ReportModel(Base):
+    __tablename__ = "test_report"
+
+    report_id: Mapped[int] = mapped_column(primary_key=True)
+    period_end: Mapped[int] = mapped_column()
+    published: Mapped[datetime] = mapped_column(DateTime)
+
+
+class ReportInput(GetInput):
+    period_end: Optional[int] = None
+    published_end: Optional[datetime] = None
+
+
+def test_range_suffixes_only_apply_to_dates():
+    input_schema = ReportInput(
+        period_end=202401, published_end=datetime(2024, 1, 31)
+    )
+
+    assert where_of(input_schema, ReportModel) == (
+        "test_report.period_end = 202401 "
+        "AND test_report.published <= '2024-01-31 00:00:00'"
+    )
+    assert Filtering.field_column_name(ReportInput, "period_end") == (
+        "period_end"
+    )
+    assert Filtering.field_column_name(ReportInput, "published_end") == (
+        "published"
+    )
+
+
+def test_pagination_fields_and_unset_values_are_not_filters():
+    query = Filtering(
+        select(ArticleModel), PostInput(page=3, page_size=5, cursor="c")
+    ).query
+
+    assert "WHERE" not in compiled(query)
+
+
+def test_plan_is_reused_for_the_same_schema_shape():
+    Filtering._plans.clear()
+    first = Filtering(select(ArticleModel), PostInput(title="a", views=1))
+    second = Filtering(select(ArticleModel), PostInput(title="b", views=2))
+    Filtering(select(ArticleModel), PostInput(title="c"))
+
+    assert len(Filtering._plans) == 2
+    assert "'%b%'" in compiled(second.query)
+    assert "'%a%'" in compiled(first.query)
+
+
+def test_match_modes_select_the_expected_rows(database):
+    titles = ["Python tips", "python_news", "100% Python", "Rust tips"]
+
+    async def scenario(session_factory):
+        async with session_factory() as session:
+            session.add_all(
+                ArticleModel(article_id=index, title=title)
+                for index, title in enumerate(titles, 1)
+            )
+            await session.commit()
+            results = {}
+            for mode, value in [
+                ("exact", "Rust tips"),
+                ("prefix", "Rust"),
+                ("contains", "tips"),
+                ("trigram", "PYTHON"),
+                ("contains", "_"),
+                ("contains", "%"),
+            ]:
+                query = Filtering(
+                    select(ArticleModel.title).order_by(ArticleModel.title),
+                    schema_with_mode(mode)(title=value),
+                ).query
+                results[(mode, value)] = list(await session.scalars(query))
+            return results
+
+    results = database.run(scenario)
+
+    assert results[("exact", "Rust tips")] == ["Rust tips"]
+    assert results[("prefix", "Rust")] == ["Rust tips"]
+    assert results[("contains", "tips")] == ["Python tips", "Rust tips"]
+    assert results[("trigram", "PYTHON")] == [
+        "100% Python",
+        "Python tips",
+        "python_news",
+    ]
+    assert results[("contains", "_")] == ["python_news"]
+    assert results[("contains", "%")] == ["100% Python"]
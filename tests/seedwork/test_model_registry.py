@@ -0,0 +1,81 @@
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import Boolean, Date, DateTime
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.seedwork.infra.defaults.base import Base
+from src.seedwork.infra.repository.base import GetOneRepository
+from src.seedwork.infra.utils.metadata import ModelMetadata, ModelRegistry
+from src.seedwork.infra.utils.model import ModelUtils
+from .models import ArticleGetInput, ArticleModel, ArticleOutput
+
+
+class ScheduleModel(Base):
+    __tablename__ = "test_schedule"
+
+    code: Mapped[int] = mapped_column(primary_key=True)
+    active: Mapped[bool] = mapped_column(Boolean)
+    day: Mapped[date] = mapped_column(Date)
+    starts_at: Mapped[datetime] = mapped_column(DateTime)
+
+
+def test_metadata_is_built_once_per_model(monkeypatch):
+    ModelRegistry.clear()
+    built = []
+    from_model = ModelMetadata.from_model.__func__
+
+    def counting_from_model(cls, model):
+        built.append(model)
+        return from_model(cls, model)
+
+    monkeypatch.setattr(
+        ModelMetadata, "from_model", classmethod(counting_from_model)
+    )
+
+    first = ModelRegistry.get(ArticleModel)
+    utils = ModelUtils(ArticleModel)
+    repository = GetOneRepository(
+        ArticleModel, ArticleGetInput(), ArticleOutput, session=None
+    )
+    ModelRegistry.get(ScheduleModel)
+
+    assert built == [ArticleModel, ScheduleModel]
+    assert utils.metadata is first
+    assert repository.metadata is first
+
+
+def test_primary_key_comes_from_the_mapper():
+    metadata = ModelRegistry.get(ScheduleModel)
+
+    assert metadata.primary_key_name == "code"
+    assert metadata.primary_key_attr is ScheduleModel.code
+    assert metadata.columns == {"code", "active", "day", "starts_at"}
+
+
+def test_convert_model_attributes_uses_the_column_types():
+    converted = ModelUtils(ScheduleModel).convert_model_attributes(
+        {
+            "code": "7",
+            "active": "false",
+            "day": "2024-01-31",
+            "starts_at": "2024-01-31 08:30:00",
+        }
+    )
+
+    assert converted == {
+        "code": 7,
+        "active": False,
+        "day": date(2024, 1, 31),
+        "starts_at": datetime(2024, 1, 31, 8, 30),
+    }
+
+
+def test_convert_model_attributes_rejects_unknown_keys():
+    with pytest.raises(AttributeError, match="unknown"):
+        ModelUtils(ScheduleModel).convert_model_attributes({"unknown": "1"})
+
+
+def test_convert_model_attributes_reports_bad_values():
+    with pytest.raises(ValueError, match="code to int"):
+        ModelUtils(ScheduleModel).convert_model_attributes({"code": "x"})
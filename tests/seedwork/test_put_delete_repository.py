@@ -0,0 +1,121 @@
+import pytest
+
+from src.seedwork.infra.repository.base import (
+    DeleteManyRepository,
+    DeleteRepository,
+    PutManyRepository,
+    PutRepository,
+)
+from src.seedwork.infra.schemas.base import (
+    DeleteGenericOutput,
+    ManyGenericInput,
+)
+from .models import (
+    ArticleModel,
+    ArticleOutput,
+    ArticlePutInput,
+    ArticlePutManyInput,
+    add_articles,
+)
+
+
+def put(session, **values):
+    return PutRepository(
+        ArticleModel, ArticlePutInput(**values), ArticleOutput, session
+    ).case()
+
+
+def test_put_updates_and_returns_the_row(database):
+    async def scenario(session_factory):
+        await add_articles(session_factory, 3)
+        async with session_factory() as session:
+            return await put(session, article_id=2, title="changed")
+
+    assert database.run(scenario) == ArticleOutput(
+        article_id=2, title="changed", views=2
+    )
+
+
+def test_put_without_fields_returns_the_unchanged_row(database):
+    async def scenario(session_factory):
+        await add_articles(session_factory, 3)
+        async with session_factory() as session:
+            return await put(session, article_id=2)
+
+    assert database.run(scenario) == ArticleOutput(
+        article_id=2, title="article 2", views=2
+    )
+
+
+@pytest.mark.parametrize("values", [{"title": "x"}, {}])
+def test_put_of_a_missing_row_raises(database, values):
+    async def scenario(session_factory):
+        await add_articles(session_factory, 1)
+        async with session_factory() as session:
+            await put(session, article_id=9, **values)
+
+    with pytest.raises(ValueError, match="not found"):
+        database.run(scenario)
+
+
+def test_put_many_updates_only_the_given_ids(database):
+    async def scenario(session_factory):
+        await add_articles(session_factory, 3)
+        async with session_factory() as session:
+            rows = await PutManyRepository(
+                ArticleModel,
+                ArticlePutManyInput(ids=[1, 3], views=0),
+                ArticleOutput,
+                session,
+            ).case()
+            untouched = await session.get_one(ArticleModel, 2)
+            return rows, untouched.views
+
+    rows, untouched_views = database.run(scenario)
+
+    assert sorted(row.article_id for row in rows) == [1, 3]
+    assert all(row.views == 0 for row in rows)
+    assert untouched_views == 2
+
+
+def test_put_many_without_fields_returns_the_rows(database):
+    async def scenario(session_factory):
+        await add_articles(session_factory, 3)
+        async with session_factory() as session:
+            return await PutManyRepository(
+                ArticleModel,
+                ArticlePutManyInput(ids=[1, 2, 9]),
+                ArticleOutput,
+                session,
+            ).case()
+
+    rows = database.run(scenario)
+
+    assert sorted(row.article_id for row in rows) == [1, 2]
+
+
+def test_delete_and_delete_many(database):
+    async def scenario(session_factory):
+        await add_articles(session_factory, 4)
+        async with session_factory() as session:
+            deleted = await DeleteRepository(
+                ArticleModel,
+                ArticlePutInput(article_id=1),
+                DeleteGenericOutput,
+                session,
+            ).case()
+            deleted_many = await DeleteManyRepository(
+                ArticleModel,
+                ManyGenericInput(ids=[2, 3, 9]),
+                DeleteGenericOutput,
+                session,
+            ).case()
+            remaining = await session.scalars(ArticleModel.__table__.select())
+            return deleted, deleted_many, list(remaining)
+
+    deleted, deleted_many, remaining = database.run(scenario)
+
+    assert deleted.status == "deleted"
+    assert deleted.metadata["id"] == 1
+    assert sorted(deleted_many.metadata["ids"]) == [2, 3]
+    assert remaining == [4]